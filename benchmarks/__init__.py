@@ -0,0 +1,8 @@
+"""파서, 중복 제거, 포맷터 성능 측정
+
+실행 예시:
+  python -m benchmarks run -o bench.json               # 측정 후 JSON 저장
+  python -m benchmarks run --cassette data/run.json.gz  # 녹화된 실제 응답으로 파서 측정
+  python -m benchmarks compare baseline.json bench.json # 기준 대비 성능 저하 확인
+  python -m benchmarks telegram --per-chat-limit 1      # 텔레그램 전송 처리량/백오프 측정
+"""
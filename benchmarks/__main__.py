@@ -0,0 +1,134 @@
+"""벤치마크 CLI"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+
+from . import runner
+from .cases import all_benchmarks
+
+
+def _run(args: argparse.Namespace) -> int:
+    benchmarks = all_benchmarks(args.cassette)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.name]
+        if not benchmarks:
+            print(f"'{args.filter}'에 해당하는 벤치마크가 없습니다.", file=sys.stderr)
+            return 1
+
+    payload = runner.run(
+        benchmarks,
+        rounds=args.rounds,
+        min_time=args.min_time,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+
+    if args.output:
+        runner.save(payload, args.output)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        baseline = runner.load(args.baseline)
+        current = runner.load(args.current)
+    except (OSError, ValueError) as e:
+        print(f"결과 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+
+    rows = runner.compare(baseline, current, threshold=args.threshold)
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        for row in rows:
+            base = runner.format_time(row["baseline"]) if row["baseline"] is not None else "-"
+            change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+            print(
+                f"{row['name']:<32} {base:>10} -> {runner.format_time(row['current']):>10} "
+                f"{change:>8}  {row['status']}"
+            )
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(
+            f"성능 저하 {len(regressions)}건 (기준 +{args.threshold:.0%} 초과): {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def _telegram(args: argparse.Namespace) -> int:
+    # 대역 서버(aiohttp)와 텔레그램 라이브러리는 이 명령에서만 필요
+    from src.telegram.stub import StubBehavior
+    from .telegram import broadcast
+
+    behavior = StubBehavior(
+        latency=args.latency,
+        per_chat_limit=args.per_chat_limit,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        seed=0,
+    )
+    result = asyncio.run(broadcast(
+        behavior,
+        messages=args.messages,
+        chats=args.chats,
+        concurrency=args.concurrency,
+    ))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0 if result["delivered"] == result["messages"] else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Logos News 성능 측정",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("-o", "--output", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+    run_parser.add_argument("--cassette", help="파서 입력으로 사용할 녹화 파일 (--record로 생성)")
+    run_parser.add_argument("-k", "--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    run_parser.add_argument("--rounds", type=int, default=7, help="측정 라운드 수")
+    run_parser.add_argument("--min-time", type=float, default=0.1, help="라운드 최소 시간 (초)")
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = subparsers.add_parser("compare", help="기준 결과와 비교")
+    compare_parser.add_argument("baseline", help="기준 결과 JSON")
+    compare_parser.add_argument("current", help="비교할 결과 JSON")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="성능 저하로 판단할 중앙값 증가율 (기본 0.1 = 10%%)"
+    )
+    compare_parser.add_argument("--json", action="store_true", help="비교 결과를 JSON으로 출력")
+    compare_parser.set_defaults(handler=_compare)
+
+    telegram_parser = subparsers.add_parser("telegram", help="로컬 대역 서버로 텔레그램 전송 처리량 측정")
+    telegram_parser.add_argument("--messages", type=int, default=100, help="전송할 메시지 수")
+    telegram_parser.add_argument("--chats", type=int, default=10, help="대상 채팅 수")
+    telegram_parser.add_argument("--concurrency", type=int, default=10, help="동시 전송 수")
+    telegram_parser.add_argument("--latency", type=float, default=0.02, help="대역 서버 응답 지연 (초)")
+    telegram_parser.add_argument("--per-chat-limit", type=int, default=0, help="채팅별 초당 전송 허용 수")
+    telegram_parser.add_argument("--throttle-rate", type=float, default=0.0, help="무작위 429 응답 비율")
+    telegram_parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 retry_after (초)")
+    telegram_parser.add_argument("--error-rate", type=float, default=0.0, help="무작위 오류 응답 비율")
+    telegram_parser.set_defaults(handler=_telegram)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""측정 대상 정의"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from src.config import CategoryConfig, NewsConfig, SourceConfig
+from src.news.collector import NewsCollector, NewsItem
+from src.news.formatter import NewsFormatter
+from src.news.sources import BaseNewsSource, GoogleNewsSource, NaverNewsSource
+
+from . import fixtures
+from .runner import Benchmark
+
+
+class StaticSource(BaseNewsSource):
+    """미리 만든 아이템을 돌려주는 소스 (네트워크 없음)"""
+
+    def __init__(self, name: str, items: list[NewsItem]):
+        super().__init__()
+        self.name = name
+        self.items = items
+
+    async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
+        return self.items[:max_items]
+
+
+def naver_parse_article(html: Optional[str] = None) -> Benchmark:
+    """NaverNewsSource._parse_article: 목록 페이지 한 장의 모든 기사"""
+    def setup():
+        source = NaverNewsSource(parser="auto")
+        soup = BeautifulSoup(
+            source._extract_region(html or fixtures.naver_list_page(20)),
+            source.parser,
+            parse_only=source.LIST_STRAINER,
+        )
+        articles = soup.select(source.LIST_SELECTOR)
+        if not articles:
+            raise ValueError("목록 페이지에서 기사를 찾을 수 없습니다")
+
+        def run():
+            for article in articles:
+                source._parse_article(article, "economy")
+        return run
+
+    return Benchmark(
+        "naver.parse_article",
+        setup,
+        "녹화된 목록 페이지" if html else "목록 페이지 20개 기사",
+    )
+
+
+def google_parse_entry(rss: Optional[str] = None) -> Benchmark:
+    """GoogleNewsSource._parse_entry: RSS 피드의 모든 엔트리"""
+    def setup():
+        source = GoogleNewsSource()
+        entries = feedparser.parse(rss or fixtures.google_rss(100)).entries
+        if not entries:
+            raise ValueError("피드에서 엔트리를 찾을 수 없습니다")
+
+        def run():
+            for entry in entries:
+                source._parse_entry(entry, "economy")
+        return run
+
+    return Benchmark(
+        "google.parse_entry",
+        setup,
+        "녹화된 RSS 피드" if rss else "RSS 100개 엔트리",
+    )
+
+
+def collect_all(count: int = 10_000) -> Benchmark:
+    """NewsCollector.collect_all: 두 소스 합계 count개의 정렬 + 유사 기사 제거"""
+    def setup():
+        half = count // 2
+        config = NewsConfig(
+            categories={"economy": CategoryConfig(enabled=True, max_items=count)},
+            sources={
+                "naver": SourceConfig(priority=1),
+                "google": SourceConfig(priority=2),
+            },
+        )
+        collector = NewsCollector(config)
+        collector.register_source(StaticSource("naver", fixtures.news_items(half, source="naver")))
+        collector.register_source(StaticSource("google", fixtures.news_items(half, source="google")))
+
+        def run():
+            asyncio.run(collector.collect_all())
+        return run
+
+    return Benchmark(f"collector.collect_all.{count // 1000}k", setup, f"아이템 {count}개 정렬 + 중복 제거")
+
+
+def formatter(format_type: str) -> Benchmark:
+    """NewsFormatter.format: 6개 카테고리 x 5개 아이템"""
+    def setup():
+        news = fixtures.news_by_category(5)
+        instance = NewsFormatter(format_type=format_type)
+
+        def run():
+            instance.format(news, source_name="naver")
+        return run
+
+    return Benchmark(f"formatter.format.{format_type}", setup, "6개 카테고리 x 5개 아이템")
+
+
+def all_benchmarks(cassette: Optional[str] = None) -> list[Benchmark]:
+    """전체 벤치마크 목록
+
+    Args:
+        cassette: 녹화 파일 경로 (있으면 파서 벤치마크에 실제 응답 사용)
+    """
+    bodies = fixtures.load_cassette_bodies(cassette) if cassette else {}
+    return [
+        naver_parse_article(bodies.get("naver")),
+        google_parse_entry(bodies.get("google")),
+        collect_all(10_000),
+        *(formatter(format_type) for format_type in ("plain", "markdown", "html")),
+    ]
@@ -0,0 +1,162 @@
+"""벤치마크 입력 데이터
+
+기본은 실제 페이지 구조를 흉내 낸 합성 데이터를 사용하고,
+--cassette로 녹화 파일(python -m src.main --record)을 주면 그 안의
+실제 네이버 목록 페이지와 구글 RSS 응답을 사용한다.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import random
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from src.news.collector import NewsItem
+
+
+CATEGORIES = ("society", "economy", "politics", "world", "culture", "tech")
+OUTLETS = ("연합뉴스", "한겨레", "조선일보", "중앙일보", "경향신문", "매일경제", "한국경제", "KBS")
+
+BASE_TIME = datetime(2024, 5, 6, 9, 0, tzinfo=timezone.utc)
+
+
+def naver_list_page(count: int = 20) -> str:
+    """네이버 뉴스 목록 페이지 (사진/제목/요약/언론사를 갖춘 기사 count개)"""
+    def article(i: int) -> str:
+        link = f"https://n.news.naver.com/mnews/article/001/{i:010d}?sid=101"
+        outlet = OUTLETS[i % len(OUTLETS)]
+        return (
+            f'<li><dl><dt class="photo"><a href="{link}" class="nclicks(cnt_flashart)">'
+            f'<img src="https://imgnews.pstatic.net/image/{i}.jpg" width="106" height="72" alt=""></a></dt>'
+            f'<dt><a href="{link}" class="nclicks(cnt_flashart)">'
+            f"[속보] 경제 지표 발표에 따른 시장 반응 분석 기사 {i}</a></dt>"
+            f'<dd><span class="lede">주요 경제 지표가 발표되면서 금융 시장이 민감하게 반응했다. '
+            f"전문가들은 향후 금리 경로에 주목하고 있다 {i}…</span>"
+            f'<span class="writing">{outlet}</span><span class="date is_new">{i}분전</span></dd>'
+            f"</dl></li>"
+        )
+
+    half = count // 2
+    return (
+        '<html lang="ko"><head><meta charset="utf-8"><title>뉴스 목록</title>'
+        '<link rel="stylesheet" href="/css/news.css"></head><body>'
+        '<div id="header"><ul class="gnb">'
+        + "".join(f'<li><a href="/section/{i}">메뉴 {i}</a></li>' for i in range(20))
+        + '</ul></div><div id="main_content"><div class="list_body newsflash_body">'
+        '<ul class="type06_headline">' + "".join(article(i) for i in range(half)) + "</ul>"
+        '<ul class="type06">' + "".join(article(i) for i in range(half, count)) + "</ul>"
+        '</div><div class="paging">'
+        + "".join(f'<a href="?page={i}">{i}</a>' for i in range(1, 11))
+        + '</div></div><div id="footer"><ul>'
+        + "".join(f"<li>푸터 {i}</li>" for i in range(10))
+        + "</ul></div></body></html>"
+    )
+
+
+def google_rss(count: int = 100) -> str:
+    """구글 뉴스 RSS (항목 count개)"""
+    def entry(i: int) -> str:
+        outlet = OUTLETS[i % len(OUTLETS)]
+        published = (BASE_TIME - timedelta(minutes=7 * i)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        return (
+            f"<item><title>반도체 수출 회복세 이어져 {i} - {outlet}</title>"
+            f"<link>https://news.google.com/rss/articles/CBMi{i:08d}?oc=5</link>"
+            f'<guid isPermaLink="false">CBMi{i:08d}</guid>'
+            f"<pubDate>{published}</pubDate>"
+            f'<description>&lt;a href="https://news.google.com/rss/articles/CBMi{i:08d}?oc=5" '
+            f'target="_blank"&gt;반도체 수출 회복세 이어져 {i}&lt;/a&gt;&amp;nbsp;&amp;nbsp;'
+            f'&lt;font color="#6f6f6f"&gt;{outlet}&lt;/font&gt;</description>'
+            f'<source url="https://example.com/{i % len(OUTLETS)}">{outlet}</source></item>'
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss xmlns:media="http://search.yahoo.com/mrss/" version="2.0"><channel>'
+        "<generator>NFE/5.0</generator><title>경제 - Google 뉴스</title>"
+        "<link>https://news.google.com/?hl=ko</link><language>ko</language>"
+        + "".join(entry(i) for i in range(count))
+        + "</channel></rss>"
+    )
+
+
+# 제목/요약 생성용 어휘 (기사마다 다른 조합)
+WORDS = (
+    "정부", "국회", "금리", "환율", "수출", "반도체", "부동산", "증시", "물가", "고용",
+    "기업", "투자", "규제", "예산", "선거", "외교", "안보", "기후", "에너지", "교육",
+    "의료", "복지", "노동", "협상", "발표", "전망", "논란", "회복", "하락", "상승",
+    "개혁", "지원", "조사", "합의", "경고", "확대", "축소", "검토", "추진", "연기",
+)
+
+
+def news_items(count: int, category: str = "economy", source: str = "naver", duplicate_every: int = 4) -> list[NewsItem]:
+    """뉴스 아이템 count개 (duplicate_every개마다 앞 기사와 거의 같은 제목)"""
+    rng = random.Random(f"{category}:{source}")
+    items = []
+    title = summary = ""
+    for i in range(count):
+        outlet = OUTLETS[i % len(OUTLETS)]
+        if duplicate_every and i % duplicate_every == 0 and i:
+            # 앞 기사를 다른 언론사가 조금 바꿔 보도
+            title = f"[{outlet}] {title}"
+        else:
+            title = " ".join(rng.sample(WORDS, 6)) + f" {i}"
+            summary = " ".join(rng.sample(WORDS, 12)) + "."
+        items.append(NewsItem(
+            title=title,
+            link=f"https://{source}.example.com/{category}/{i}",
+            category=category,
+            source=f"{source}:{outlet}",
+            summary=summary,
+            published_at=BASE_TIME - timedelta(seconds=37 * i),
+        ))
+    return items
+
+
+def news_by_category(per_category: int = 5) -> dict[str, list[NewsItem]]:
+    """포맷터 입력 (카테고리별 아이템)"""
+    return {
+        category: news_items(per_category, category=category, duplicate_every=0)
+        for category in CATEGORIES
+    }
+
+
+def _decode_body(exchange: dict) -> bytes:
+    body = base64.b64decode(exchange["body"])
+    encodings = {
+        value.lower()
+        for name, value in exchange["headers"]
+        if name.lower() == "content-encoding"
+    }
+    if "gzip" in encodings:
+        body = gzip.decompress(body)
+    elif "deflate" in encodings:
+        body = zlib.decompress(body)
+    return body
+
+
+def load_cassette_bodies(path: str) -> dict[str, Optional[str]]:
+    """카세트에서 첫 번째 네이버 목록 페이지와 구글 RSS 본문 추출
+
+    Args:
+        path: 녹화한 카세트 파일 경로
+
+    Returns:
+        {"naver": HTML 또는 None, "google": RSS 또는 None}
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        exchanges = json.load(f)["exchanges"]
+
+    bodies: dict[str, Optional[str]] = {"naver": None, "google": None}
+    for exchange in exchanges:
+        if exchange["status"] != 200:
+            continue
+        url = exchange["url"]
+        if bodies["naver"] is None and "news.naver.com/main/list" in url:
+            bodies["naver"] = _decode_body(exchange).decode("utf-8", errors="replace")
+        elif bodies["google"] is None and "news.google.com/rss" in url:
+            bodies["google"] = _decode_body(exchange).decode("utf-8", errors="replace")
+    return bodies
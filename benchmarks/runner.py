@@ -0,0 +1,176 @@
+"""벤치마크 실행, 결과 JSON, 기준 결과와 비교"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+
+# 결과 JSON 형식 버전
+RESULT_VERSION = 1
+
+
+@dataclass
+class Benchmark:
+    """측정 대상 하나
+
+    setup()은 측정 전에 한 번 호출되어 입력을 준비하고,
+    반환한 함수(인자 없음)의 호출 시간을 측정한다.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    description: str = ""
+
+
+def measure(
+    func: Callable[[], object],
+    rounds: int = 7,
+    min_time: float = 0.1
+) -> dict:
+    """호출 1회당 시간 측정
+
+    한 라운드가 min_time 이상 걸리도록 반복 횟수(loops)를 정한 뒤
+    rounds번 측정하여 라운드별 1회 평균의 통계를 낸다.
+
+    Args:
+        func: 측정할 함수
+        rounds: 측정 라운드 수
+        min_time: 라운드 최소 시간 (초)
+
+    Returns:
+        min / median / mean / stdev (초), rounds, loops
+    """
+    func()  # 준비 호출 (지연 초기화/캐시 영향 제외)
+
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": len(samples),
+        "loops": loops,
+    }
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    rounds: int = 7,
+    min_time: float = 0.1,
+    log: Optional[Callable[[str], None]] = None
+) -> dict:
+    """벤치마크 실행
+
+    Returns:
+        결과 JSON 객체 (환경 정보 + 벤치마크별 측정값)
+    """
+    results = {}
+    for benchmark in benchmarks:
+        stats = measure(benchmark.setup(), rounds=rounds, min_time=min_time)
+        stats["description"] = benchmark.description
+        results[benchmark.name] = stats
+        if log is not None:
+            log(f"{benchmark.name:<32} {format_time(stats['median']):>10} (x{stats['loops']})")
+
+    return {
+        "version": RESULT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def format_time(seconds: float) -> str:
+    """사람이 읽기 쉬운 시간 단위"""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def load(path: str) -> dict:
+    """결과 JSON 로드
+
+    Raises:
+        ValueError: 지원하지 않는 결과 형식인 경우
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    version = payload.get("version") if isinstance(payload, dict) else None
+    if version != RESULT_VERSION:
+        raise ValueError(f"지원하지 않는 벤치마크 결과 형식 (버전: {version})")
+    return payload
+
+
+def save(payload: dict, path: str) -> None:
+    """결과 JSON 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> list[dict]:
+    """기준 결과 대비 변화
+
+    양쪽 모두 있는 벤치마크의 중앙값을 비교하여, 증가율이 threshold를
+    넘으면 regression, -threshold 미만이면 improvement로 표시한다.
+
+    Args:
+        baseline: 기준 결과
+        current: 비교할 결과
+        threshold: 허용 변화율 (0.1 = 10%)
+
+    Returns:
+        벤치마크별 {name, baseline, current, change, status}
+    """
+    rows = []
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append({
+                "name": name,
+                "baseline": None,
+                "current": stats["median"],
+                "change": None,
+                "status": "new",
+            })
+            continue
+
+        change = stats["median"] / base["median"] - 1 if base["median"] > 0 else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name,
+            "baseline": base["median"],
+            "current": stats["median"],
+            "change": change,
+            "status": status,
+        })
+    return rows
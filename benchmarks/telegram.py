@@ -0,0 +1,62 @@
+"""텔레그램 전송 처리량 측정 (로컬 대역 서버 사용)"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from src.config import TelegramConfig
+from src.telegram import TelegramSender
+from src.telegram.stub import StubBehavior, TelegramStubServer
+
+
+async def broadcast(
+    behavior: StubBehavior,
+    messages: int = 100,
+    chats: int = 10,
+    concurrency: int = 10,
+    max_retries: int = 3
+) -> dict:
+    """대역 서버에 messages개를 chats개 채팅으로 나눠 동시 전송
+
+    Args:
+        behavior: 대역 서버 지연/제한/오류 설정
+        messages: 전송할 메시지 수
+        chats: 대상 채팅 수 (채팅별 속도 제한 분산)
+        concurrency: 동시 전송 수
+        max_retries: 메시지당 최대 시도 횟수
+
+    Returns:
+        처리량, 지연, 429/오류 횟수
+    """
+    async with TelegramStubServer(behavior) as server:
+        sender = TelegramSender(TelegramConfig(bot_token="0:benchmark", base_url=server.base_url))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        latencies: list[float] = []
+
+        async def send(i: int) -> bool:
+            async with semaphore:
+                start = time.perf_counter()
+                ok = await sender.send_with_retry(
+                    f"벤치마크 메시지 {i}",
+                    max_retries=max_retries,
+                    chat_id=str(1000 + i % max(1, chats)),
+                )
+                latencies.append(time.perf_counter() - start)
+                return ok
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(send(i) for i in range(messages)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "messages": messages,
+        "delivered": sum(results),
+        "elapsed": elapsed,
+        "throughput": messages / elapsed if elapsed > 0 else 0.0,
+        "latency_median": latencies[len(latencies) // 2] if latencies else 0.0,
+        "latency_p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0,
+        "throttled": server.stats.throttled,
+        "errors": server.stats.errors,
+    }
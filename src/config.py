@@ -27,6 +27,7 @@ class ScheduleConfig:
 class TelegramConfig:
     bot_token: str = ""
     chat_id: str = ""
+    base_url: str = ""  # Bot API 서버 주소 (비어있으면 https://api.telegram.org)
 
 
 @dataclass
@@ -34,18 +35,104 @@ class CategoryConfig:
     enabled: bool = True
     max_items: int = 5
     keywords: list[str] = field(default_factory=list)
+    include: list[str] = field(default_factory=list)  # 하나 이상 포함된 기사만 (비어있으면 전체)
+    exclude: list[str] = field(default_factory=list)  # 하나라도 포함되면 제외
 
 
 @dataclass
 class SourceConfig:
     enabled: bool = True
     priority: int = 1
+    max_concurrency: int = 4  # 소스별 동시 요청 수 제한
+    timeout: float = 10.0     # 요청 타임아웃 (초)
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0  # keep-alive 연결 유지 시간 (초)
+    http2: bool = False       # HTTP/2 사용 (h2 패키지 필요)
+    parser: str = "auto"      # HTML 파서 백엔드 (auto, lxml, html.parser)
+    max_pages: int = 3        # 카테고리당 최대 목록 페이지 수 (네이버)
+    rate_limit: float = 0.0   # 초당 최대 요청 수 (0이면 제한 없음)
+    hedge_budget: int = 0     # 실행당 최대 중복(hedged) 요청 수 (0이면 사용 안 함)
+    max_bytes: int = 2 * 1024 * 1024  # 응답 본문 최대 바이트 수 (초과분은 잘라냄)
+    resolve_links: bool = False   # 리다이렉트 링크를 실제 기사 URL로 변환 (구글)
+    resolve_concurrency: int = 8  # 링크 변환 동시 요청 수
+
+
+@dataclass
+class HttpCacheConfig:
+    enabled: bool = True
+    path: str = "data/http_cache.json"
+    ttl_hours: float = 24.0   # 검증자(ETag/Last-Modified) 유지 시간
+    max_entries: int = 500    # 초과 시 오래 사용하지 않은 항목부터 제거
+
+
+@dataclass
+class UrlCacheConfig:
+    enabled: bool = True
+    path: str = "data/url_cache.json"
+    ttl_hours: float = 168.0  # 변환된 링크 유지 시간 (7일)
+    max_entries: int = 5000
+
+
+@dataclass
+class HistoryConfig:
+    enabled: bool = True
+    path: str = "data/history.db"
+    retention_days: float = 7.0  # 전송 이력 보관 기간 (일)
+
+
+@dataclass
+class DedupConfig:
+    enabled: bool = True
+    max_distance: int = 3     # 같은 기사로 판단할 SimHash 해밍 거리
+    shingle_size: int = 3     # 문자 n-gram 크기
+
+
+@dataclass
+class HealthConfig:
+    enabled: bool = True
+    path: str = "data/source_health.json"  # 실행 간 상태 보존 파일
+    failure_threshold: int = 3      # 서킷을 여는 연속 실패 횟수
+    cooldown_seconds: float = 1800.0  # open 상태 유지 시간 (이후 프로브 요청)
+    window: int = 50                # 응답 시간 표본 수
+    min_samples: int = 5            # 적응형 타임아웃 적용 최소 표본 수
+    percentile: float = 0.95        # 타임아웃 기준 분위수
+    timeout_multiplier: float = 3.0
+    min_timeout: float = 2.0        # 적응형 타임아웃 하한 (초)
+
+
+@dataclass
+class RankingConfig:
+    enabled: bool = True
+    half_life_hours: float = 12.0     # 최신성 점수가 절반이 되는 시간
+    recency_weight: float = 1.0
+    corroboration_weight: float = 1.0  # 여러 소스가 함께 보도한 기사
+    keyword_weight: float = 0.5        # CategoryConfig.keywords 일치 비율
+    priority_weight: float = 0.3       # 1 / SourceConfig.priority
+
+
+@dataclass
+class ArchiveConfig:
+    enabled: bool = True
+    path: str = "data/archive"             # 세그먼트와 인덱스를 두는 디렉터리
+    segment_bytes: int = 8 * 1024 * 1024   # 세그먼트 파일 최대 크기 (넘으면 새 파일)
 
 
 @dataclass
 class NewsConfig:
     categories: dict[str, CategoryConfig] = field(default_factory=dict)
     sources: dict[str, SourceConfig] = field(default_factory=dict)
+    http_cache: HttpCacheConfig = field(default_factory=HttpCacheConfig)
+    url_cache: UrlCacheConfig = field(default_factory=UrlCacheConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    dedup: DedupConfig = field(default_factory=DedupConfig)
+    health: HealthConfig = field(default_factory=HealthConfig)
+    ranking: RankingConfig = field(default_factory=RankingConfig)
+    archive: ArchiveConfig = field(default_factory=ArchiveConfig)
+    early_stop: bool = False  # 카테고리 목표를 채우면 느린 소스를 기다리지 않음
+    # 소스 통합 정렬 키 순서 (priority: SourceConfig.priority, recency: 최신순,
+    # corroboration: 같은 기사를 수집한 소스 수)
+    rank_by: list[str] = field(default_factory=lambda: ["priority", "recency", "corroboration"])
 
 
 @dataclass
@@ -63,6 +150,14 @@ class LoggingConfig:
     backup_count: int = 5
 
 
+@dataclass
+class MetricsConfig:
+    enabled: bool = False     # 스케줄러 모드에서 Prometheus 지표 엔드포인트 노출
+    host: str = "127.0.0.1"
+    port: int = 9108
+    path: str = "/metrics"
+
+
 @dataclass
 class Config:
     schedule: ScheduleConfig = field(default_factory=ScheduleConfig)
@@ -70,6 +165,7 @@ class Config:
     news: NewsConfig = field(default_factory=NewsConfig)
     message: MessageConfig = field(default_factory=MessageConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
 
 
 def _resolve_env_vars(value: str) -> str:
@@ -163,7 +259,47 @@ def load_config(config_path: Optional[str] = None) -> Config:
                 if isinstance(src_data, dict):
                     sources[name] = SourceConfig(**src_data)
 
-        config.news = NewsConfig(categories=categories, sources=sources)
+        http_cache = HttpCacheConfig()
+        if isinstance(news_data.get('http_cache'), dict):
+            http_cache = HttpCacheConfig(**news_data['http_cache'])
+
+        url_cache = UrlCacheConfig()
+        if isinstance(news_data.get('url_cache'), dict):
+            url_cache = UrlCacheConfig(**news_data['url_cache'])
+
+        history = HistoryConfig()
+        if isinstance(news_data.get('history'), dict):
+            history = HistoryConfig(**news_data['history'])
+
+        dedup = DedupConfig()
+        if isinstance(news_data.get('dedup'), dict):
+            dedup = DedupConfig(**news_data['dedup'])
+
+        health = HealthConfig()
+        if isinstance(news_data.get('health'), dict):
+            health = HealthConfig(**news_data['health'])
+
+        ranking = RankingConfig()
+        if isinstance(news_data.get('ranking'), dict):
+            ranking = RankingConfig(**news_data['ranking'])
+
+        archive = ArchiveConfig()
+        if isinstance(news_data.get('archive'), dict):
+            archive = ArchiveConfig(**news_data['archive'])
+
+        config.news = NewsConfig(
+            categories=categories,
+            sources=sources,
+            http_cache=http_cache,
+            url_cache=url_cache,
+            history=history,
+            dedup=dedup,
+            health=health,
+            ranking=ranking,
+            archive=archive,
+            early_stop=bool(news_data.get('early_stop', False)),
+            rank_by=list(news_data.get('rank_by') or NewsConfig().rank_by)
+        )
 
     # Message
     if 'message' in processed_config:
@@ -173,6 +309,10 @@ def load_config(config_path: Optional[str] = None) -> Config:
     if 'logging' in processed_config:
         config.logging = LoggingConfig(**processed_config['logging'])
 
+    # Metrics
+    if 'metrics' in processed_config:
+        config.metrics = MetricsConfig(**processed_config['metrics'])
+
     return config
 
 
@@ -201,4 +341,13 @@ def validate_config(config: Config) -> list[str]:
     if not config.news.categories:
         errors.append("활성화된 뉴스 카테고리가 없습니다.")
 
+    # 정렬 키 검사
+    rank_keys = {"priority", "recency", "corroboration"}
+    unknown = [name for name in config.news.rank_by if name not in rank_keys]
+    if unknown:
+        errors.append(
+            f"알 수 없는 rank_by 항목: {', '.join(unknown)} "
+            f"(사용 가능: {', '.join(sorted(rank_keys))})"
+        )
+
     return errors
@@ -8,8 +8,23 @@ from typing import Optional
 
 from .config import load_config, validate_config, Config
 from .logger import setup_logging
+from .metrics import NEXT_RUN, MetricsServer
+from .profiling import Profiler, stage
 from .telegram import TelegramSender
-from .news import NewsCollector, NewsFormatter, NaverNewsSource, GoogleNewsSource
+from .news import (
+    Cassette,
+    NewsCollector,
+    NewsArchive,
+    NewsFormatter,
+    NewsRanker,
+    NaverNewsSource,
+    GoogleNewsSource,
+    HttpClientPool,
+    HttpValidatorCache,
+    SeenStore,
+    SourceHealthRegistry,
+    UrlResolutionCache,
+)
 from .scheduler import NewsScheduler
 from .notifier import ErrorNotifier
 
@@ -20,7 +35,10 @@ logger = logging.getLogger(__name__)
 async def run_news_briefing(
     config: Optional[Config] = None,
     config_path: Optional[str] = None,
-    notifier: Optional[ErrorNotifier] = None
+    notifier: Optional[ErrorNotifier] = None,
+    http_pool: Optional[HttpClientPool] = None,
+    health: Optional[SourceHealthRegistry] = None,
+    cassette: Optional[Cassette] = None
 ) -> bool:
     """뉴스 브리핑 실행
 
@@ -28,6 +46,11 @@ async def run_news_briefing(
         config: 설정 객체 (None이면 로드)
         config_path: 설정 파일 경로
         notifier: 에러 알림 객체
+        http_pool: 공유 HTTP 클라이언트 풀 (None이면 이번 실행 동안만 생성)
+        health: 소스 상태 추적기 (None이면 상태 파일에서 로드)
+        cassette: 소스 요청을 기록/재생할 카세트 (http_pool을 직접 만들 때만 적용,
+            사용 시 HTTP/링크 캐시, 전송 이력, 보관소, 저장된 소스 상태는 사용하지 않음.
+            텔레그램 전송은 그대로 하므로 telegram.base_url을 대역 서버로 지정)
 
     Returns:
         실행 성공 여부
@@ -41,7 +64,49 @@ async def run_news_briefing(
     logger.info("Logos News 뉴스 브리핑 시작")
     logger.info("=" * 50)
 
+    owns_pool = http_pool is None
+    if owns_pool:
+        http_pool = HttpClientPool(config.news.sources, cassette=cassette)
+
+    # 카세트 사용 시에는 로컬 상태와 무관하게 항상 전체 응답을 기록/재생하고
+    # 같은 카세트를 몇 번이든 다시 재생할 수 있도록 캐시, 전송 이력, 보관소를 쓰지 않는다
+    persistent = cassette is None
+
+    http_cache = None
+    url_cache = None
+    seen_store = None
+    archive = None
+
     try:
+        if persistent:
+            # 조건부 요청 캐시 (실행마다 디스크에서 로드)
+            http_cache = HttpValidatorCache.from_config(config.news.http_cache)
+
+            # 구글 리다이렉트 링크 변환 캐시
+            url_cache = UrlResolutionCache.from_config(config.news.url_cache)
+
+            # 전송 이력 저장소 (보관 기간이 지난 이력은 먼저 정리)
+            seen_store = SeenStore.from_config(config.news.history)
+            if seen_store is not None:
+                seen_store.prune()
+
+            # 수집 뉴스 보관소
+            archive = NewsArchive.from_config(config.news.archive)
+
+        # 소스별 서킷 브레이커 / 적응형 타임아웃 상태
+        # (카세트 실행은 실제 상태를 읽지도 바꾸지도 않도록 저장하지 않는 메모리 상태 사용)
+        if health is None:
+            if persistent:
+                health = SourceHealthRegistry.from_config(config.news.health)
+            elif config.news.health.enabled:
+                health = SourceHealthRegistry(config.news.health)
+
+        if cassette is not None and not config.telegram.base_url:
+            logger.warning(
+                "카세트 실행이지만 telegram.base_url이 비어 있어 실제 텔레그램으로 전송합니다. "
+                "대역 서버(python -m src.telegram.stub) 주소를 지정하세요."
+            )
+
         # 설정 검증
         errors = validate_config(config)
         if errors:
@@ -56,19 +121,45 @@ async def run_news_briefing(
             return False
 
         # 뉴스 수집기 설정
-        collector = NewsCollector(config.news)
+        collector = NewsCollector(
+            config.news,
+            http_pool=http_pool,
+            http_cache=http_cache,
+            seen_store=seen_store,
+            health=health
+        )
 
         # 활성화된 뉴스 소스 목록
         sources = []
-        if config.news.sources.get("naver") and config.news.sources["naver"].enabled:
-            sources.append(NaverNewsSource())
-        if config.news.sources.get("google") and config.news.sources["google"].enabled:
-            sources.append(GoogleNewsSource())
+        naver_config = config.news.sources.get("naver")
+        if naver_config and naver_config.enabled:
+            sources.append(NaverNewsSource(
+                timeout=naver_config.timeout,
+                parser=naver_config.parser,
+                max_pages=naver_config.max_pages,
+                rate_limit=naver_config.rate_limit,
+                hedge_budget=naver_config.hedge_budget,
+                max_bytes=naver_config.max_bytes
+            ))
+        google_config = config.news.sources.get("google")
+        if google_config and google_config.enabled:
+            sources.append(GoogleNewsSource(
+                timeout=google_config.timeout,
+                resolve_links=google_config.resolve_links,
+                resolve_concurrency=google_config.resolve_concurrency,
+                url_cache=url_cache,
+                rate_limit=google_config.rate_limit,
+                hedge_budget=google_config.hedge_budget,
+                max_bytes=google_config.max_bytes
+            ))
 
         if not sources:
             logger.warning("활성화된 뉴스 소스가 없습니다.")
             return False
 
+        for source in sources:
+            collector.register_source(source)
+
         # 메시지 포맷터
         formatter = NewsFormatter(
             include_summary=config.message.include_summary,
@@ -76,13 +167,43 @@ async def run_news_briefing(
             format_type="plain"
         )
 
-        # 소스별로 뉴스 수집 및 전송
+        # 기사 선정 단계 (비활성화 시 rank_by 순서대로 max_items개)
+        ranker = NewsRanker.from_config(config.news, detector=collector.dedup)
+
+        # 모든 소스와 카테고리를 동시에 수집 (early_stop이면 목표 달성 후 느린 소스 중단)
+        candidates = await collector.collect_candidates()
+
+        # 수집한 후보는 선정 여부와 관계없이 모두 보관
+        if archive is not None:
+            archived = 0
+            with stage("archive"):
+                for by_category in candidates.values():
+                    for items in by_category.values():
+                        try:
+                            archived += archive.append(items)
+                        except OSError as e:
+                            logger.warning(f"뉴스 보관 실패: {e}")
+            logger.info(f"{archived}개 뉴스 보관 완료")
+
+        # 교차 보도 수는 중복 제거 전에 모든 소스의 후보로 계산
+        corroboration = None
+        if ranker is not None:
+            with stage("corroboration"):
+                corroboration = ranker.corroboration(candidates)
+
+        # 소스별로 병합/선정하여 전송 (수집은 위에서 모든 소스를 동시에 마침)
         total_success = True
         total_news = 0
 
         for source in sources:
-            logger.info(f"뉴스 수집 시작: {source.name}")
-            news_by_category = await collector.collect_by_source(source)
+            # 소스 후보를 rank_by 순서로 병합하며 같은 기사 제거
+            news_by_category = collector.merge(
+                {source.name: candidates.get(source.name, {})},
+                limit=ranker is None
+            )
+            if ranker is not None:
+                with stage(f"rank {source.name}"):
+                    news_by_category = ranker.rank(news_by_category, corroboration)
 
             source_news = sum(len(items) for items in news_by_category.values())
             total_news += source_news
@@ -92,16 +213,24 @@ async def run_news_briefing(
                 continue
 
             # 소스별 메시지 포맷팅 및 전송
-            message = formatter.format(news_by_category, source_name=source.name)
-            success = await sender.send_with_retry(message)
+            with stage(f"format {source.name}"):
+                message = formatter.format(news_by_category, source_name=source.name)
+            with stage(f"send {source.name}"):
+                success = await sender.send_with_retry(message)
 
             if success:
                 logger.info(f"{source.name}: 뉴스 브리핑 전송 완료")
+                if seen_store is not None:
+                    seen_store.mark_delivered(
+                        item for items in news_by_category.values() for item in items
+                    )
             else:
                 logger.error(f"{source.name}: 뉴스 브리핑 전송 실패")
                 total_success = False
 
         logger.info(f"총 {total_news}개 뉴스 수집 완료")
+        if health is not None:
+            logger.info(f"소스 상태: {health.summary()}")
 
         if total_news == 0:
             await sender.send_message_plain(
@@ -117,6 +246,20 @@ async def run_news_briefing(
             await notifier.notify_error(e, context="뉴스 브리핑 실행")
         return False
 
+    finally:
+        if http_cache is not None:
+            http_cache.save()
+        if url_cache is not None:
+            url_cache.save()
+        if seen_store is not None:
+            seen_store.close()
+        if health is not None:
+            health.save()
+        if owns_pool:
+            await http_pool.aclose()
+        if cassette is not None and cassette.recording:
+            cassette.save()
+
 
 async def run_scheduler(config_path: Optional[str] = None) -> None:
     """스케줄러 모드 실행
@@ -144,9 +287,35 @@ async def run_scheduler(config_path: Optional[str] = None) -> None:
     # 스케줄러 설정
     scheduler = NewsScheduler(config.schedule)
 
+    # 데몬 수명 동안 유지되는 공유 HTTP 클라이언트 풀
+    http_pool = HttpClientPool(config.news.sources)
+
+    # 실행 간 유지되는 소스 상태 (서킷 브레이커 / 응답 시간)
+    health = SourceHealthRegistry.from_config(config.news.health)
+
+    # Prometheus 지표 엔드포인트
+    metrics_server = None
+    if config.metrics.enabled:
+        def next_run_timestamp() -> Optional[float]:
+            next_run = scheduler.get_next_run_time()
+            return next_run.timestamp() if next_run else None
+
+        NEXT_RUN.set_function(next_run_timestamp)
+        metrics_server = MetricsServer(config.metrics)
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            logger.error(f"지표 엔드포인트를 열 수 없습니다: {e}")
+            metrics_server = None
+
     # 작업 함수 정의
     async def job():
-        return await run_news_briefing(config=config, notifier=notifier)
+        return await run_news_briefing(
+            config=config,
+            notifier=notifier,
+            http_pool=http_pool,
+            health=health
+        )
 
     scheduler.set_job(job)
 
@@ -160,6 +329,9 @@ async def run_scheduler(config_path: Optional[str] = None) -> None:
         logger.exception(f"스케줄러 오류: {e}")
         await notifier.notify_error(e, context="스케줄러 실행")
     finally:
+        if metrics_server is not None:
+            await metrics_server.stop()
+        await http_pool.aclose()
         await notifier.notify_shutdown()
 
 
@@ -252,6 +424,9 @@ def main():
   python -m src.main --scheduler  # 스케줄러 모드 (데몬)
   python -m src.main --test       # 텔레그램 연결 테스트
   python -m src.main --validate   # 설정 유효성 검사
+  python -m src.main --record data/run.json.gz  # 소스 HTTP 요청/응답 기록
+  python -m src.main --replay data/run.json.gz  # 기록된 응답으로 오프라인 실행
+  python -m src.main --profile --profile-pstats run.prof  # 단계별 시간 측정
         """
     )
 
@@ -285,6 +460,36 @@ def main():
         help="설정 유효성만 검사"
     )
 
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="PATH",
+        help="즉시 실행하면서 소스 HTTP 요청/응답을 카세트 파일에 기록"
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="네트워크 대신 카세트 파일의 응답으로 소스 수집"
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="즉시 실행의 단계별(수집/파싱/중복 제거/포맷/전송) 시간 표 출력"
+    )
+
+    parser.add_argument(
+        "--profile-pstats",
+        metavar="PATH",
+        help="cProfile 결과를 pstats 파일로 저장 (--profile 포함)"
+    )
+
+    parser.add_argument(
+        "--profile-collapsed",
+        metavar="PATH",
+        help="샘플링한 호출 스택을 flamegraph용 collapsed 파일로 저장 (--profile 포함)"
+    )
+
     args = parser.parse_args()
 
     # 실행 모드 결정
@@ -301,7 +506,22 @@ def main():
 
     else:
         # 기본: 즉시 실행 (--now와 동일)
-        success = asyncio.run(run_news_briefing(config_path=args.config))
+        cassette = None
+        if args.record:
+            cassette = Cassette(args.record, mode="record")
+        elif args.replay:
+            cassette = Cassette(args.replay, mode="replay")
+
+        if args.profile or args.profile_pstats or args.profile_collapsed:
+            profiler = Profiler(
+                pstats_path=args.profile_pstats,
+                collapsed_path=args.profile_collapsed
+            )
+            with profiler.activate():
+                success = asyncio.run(run_news_briefing(config_path=args.config, cassette=cassette))
+            print(profiler.report(), file=sys.stderr)
+        else:
+            success = asyncio.run(run_news_briefing(config_path=args.config, cassette=cassette))
         sys.exit(0 if success else 1)
 
 
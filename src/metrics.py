@@ -0,0 +1,264 @@
+"""Prometheus 텍스트 형식 지표
+
+수집기, 텔레그램 전송, 스케줄러가 모듈 수준 지표 객체에 값을 기록하고,
+스케줄러 데몬은 MetricsServer로 /metrics 엔드포인트를 노출한다.
+모든 기록은 이벤트 루프 스레드에서 일어나므로 잠금 없이 딕셔너리만 갱신한다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, Sequence
+
+from .config import MetricsConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+# 초 단위 기본 히스토그램 구간
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames}가 필요합니다 (받은 값: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> Iterable[str]:
+        """HELP/TYPE 줄 다음에 오는 샘플 줄"""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: 카운터는 감소할 수 없습니다")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """현재 값 (직접 설정하거나 조회 시 함수로 계산)"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Optional[Callable[[], Optional[float]]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def set_function(self, function: Optional[Callable[[], Optional[float]]]) -> None:
+        """조회 시점에 값을 계산할 함수 (레이블 없는 게이지, None을 반환하면 생략)"""
+        self._function = function
+
+    def _samples(self) -> Iterable[str]:
+        if self._function is not None:
+            value = self._function()
+            if value is not None:
+                yield f"{self.name} {_format_value(value)}"
+            return
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """구간별 누적 분포"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → ([구간별 개수..., +Inf], 합계)
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = entry
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> Iterable[str]:
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total[0])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+FETCH_DURATION = REGISTRY.register(Histogram(
+    "logos_news_fetch_duration_seconds",
+    "(소스, 카테고리) 단위 수집 시간",
+    ("source",),
+))
+ITEMS_FETCHED = REGISTRY.register(Counter(
+    "logos_news_items_fetched_total",
+    "수집한 뉴스 아이템 수",
+    ("source",),
+))
+ITEMS_DEDUPLICATED = REGISTRY.register(Counter(
+    "logos_news_items_deduplicated_total",
+    "유사 기사로 제거된 뉴스 아이템 수",
+    ("source",),
+))
+BYTES_DOWNLOADED = REGISTRY.register(Counter(
+    "logos_news_bytes_downloaded_total",
+    "소스 응답 본문 바이트 수",
+    ("source",),
+))
+TELEGRAM_SEND_DURATION = REGISTRY.register(Histogram(
+    "logos_news_telegram_send_duration_seconds",
+    "텔레그램 sendMessage 요청 시간 (시도별)",
+))
+TELEGRAM_THROTTLED = REGISTRY.register(Counter(
+    "logos_news_telegram_throttled_total",
+    "텔레그램 429(RetryAfter) 응답 수",
+))
+JOB_DURATION = REGISTRY.register(Histogram(
+    "logos_news_job_duration_seconds",
+    "스케줄 작업(뉴스 브리핑) 실행 시간",
+    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+))
+JOB_RUNS = REGISTRY.register(Counter(
+    "logos_news_job_runs_total",
+    "스케줄 작업 실행 수 (result: success, failure, error)",
+    ("result",),
+))
+NEXT_RUN = REGISTRY.register(Gauge(
+    "logos_news_next_run_timestamp_seconds",
+    "다음 스케줄 실행 시각 (Unix epoch)",
+))
+
+
+class MetricsServer:
+    """/metrics HTTP 엔드포인트 (aiohttp)"""
+
+    def __init__(self, config: MetricsConfig, registry: MetricsRegistry = REGISTRY):
+        """
+        Args:
+            config: 지표 설정 (host, port, path)
+            registry: 노출할 지표 모음
+        """
+        self.config = config
+        self.registry = registry
+        self.port = config.port
+        self._runner = None
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        return web.Response(
+            text=self.registry.render(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    async def start(self) -> None:
+        """서버 시작 (port가 0이면 할당된 포트로 갱신)"""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get(self.config.path, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.config.host, self.config.port).start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"지표 엔드포인트: http://{self.config.host}:{self.port}{self.config.path}")
+
+    async def stop(self) -> None:
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
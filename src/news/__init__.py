@@ -1,13 +1,28 @@
 """뉴스 수집 모듈"""
 
 from .collector import NewsCollector, NewsItem
+from .archive import NewsArchive
+from .cache import HttpValidatorCache, UrlResolutionCache
+from .cassette import Cassette
 from .formatter import NewsFormatter
+from .health import SourceHealthRegistry
+from .history import SeenStore
+from .http import HttpClientPool
+from .ranking import NewsRanker
 from .sources import NaverNewsSource, GoogleNewsSource, BaseNewsSource
 
 __all__ = [
     "NewsCollector",
     "NewsItem",
+    "NewsArchive",
     "NewsFormatter",
+    "NewsRanker",
+    "HttpClientPool",
+    "Cassette",
+    "HttpValidatorCache",
+    "UrlResolutionCache",
+    "SeenStore",
+    "SourceHealthRegistry",
     "NaverNewsSource",
     "GoogleNewsSource",
     "BaseNewsSource",
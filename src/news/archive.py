@@ -0,0 +1,236 @@
+"""수집 뉴스 보관소 (append-only 세그먼트 + 메모리 매핑 인덱스)"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..config import ArchiveConfig
+from .collector import NewsItem, source_name
+from .compact import CompactNewsItem, dumps, loads
+
+
+logger = logging.getLogger(__name__)
+
+
+# 세그먼트 레코드: [본문 길이 uint32][zlib 압축된 dumps() 블록]
+_LENGTH = struct.Struct("<I")
+
+# 인덱스 항목: 시각(int64 epoch), 카테고리 ID, 소스 ID, 세그먼트 번호, 블록 오프셋, 블록 내 위치
+_ENTRY = struct.Struct("<qHHIQI")
+
+
+class NewsArchive:
+    """수집한 NewsItem을 쌓아 두는 append-only 보관소
+
+    - segment-NNNNNN.log: append 호출마다 아이템 묶음을 압축한 길이-접두 레코드 하나를 추가하고,
+      크기가 segment_bytes를 넘으면 다음 세그먼트로 넘어간다.
+    - index.bin: 아이템마다 고정 크기 항목(시각, 카테고리, 소스, 위치)을 추가한다.
+      조회 시 메모리 매핑으로 훑어 조건에 맞는 블록만 세그먼트에서 읽는다.
+    - index.json: 카테고리/소스 이름 ↔ ID 목록
+    """
+
+    def __init__(self, path: str, segment_bytes: int = 8 * 1024 * 1024):
+        """
+        Args:
+            path: 보관소 디렉터리
+            segment_bytes: 세그먼트 파일 최대 크기 (바이트)
+        """
+        self.path = Path(path)
+        self.segment_bytes = max(1, segment_bytes)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._index_path = self.path / "index.bin"
+        self._meta_path = self.path / "index.json"
+        self._names = self._load_names()
+        self._segment = self._last_segment()
+        self._repair_index()
+
+    @classmethod
+    def from_config(cls, config: ArchiveConfig) -> Optional["NewsArchive"]:
+        """설정으로부터 생성 (비활성화 또는 열기 실패 시 None)
+
+        index.json이 손상되었으면 인덱스의 ID를 해석할 수 없으므로 보관소를 열지 않는다.
+        """
+        if not config.enabled:
+            return None
+        try:
+            return cls(config.path, segment_bytes=config.segment_bytes)
+        except (OSError, ValueError) as e:
+            logger.warning(f"뉴스 보관소를 열 수 없습니다: {config.path} ({e})")
+            return None
+
+    def _segment_path(self, number: int) -> Path:
+        return self.path / f"segment-{number:06d}.log"
+
+    def _last_segment(self) -> int:
+        numbers = [
+            int(p.stem.split("-", 1)[1]) for p in self.path.glob("segment-*.log")
+        ]
+        return max(numbers, default=1)
+
+    def _load_names(self) -> dict[str, list[str]]:
+        if not self._meta_path.exists():
+            return {"categories": [], "sources": []}
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_names(self) -> None:
+        tmp_path = self._meta_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._names, f, ensure_ascii=False)
+        os.replace(tmp_path, self._meta_path)
+
+    def _repair_index(self) -> None:
+        """중단된 기록으로 남은 불완전한 인덱스 항목 제거"""
+        if not self._index_path.exists():
+            return
+        size = self._index_path.stat().st_size
+        if size % _ENTRY.size:
+            with open(self._index_path, "r+b") as f:
+                f.truncate(size - size % _ENTRY.size)
+
+    def _name_id(self, kind: str, name: str) -> int:
+        names = self._names[kind]
+        try:
+            return names.index(name)
+        except ValueError:
+            names.append(name)
+            return len(names) - 1
+
+    def append(self, items: Iterable[NewsItem], collected_at: Optional[float] = None) -> int:
+        """아이템 묶음 추가
+
+        인덱스 시각은 발행 시각을, 없으면 수집 시각을 사용한다.
+
+        Args:
+            items: 뉴스 아이템
+            collected_at: 수집 시각 (epoch 초, None이면 현재)
+
+        Returns:
+            추가한 아이템 수
+        """
+        items = list(items)
+        if not items:
+            return 0
+
+        collected = int(collected_at if collected_at is not None else time.time())
+        known = (len(self._names["categories"]), len(self._names["sources"]))
+
+        # 세그먼트 크기 초과 시 다음 세그먼트로
+        segment_path = self._segment_path(self._segment)
+        if segment_path.exists() and segment_path.stat().st_size >= self.segment_bytes:
+            self._segment += 1
+            segment_path = self._segment_path(self._segment)
+
+        block = zlib.compress(dumps(items))
+        with open(segment_path, "ab") as f:
+            offset = f.tell()
+            f.write(_LENGTH.pack(len(block)))
+            f.write(block)
+
+        entries = b"".join(
+            _ENTRY.pack(
+                item.published_ts or collected,
+                self._name_id("categories", item.category),
+                self._name_id("sources", source_name(item.source)),
+                self._segment,
+                offset,
+                position,
+            )
+            for position, item in enumerate(items)
+        )
+        if known != (len(self._names["categories"]), len(self._names["sources"])):
+            self._save_names()
+        with open(self._index_path, "ab") as f:
+            f.write(entries)
+
+        return len(items)
+
+    def _scan(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+        category: Optional[str],
+        source: Optional[str]
+    ) -> dict[tuple[int, int], list[int]]:
+        """인덱스에서 조건에 맞는 (세그먼트, 오프셋) → 블록 내 위치 목록"""
+        hits: dict[tuple[int, int], list[int]] = defaultdict(list)
+        if not self._index_path.exists() or self._index_path.stat().st_size < _ENTRY.size:
+            return hits
+
+        names = self._names
+        if category is not None and category not in names["categories"]:
+            return hits
+        if source is not None and source not in names["sources"]:
+            return hits
+        category_id = names["categories"].index(category) if category is not None else None
+        source_id = names["sources"].index(source) if source is not None else None
+        lower = since if since is not None else float("-inf")
+        upper = until if until is not None else float("inf")
+
+        with open(self._index_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index, \
+                    memoryview(index) as view:
+                usable = len(view) - len(view) % _ENTRY.size
+                for ts, cat, src, segment, offset, position in _ENTRY.iter_unpack(view[:usable]):
+                    if (
+                        lower <= ts < upper
+                        and (category_id is None or cat == category_id)
+                        and (source_id is None or src == source_id)
+                    ):
+                        hits[(segment, offset)].append(position)
+
+        return hits
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> list[CompactNewsItem]:
+        """조건에 맞는 아이템 조회
+
+        예: 지난 1주일 경제 뉴스 → query(since=time.time() - 7 * 86400, category="economy")
+
+        Args:
+            since: 시작 시각 (epoch 초, 포함)
+            until: 종료 시각 (epoch 초, 제외)
+            category: 카테고리 이름
+            source: 소스 이름 (naver, google 등)
+
+        Returns:
+            저장 순서대로의 아이템
+        """
+        hits = self._scan(since, until, category, source)
+        results: list[CompactNewsItem] = []
+        handles = {}
+
+        try:
+            for (segment, offset), positions in sorted(hits.items()):
+                f = handles.get(segment)
+                if f is None:
+                    f = handles[segment] = open(self._segment_path(segment), "rb")
+                f.seek(offset)
+                (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                block = loads(zlib.decompress(f.read(length)))
+                results.extend(block[position] for position in positions)
+        finally:
+            for f in handles.values():
+                f.close()
+
+        return results
+
+    def __len__(self) -> int:
+        if not self._index_path.exists():
+            return 0
+        return self._index_path.stat().st_size // _ENTRY.size
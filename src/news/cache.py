@@ -0,0 +1,245 @@
+"""디스크 기반 캐시 모듈"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from ..config import HttpCacheConfig, UrlCacheConfig
+from .collector import NewsItem
+from .compact import from_rows, to_rows
+
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentLRUCache:
+    """JSON 파일로 저장되는 LRU + TTL 캐시
+
+    항목은 저장 시각과 함께 보관되며, TTL이 지난 항목은 조회 시 제거된다.
+    항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        ttl_seconds: float,
+        max_entries: int
+    ):
+        """
+        Args:
+            path: 캐시 파일 경로 (None이면 메모리에만 유지)
+            ttl_seconds: 항목 유지 시간 (초)
+            max_entries: 최대 항목 수
+        """
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def _is_expired(self, entry: dict[str, Any], now: float) -> bool:
+        return now - entry.get("stored_at", 0) > self.ttl_seconds
+
+    def _load(self) -> None:
+        """캐시 파일 로드 (손상된 파일은 무시)"""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"캐시 파일 로드 실패, 새로 시작합니다: {self.path} ({e})")
+            return
+
+        now = time.time()
+        for key, entry in data.get("entries", []):
+            if not self._is_expired(entry, now):
+                self._entries[key] = entry
+        self._evict()
+
+    def _evict(self) -> None:
+        """크기 제한 초과 항목 제거"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값 조회 (조회된 항목은 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self._is_expired(entry, time.time()):
+            del self._entries[key]
+            self._dirty = True
+            return None
+
+        self._entries.move_to_end(key)
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 값 저장
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+        """
+        self._entries[key] = {"stored_at": time.time(), "value": value}
+        self._entries.move_to_end(key)
+        self._dirty = True
+        self._evict()
+
+    def touch(self, key: str) -> None:
+        """항목의 저장 시각 갱신 (TTL 연장)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry["stored_at"] = time.time()
+            self._entries.move_to_end(key)
+            self._dirty = True
+
+    def save(self) -> None:
+        """변경 사항을 파일에 기록 (임시 파일 교체 방식)"""
+        if not self.path or not self._dirty:
+            return
+
+        now = time.time()
+        entries = [
+            [key, entry] for key, entry in self._entries.items()
+            if not self._is_expired(entry, now)
+        ]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"캐시 파일 저장 실패: {self.path} ({e})")
+
+
+class HttpValidatorCache(PersistentLRUCache):
+    """HTTP 조건부 요청(ETag / Last-Modified) 캐시
+
+    URL별로 응답 검증자와 파싱된 NewsItem 목록(CompactNewsItem 행 형식)을 저장하고,
+    서버가 304 Not Modified를 반환하면 저장된 목록을 재사용한다.
+    """
+
+    @classmethod
+    def from_config(cls, config: HttpCacheConfig) -> Optional["HttpValidatorCache"]:
+        """설정으로부터 캐시 생성 (비활성화 시 None)"""
+        if not config.enabled:
+            return None
+        return cls(
+            path=config.path,
+            ttl_seconds=config.ttl_hours * 3600,
+            max_entries=config.max_entries,
+        )
+
+    def conditional_headers(self, url: str, max_items: int) -> dict[str, str]:
+        """조건부 요청 헤더 생성
+
+        저장된 목록이 요청 개수보다 적게 파싱되었거나 행 목록(rows)이 없는 항목은
+        재사용할 수 없으므로 검증자를 보내지 않는다.
+
+        Args:
+            url: 요청 URL
+            max_items: 요청 최대 개수
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더
+        """
+        entry = self.get(url)
+        if not entry or "rows" not in entry or entry["max_items"] < max_items:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def cached_items(self, url: str, max_items: int) -> Optional[list[NewsItem]]:
+        """304 응답 시 재사용할 NewsItem 목록
+
+        Args:
+            url: 요청 URL
+            max_items: 요청 최대 개수
+
+        Returns:
+            뉴스 아이템 리스트 (없거나 행 목록이 없는 항목이면 None)
+        """
+        entry = self.get(url)
+        if not entry or "rows" not in entry:
+            return None
+
+        self.touch(url)
+        return [item.to_item() for item in from_rows(entry["rows"][:max_items])]
+
+    def store(
+        self,
+        url: str,
+        headers: Any,
+        items: list[NewsItem],
+        max_items: int
+    ) -> None:
+        """응답 검증자와 파싱 결과 저장
+
+        Args:
+            url: 요청 URL
+            headers: 응답 헤더
+            items: 파싱된 뉴스 아이템
+            max_items: 파싱 시 사용한 최대 개수
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        self.set(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "max_items": max_items,
+            "rows": to_rows(items),
+        })
+
+
+class UrlResolutionCache(PersistentLRUCache):
+    """리다이렉트 URL → 실제 기사 URL 변환 결과 캐시
+
+    한 번 변환한 링크는 TTL 동안 실행 간에 재사용하여 다시 요청하지 않는다.
+    """
+
+    @classmethod
+    def from_config(cls, config: UrlCacheConfig) -> Optional["UrlResolutionCache"]:
+        """설정으로부터 캐시 생성 (비활성화 시 None)"""
+        if not config.enabled:
+            return None
+        return cls(
+            path=config.path,
+            ttl_seconds=config.ttl_hours * 3600,
+            max_entries=config.max_entries,
+        )
@@ -0,0 +1,196 @@
+"""HTTP 요청/응답 기록 및 재생 (카세트)
+
+녹화 모드에서는 소스가 보낸 요청과 받은 응답(상태, 헤더, 원본 본문)을
+gzip 압축 카세트 파일에 기록하고, 재생 모드에서는 네트워크 대신
+카세트의 응답을 돌려주어 같은 입력으로 수집 과정을 반복 실행할 수 있다.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import os
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+# 카세트 형식 버전 (항목 구성이 바뀌면 올린다)
+CASSETTE_VERSION = 1
+
+RECORD = "record"
+REPLAY = "replay"
+
+# 카세트에 남기지 않는 요청 헤더 (API 키 등)
+REDACTED_HEADERS = frozenset({
+    "authorization",
+    "cookie",
+    "x-naver-client-id",
+    "x-naver-client-secret",
+})
+
+
+def _request_key(method: str, url: str) -> str:
+    return f"{method.upper()} {url}"
+
+
+class Cassette:
+    """기록된 HTTP 교환 목록
+
+    같은 요청(메서드 + URL)이 여러 번 기록되어 있으면 기록된 순서대로 돌려주고,
+    모두 소진하면 마지막 응답을 반복한다.
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        """
+        Args:
+            path: 카세트 파일 경로 (.json.gz)
+            mode: record 또는 replay
+
+        Raises:
+            ValueError: 지원하지 않는 모드 또는 카세트 형식인 경우
+            FileNotFoundError: 재생할 카세트 파일이 없는 경우
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.exchanges: list[dict] = []
+        self._queues: dict[str, deque[dict]] = defaultdict(deque)
+        self._last: dict[str, dict] = {}
+
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        version = payload.get("v") if isinstance(payload, dict) else None
+        if version != CASSETTE_VERSION:
+            raise ValueError(f"지원하지 않는 카세트 형식 (버전: {version})")
+
+        self.exchanges = payload["exchanges"]
+        for exchange in self.exchanges:
+            self._queues[_request_key(exchange["method"], exchange["url"])].append(exchange)
+        logger.info(f"카세트 로드: {self.path} ({len(self.exchanges)}개 요청)")
+
+    def save(self) -> None:
+        """카세트 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(
+                {"v": CASSETTE_VERSION, "exchanges": self.exchanges},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+        logger.info(f"카세트 저장: {self.path} ({len(self.exchanges)}개 요청)")
+
+    def record(self, request: httpx.Request, response: httpx.Response, body: bytes) -> None:
+        """요청/응답 한 건 기록
+
+        Args:
+            request: 보낸 요청
+            response: 받은 응답 (헤더/상태)
+            body: 디코딩 전 원본 본문 (Content-Encoding 그대로)
+        """
+        self.exchanges.append({
+            "method": request.method,
+            "url": str(request.url),
+            "request_headers": [
+                [name, value]
+                for name, value in request.headers.items()
+                if name.lower() not in REDACTED_HEADERS
+            ],
+            "status": response.status_code,
+            "headers": [[name, value] for name, value in response.headers.multi_items()],
+            "body": base64.b64encode(body).decode("ascii"),
+        })
+
+    def play(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """요청에 해당하는 기록된 응답 (없으면 None)"""
+        key = _request_key(request.method, str(request.url))
+        queue = self._queues.get(key)
+        if queue:
+            exchange = self._last[key] = queue.popleft()
+        else:
+            exchange = self._last.get(key)
+        if exchange is None:
+            return None
+
+        return httpx.Response(
+            exchange["status"],
+            headers=exchange["headers"],
+            content=base64.b64decode(exchange["body"]),
+            request=request,
+        )
+
+    def transport(
+        self,
+        wrapped: Optional[httpx.AsyncBaseTransport] = None
+    ) -> httpx.AsyncBaseTransport:
+        """모드에 맞는 전송 계층
+
+        Args:
+            wrapped: 녹화 모드에서 실제 요청을 보낼 전송 계층 (None이면 기본값)
+        """
+        if self.recording:
+            return RecordingTransport(self, wrapped or httpx.AsyncHTTPTransport())
+        return ReplayTransport(self)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제로 요청을 보내고 교환 내용을 카세트에 기록하는 전송 계층"""
+
+    def __init__(self, cassette: Cassette, wrapped: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.wrapped = wrapped
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.wrapped.handle_async_request(request)
+        try:
+            # 전송 계층의 스트림은 Content-Encoding이 풀리기 전의 원본 바이트
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+
+        self.cassette.record(request, response, body)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """네트워크 없이 카세트에 기록된 응답을 돌려주는 전송 계층"""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.cassette.play(request)
+        if response is None:
+            raise httpx.ConnectError(
+                f"카세트에 기록되지 않은 요청: {request.method} {request.url}",
+                request=request,
+            )
+        return response
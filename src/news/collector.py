@@ -2,29 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import sys
+import time
+from collections import Counter
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Optional, TYPE_CHECKING
 
 from ..config import NewsConfig
+from ..metrics import BYTES_DOWNLOADED, FETCH_DURATION, ITEMS_DEDUPLICATED, ITEMS_FETCHED
+from ..profiling import stage
+from .dedup import NearDuplicateDetector
+from .keywords import CategoryMatcher, category_matcher
+from .merge import iter_top
+from .timestamps import to_epoch, to_utc
 
 if TYPE_CHECKING:
+    from .cache import HttpValidatorCache
+    from .health import SourceHealthRegistry
+    from .history import SeenStore
+    from .http import HttpClientPool
     from .sources.base import BaseNewsSource
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def source_name(source: str) -> str:
+    """아이템 source 값의 수집 소스 이름
+
+    네이버는 "naver:언론사", 구글은 "google/언론사" 형식으로 언론사를 붙이므로
+    첫 구분자 앞부분만 사용한다 ("naver:연합뉴스" → "naver", "google/연합뉴스" → "google").
+    """
+    for index, char in enumerate(source):
+        if char == ":" or char == "/":
+            return source[:index]
+    return source
+
+
+@dataclass(slots=True)
 class NewsItem:
-    """뉴스 아이템 데이터 클래스"""
+    """뉴스 아이템 데이터 클래스
+
+    category/source는 intern하여 같은 값을 가진 아이템이 문자열 객체를 공유한다.
+    published_at은 생성 시 aware UTC로 정규화하고, 정렬용 정수 epoch를
+    published_ts에 미리 계산해 둔다 (발행 시각이 없으면 0).
+    """
     title: str
     link: str
     category: str  # society, economy 등
     source: str    # naver, google 등
     summary: Optional[str] = None
     published_at: Optional[datetime] = None
+    published_ts: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.category = sys.intern(self.category)
+        self.source = sys.intern(self.source)
+        self.published_at = to_utc(self.published_at)
+        self.published_ts = to_epoch(self.published_at) or 0
 
     def __hash__(self):
         return hash(self.link)
@@ -34,16 +75,99 @@ class NewsItem:
             return self.link == other.link
         return False
 
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 딕셔너리 변환"""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "category": self.category,
+            "source": self.source,
+            "summary": self.summary,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NewsItem":
+        """to_dict() 결과로부터 복원"""
+        published_at = data.get("published_at")
+        return cls(
+            title=data["title"],
+            link=data["link"],
+            category=data["category"],
+            source=data["source"],
+            summary=data.get("summary"),
+            published_at=datetime.fromisoformat(published_at) if published_at else None,
+        )
+
+
+@dataclass
+class FetchStats:
+    """(소스, 카테고리) 수집 한 번의 응답 본문 통계"""
+    bytes_received: int = 0  # 받은 본문 바이트 수 (압축 해제 후)
+    truncated: int = 0       # 크기 제한으로 잘린 응답 수
+    filtered: int = 0        # 카테고리 include/exclude 키워드로 제외된 아이템 수
+
+
+# 현재 수집 중인 fetch의 통계 (수집기가 fetch마다 설정하고 소스의 HTTP 계층이 갱신)
+current_fetch_stats: ContextVar[Optional[FetchStats]] = ContextVar(
+    "current_fetch_stats", default=None
+)
+
+
+class CategoryQuota:
+    """여러 소스 스트림이 공유하는 카테고리 수집 목표"""
+
+    def __init__(self, target: int):
+        """
+        Args:
+            target: 목표 아이템 수 (링크 기준 고유 개수)
+        """
+        self.target = target
+        self.reached = asyncio.Event()
+        self._links: set[str] = set()
+
+    @property
+    def satisfied(self) -> bool:
+        return self.reached.is_set()
+
+    def add(self, item: NewsItem) -> None:
+        """수집된 아이템 반영"""
+        self._links.add(item.link)
+        if len(self._links) >= self.target:
+            self.reached.set()
+
 
 class NewsCollector:
     """뉴스 수집기"""
 
-    def __init__(self, config: NewsConfig):
+    def __init__(
+        self,
+        config: NewsConfig,
+        http_pool: Optional["HttpClientPool"] = None,
+        http_cache: Optional["HttpValidatorCache"] = None,
+        seen_store: Optional["SeenStore"] = None,
+        health: Optional["SourceHealthRegistry"] = None
+    ):
         """
         Args:
             config: 뉴스 설정
+            http_pool: 소스에 주입할 공유 HTTP 클라이언트 풀 (None이면 소스별 단발성 클라이언트)
+            http_cache: 소스가 공유하는 조건부 요청 캐시
+            seen_store: 이미 전송한 기사를 걸러낼 이력 저장소
+            health: 소스별 서킷 브레이커 / 적응형 타임아웃 상태
         """
         self.config = config
+        self.http_pool = http_pool
+        self.http_cache = http_cache
+        self.seen_store = seen_store
+        self.health = health
+        self.dedup = NearDuplicateDetector.from_config(config.dedup)
+        # include/exclude 필터가 있는 카테고리의 키워드 매처 (카테고리별 한 번 컴파일)
+        self.matchers: dict[str, CategoryMatcher] = {
+            name: matcher
+            for name, cat in config.categories.items()
+            if (matcher := category_matcher(cat)) is not None and matcher.filters
+        }
         self.sources: list["BaseNewsSource"] = []
 
     def register_source(self, source: "BaseNewsSource") -> None:
@@ -52,11 +176,259 @@ class NewsCollector:
         Args:
             source: 뉴스 소스 인스턴스
         """
+        self._bind(source)
         self.sources.append(source)
         logger.info(f"뉴스 소스 등록: {source.name}")
 
-    async def collect_all(self) -> dict[str, list[NewsItem]]:
-        """모든 카테고리의 뉴스 수집
+    def _bind(self, source: "BaseNewsSource") -> None:
+        """소스에 공유 HTTP 클라이언트, 캐시, 카테고리 키워드 주입"""
+        if self.http_pool is not None and hasattr(source, "set_client"):
+            source.set_client(self.http_pool.get(source.name))
+        if self.http_cache is not None and hasattr(source, "set_cache"):
+            source.set_cache(self.http_cache)
+        if self.health is not None and hasattr(source, "set_health"):
+            source.set_health(self.health.get(source.name))
+        if hasattr(source, "set_keywords"):
+            source.set_keywords({
+                name: cat.keywords for name, cat in self.config.categories.items()
+            })
+
+    def _is_source_enabled(self, source: "BaseNewsSource") -> bool:
+        """소스 활성화 여부 확인"""
+        source_config = self.config.sources.get(source.name)
+        return not (source_config and not source_config.enabled)
+
+    def _priority(self, name: str) -> int:
+        """소스 우선순위 (SourceConfig.priority, 낮을수록 우선)"""
+        source_config = self.config.sources.get(name)
+        return source_config.priority if source_config else 1
+
+    def _make_semaphore(self, source: "BaseNewsSource") -> asyncio.Semaphore:
+        """소스별 동시 요청 제한 세마포어 생성"""
+        source_config = self.config.sources.get(source.name)
+        limit = source_config.max_concurrency if source_config else 4
+        return asyncio.Semaphore(max(1, limit))
+
+    async def _fetch(
+        self,
+        source: "BaseNewsSource",
+        category: str,
+        max_items: int,
+        semaphore: asyncio.Semaphore,
+        quota: Optional["CategoryQuota"] = None
+    ) -> list[NewsItem]:
+        """세마포어 안에서 (소스, 카테고리) 단위 뉴스 수집
+
+        소스의 스트림을 읽으면서 max_items개를 채우면 중단하고, 카테고리 목표(quota)가
+        다른 소스에 의해 먼저 채워지면 남은 스트림을 취소한다.
+        실패한 요청은 그때까지 받은 아이템만 반환하여 나머지 결과는 그대로 병합한다.
+        서킷이 열린 소스는 요청하지 않고 건너뛴다.
+        """
+        news_items: list[NewsItem] = []
+        if quota is not None and quota.satisfied:
+            return news_items
+
+        health = self.health.get(source.name) if self.health is not None else None
+        if health is not None and not health.allow():
+            logger.info(f"  {source.name}/{category}: 서킷 open 상태로 건너뜀")
+            return news_items
+
+        try:
+            async with semaphore:
+                # 세마포어 대기 시간은 수집 시간에 넣지 않음
+                started = time.perf_counter()
+                try:
+                    with stage(f"fetch {source.name}/{category}"):
+                        return await self._fetch_stream(source, category, max_items, quota)
+                finally:
+                    FETCH_DURATION.observe(time.perf_counter() - started, source=source.name)
+        finally:
+            if health is not None:
+                health.release()
+
+    async def _fetch_stream(
+        self,
+        source: "BaseNewsSource",
+        category: str,
+        max_items: int,
+        quota: Optional["CategoryQuota"]
+    ) -> list[NewsItem]:
+        """_fetch 본체 (서킷 확인, 세마포어 획득 이후)"""
+        news_items: list[NewsItem] = []
+        stats = FetchStats()
+
+        consumer = asyncio.ensure_future(
+            self._consume(source, category, max_items, news_items, quota, stats)
+        )
+        waiter = asyncio.ensure_future(quota.reached.wait()) if quota is not None else None
+
+        try:
+            await asyncio.wait(
+                {consumer, waiter} if waiter else {consumer},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if consumer.done():
+                skipped = consumer.result()
+            else:
+                consumer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await consumer
+                skipped = 0
+                logger.info(f"  {source.name}/{category}: 카테고리 수집 목표 달성으로 중단")
+
+        except Exception as e:
+            logger.error(f"  {source.name}/{category} 수집 실패: {e}")
+            return news_items
+
+        finally:
+            if waiter is not None:
+                waiter.cancel()
+            # 바깥 태스크가 취소되어도 소스 스트림을 남겨 두지 않음
+            if not consumer.done():
+                consumer.cancel()
+
+        ITEMS_FETCHED.inc(len(news_items), source=source.name)
+        BYTES_DOWNLOADED.inc(stats.bytes_received, source=source.name)
+        logger.info(
+            f"  {source.name}/{category}: {len(news_items)}개 수집 "
+            f"({stats.bytes_received / 1024:.1f}KB)"
+        )
+        if skipped:
+            logger.info(f"  {source.name}/{category}: 전송 이력 {skipped}개 제외")
+        if stats.filtered:
+            logger.info(f"  {source.name}/{category}: 키워드 필터 {stats.filtered}개 제외")
+
+        return news_items
+
+    async def _consume(
+        self,
+        source: "BaseNewsSource",
+        category: str,
+        max_items: int,
+        news_items: list[NewsItem],
+        quota: Optional["CategoryQuota"],
+        stats: FetchStats
+    ) -> int:
+        """소스 스트림을 읽어 news_items에 추가
+
+        별도 태스크에서 실행되므로 stats를 이 태스크의 컨텍스트에 설정하면
+        소스가 이 수집을 위해 받은 응답 바이트만 stats에 기록된다.
+        전송 이력은 아이템마다 조회하지 않고, 남은 수만큼 모은 묶음을 한 번에 조회한다.
+
+        Returns:
+            전송 이력으로 제외된 아이템 수
+        """
+        current_fetch_stats.set(stats)
+        skipped = 0
+        matcher = self.matchers.get(category)
+        pending: list[NewsItem] = []  # 전송 이력 조회 대기 중인 아이템
+
+        def accept(items: list[NewsItem]) -> None:
+            news_items.extend(items)
+            if quota is not None:
+                for item in items:
+                    quota.add(item)
+
+        def flush() -> None:
+            nonlocal pending, skipped
+            unseen = self.seen_store.filter_unseen(pending)
+            skipped += len(pending) - len(unseen)
+            accept(unseen)
+            pending = []
+
+        stream = source.stream_news(category=category, max_items=max_items)
+        try:
+            async for item in stream:
+                # 카테고리 include/exclude 키워드 필터
+                if matcher is not None:
+                    hits = matcher.match(item)
+                    if not matcher.accepts(hits):
+                        stats.filtered += 1
+                        logger.debug(
+                            f"  {source.name}/{category}: 키워드 필터로 제외 "
+                            f"(exclude={sorted(hits.exclude)}): {item.title}"
+                        )
+                        continue
+
+                if self.seen_store is None:
+                    accept([item])
+                else:
+                    # 남은 수만큼 모이면 이미 전송한 기사를 한 번에 제외
+                    pending.append(item)
+                    if len(news_items) + len(pending) >= max_items:
+                        flush()
+
+                if len(news_items) >= max_items:
+                    break
+
+            if pending:
+                flush()
+        finally:
+            await stream.aclose()
+
+        return skipped
+
+    async def collect_candidates(self) -> dict[str, dict[str, list[NewsItem]]]:
+        """모든 (소스, 카테고리) 조합의 후보 수집
+
+        모든 조합을 동시에 요청하고, 소스별 동시 요청 수는
+        SourceConfig.max_concurrency로 제한한다. 각 소스의 결과는 스트림으로 읽으며,
+        NewsConfig.early_stop이면 카테고리 목표(max_items * 2)를 채우는 즉시
+        남은 소스 스트림을 중단한다.
+
+        Returns:
+            소스 이름 → 카테고리 → 후보 아이템 (병합/중복 제거 전)
+        """
+        categories = [
+            (cat_name, cat_config)
+            for cat_name, cat_config in self.config.categories.items()
+            if cat_config.enabled
+        ]
+        sources = [s for s in self.sources if self._is_source_enabled(s)]
+        semaphores = {id(s): self._make_semaphore(s) for s in sources}
+
+        # early_stop이면 카테고리 목표를 채운 뒤 느린 소스를 기다리지 않는다
+        quotas = {
+            cat_name: CategoryQuota(cat_config.max_items * 2)
+            for cat_name, cat_config in categories
+        } if self.config.early_stop else {}
+
+        logger.info(f"뉴스 수집 시작: 카테고리 {len(categories)}개 x 소스 {len(sources)}개")
+
+        tasks = [
+            self._fetch(
+                source,
+                cat_name,
+                cat_config.max_items * 2,  # 중복 제거 고려하여 여유있게
+                semaphores[id(source)],
+                quotas.get(cat_name)
+            )
+            for source in sources
+            for cat_name, cat_config in categories
+        ]
+        fetched = iter(await asyncio.gather(*tasks))
+
+        candidates: dict[str, dict[str, list[NewsItem]]] = {}
+        for source in sources:
+            by_category = candidates.setdefault(source.name, {})
+            for cat_name, _ in categories:
+                by_category.setdefault(cat_name, []).extend(next(fetched))
+
+        return candidates
+
+    def merge(
+        self,
+        candidates: dict[str, dict[str, list[NewsItem]]],
+        limit: bool = True
+    ) -> dict[str, list[NewsItem]]:
+        """소스별 후보를 카테고리별로 병합
+
+        카테고리별로 NewsConfig.rank_by 합성 키(소스 우선순위, 최신순, 교차 보도 수)
+        순서로 소스 스트림을 병합하며 같은 링크와 유사 기사를 제거한다.
+
+        Args:
+            candidates: 소스 이름 → 카테고리 → 후보 아이템 (collect_candidates 결과)
+            limit: False이면 max_items로 자르지 않고 병합 결과 전체 반환 (랭킹 단계용)
 
         Returns:
             카테고리별 뉴스 딕셔너리
@@ -66,46 +438,49 @@ class NewsCollector:
         for cat_name, cat_config in self.config.categories.items():
             if not cat_config.enabled:
                 continue
+            streams = [
+                (self._priority(name), by_category.get(cat_name, []))
+                for name, by_category in candidates.items()
+            ]
+
+            # 합성 키(rank_by) 순서로 필요한 만큼만 꺼내며 유사 기사 제거
+            dropped: list[NewsItem] = []
+            with stage(f"dedup {cat_name}"):
+                ranked = iter_top(streams, self.config.rank_by)
+                if self.dedup is not None:
+                    ranked = self.dedup.iter_unique(ranked, dropped=dropped)
+                result[cat_name] = list(islice(ranked, cat_config.max_items if limit else None))
+            for name, count in Counter(source_name(item.source) for item in dropped).items():
+                ITEMS_DEDUPLICATED.inc(count, source=name)
+            logger.info(f"카테고리 '{cat_name}': 최종 {len(result[cat_name])}개")
 
-            logger.info(f"카테고리 '{cat_name}' 뉴스 수집 시작")
-
-            all_news: list[NewsItem] = []
+        return result
 
-            for source in self.sources:
-                # 소스 설정 확인
-                source_config = self.config.sources.get(source.name)
-                if source_config and not source_config.enabled:
-                    continue
+    async def collect_all(self, limit: bool = True) -> dict[str, list[NewsItem]]:
+        """모든 카테고리의 뉴스 수집
 
-                try:
-                    news_items = await source.fetch_news(
-                        category=cat_name,
-                        max_items=cat_config.max_items * 2  # 중복 제거 고려하여 여유있게
-                    )
-                    all_news.extend(news_items)
-                    logger.info(f"  {source.name}: {len(news_items)}개 수집")
-
-                except Exception as e:
-                    logger.error(f"  {source.name} 수집 실패: {e}")
-
-            # 중복 제거 및 정렬
-            unique_news = list(set(all_news))
-            unique_news.sort(
-                key=lambda x: x.published_at or datetime.min,
-                reverse=True
-            )
+        collect_candidates로 모든 소스를 동시에 수집한 뒤 merge로 병합한다.
 
-            # 최대 개수 제한
-            result[cat_name] = unique_news[:cat_config.max_items]
-            logger.info(f"카테고리 '{cat_name}': 최종 {len(result[cat_name])}개")
+        Args:
+            limit: False이면 max_items로 자르지 않고 병합 결과 전체 반환 (랭킹 단계용)
 
-        return result
+        Returns:
+            카테고리별 뉴스 딕셔너리
+        """
+        return self.merge(await self.collect_candidates(), limit=limit)
 
-    async def collect_by_source(self, source: "BaseNewsSource") -> dict[str, list[NewsItem]]:
+    async def collect_by_source(
+        self,
+        source: "BaseNewsSource",
+        limit: bool = True
+    ) -> dict[str, list[NewsItem]]:
         """특정 소스에서 모든 카테고리의 뉴스 수집
 
+        카테고리별 요청은 소스의 동시 요청 제한 안에서 병렬로 실행된다.
+
         Args:
             source: 뉴스 소스
+            limit: False이면 max_items로 자르지 않고 후보 전체 반환 (랭킹 단계용)
 
         Returns:
             카테고리별 뉴스 딕셔너리
@@ -113,28 +488,38 @@ class NewsCollector:
         result: dict[str, list[NewsItem]] = {}
 
         # 소스 설정 확인
-        source_config = self.config.sources.get(source.name)
-        if source_config and not source_config.enabled:
+        if not self._is_source_enabled(source):
             logger.warning(f"소스 '{source.name}'가 비활성화 상태입니다.")
             return result
 
         logger.info(f"소스 '{source.name}'에서 뉴스 수집 시작")
-
-        for cat_name, cat_config in self.config.categories.items():
-            if not cat_config.enabled:
-                continue
-
-            try:
-                news_items = await source.fetch_news(
-                    category=cat_name,
-                    max_items=cat_config.max_items
-                )
-                result[cat_name] = news_items
-                logger.info(f"  {cat_name}: {len(news_items)}개 수집")
-
-            except Exception as e:
-                logger.error(f"  {cat_name} 수집 실패: {e}")
-                result[cat_name] = []
+        self._bind(source)
+
+        categories = [
+            (cat_name, cat_config)
+            for cat_name, cat_config in self.config.categories.items()
+            if cat_config.enabled
+        ]
+        semaphore = self._make_semaphore(source)
+
+        # 전송 이력/유사 기사 제거로 걸러질 몫을 고려하여 여유있게 요청
+        # (후보를 받아 랭킹 단계에서 고르는 경우도 동일)
+        factor = 2 if (
+            self.seen_store is not None or self.dedup is not None or not limit
+        ) else 1
+
+        fetched = await asyncio.gather(*(
+            self._fetch(source, cat_name, cat_config.max_items * factor, semaphore)
+            for cat_name, cat_config in categories
+        ))
+
+        for (cat_name, cat_config), news_items in zip(categories, fetched):
+            if self.dedup is not None:
+                with stage(f"dedup {source.name}/{cat_name}"):
+                    unique = self.dedup.deduplicate(news_items)
+                ITEMS_DEDUPLICATED.inc(len(news_items) - len(unique), source=source.name)
+                news_items = unique
+            result[cat_name] = news_items[:cat_config.max_items] if limit else news_items
 
         total = sum(len(items) for items in result.values())
         logger.info(f"소스 '{source.name}': 총 {total}개 수집 완료")
@@ -0,0 +1,139 @@
+"""대량 보관용 압축 뉴스 아이템"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from typing import Iterable, Optional, Union
+
+from .collector import NewsItem
+from .timestamps import from_epoch, to_epoch
+
+
+# 직렬화 형식 버전 (행 구성이 바뀌면 올린다)
+FORMAT_VERSION = 1
+
+
+class CompactNewsItem:
+    """__slots__ 기반 뉴스 아이템
+
+    인스턴스 __dict__가 없고, 반복되는 category/source 문자열은 intern하여
+    모든 아이템이 같은 객체를 공유하며, 발행 시각은 정수 epoch(UTC)로 보관한다.
+    수십만 건을 메모리에 두는 보관소/캐시용이며, 수집 파이프라인은 NewsItem을 사용한다.
+    """
+
+    __slots__ = ("title", "link", "category", "source", "summary", "published_ts")
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        category: str,
+        source: str,
+        summary: Optional[str] = None,
+        published_ts: Optional[int] = None
+    ):
+        self.title = title
+        self.link = link
+        self.category = sys.intern(category)
+        self.source = sys.intern(source)
+        self.summary = summary
+        self.published_ts = published_ts
+
+    def __hash__(self):
+        return hash(self.link)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactNewsItem):
+            return self.link == other.link
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactNewsItem(title={self.title!r}, link={self.link!r}, "
+            f"category={self.category!r}, source={self.source!r}, "
+            f"published_ts={self.published_ts!r})"
+        )
+
+    @property
+    def published_at(self) -> Optional[datetime]:
+        """발행 시각 (aware UTC datetime)"""
+        return from_epoch(self.published_ts)
+
+    @classmethod
+    def from_item(cls, item: NewsItem) -> "CompactNewsItem":
+        """NewsItem으로부터 생성"""
+        return cls(
+            item.title,
+            item.link,
+            item.category,
+            item.source,
+            item.summary,
+            to_epoch(item.published_at),
+        )
+
+    def to_item(self) -> NewsItem:
+        """NewsItem으로 변환"""
+        return NewsItem(
+            title=self.title,
+            link=self.link,
+            category=self.category,
+            source=self.source,
+            summary=self.summary,
+            published_at=self.published_at,
+        )
+
+    def to_row(self) -> list:
+        """직렬화용 행 (필드 순서 = __slots__)"""
+        return [self.title, self.link, self.category, self.source, self.summary, self.published_ts]
+
+    @classmethod
+    def from_row(cls, row: list) -> "CompactNewsItem":
+        """to_row() 결과로부터 복원"""
+        return cls(*row)
+
+
+CompactLike = Union[CompactNewsItem, NewsItem]
+
+
+def to_rows(items: Iterable[CompactLike]) -> list[list]:
+    """아이템 목록을 행 목록으로 변환 (NewsItem도 허용)"""
+    return [
+        (item if isinstance(item, CompactNewsItem) else CompactNewsItem.from_item(item)).to_row()
+        for item in items
+    ]
+
+
+def from_rows(rows: Iterable[list]) -> list[CompactNewsItem]:
+    """행 목록을 CompactNewsItem 목록으로 복원"""
+    return [CompactNewsItem(*row) for row in rows]
+
+
+def dumps(items: Iterable[CompactLike]) -> bytes:
+    """아이템 목록 직렬화
+
+    키 이름을 반복하지 않는 행 배열 JSON으로 기록하여
+    to_dict() 기반 JSON보다 작고 빠르게 읽고 쓸 수 있다.
+
+    Args:
+        items: 뉴스 아이템
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    payload = {"v": FORMAT_VERSION, "rows": to_rows(items)}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> list[CompactNewsItem]:
+    """dumps() 결과 역직렬화
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 지원하지 않는 버전인 경우
+    """
+    payload = json.loads(data)
+    version = payload.get("v") if isinstance(payload, dict) else None
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 아이템 직렬화 형식 (버전: {version})")
+    return from_rows(payload["rows"])
@@ -0,0 +1,256 @@
+"""유사 기사(near-duplicate) 탐지 모듈"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import defaultdict
+from hashlib import blake2b
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+from ..config import DedupConfig
+
+if TYPE_CHECKING:
+    from .collector import NewsItem
+
+
+logger = logging.getLogger(__name__)
+
+
+# 제목 앞뒤의 말머리: [속보], [단독], (종합), 【포토】 등
+_PREFIX_PATTERN = re.compile(r"^\s*(?:[\[\(【<「『][^\]\)】>」』]{1,12}[\]\)】>」』]\s*)+")
+_SUFFIX_PATTERN = re.compile(r"\s*(?:[\[\(【<「『][^\]\)】>」』]{1,12}[\]\)】>」』]\s*)+$")
+# 한글/영문/숫자 이외 문자 (구두점, 말줄임표, 공백 등)
+_NON_WORD_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+
+# 요약 비교에 필요한 최소 길이 / 비교에 사용하는 최대 길이 (정규화 후)
+_MIN_SUMMARY_LENGTH = 20
+_MAX_TEXT_LENGTH = 1000
+
+# SimHash 누적용: 64개 비트를 16비트 레인으로 펼친 바이트별 테이블
+# 해시 하나를 누적할 때 비트 64번 대신 테이블 조회 8번으로 처리한다.
+_LANE_BITS = 16
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_SPREAD_TABLE = [
+    [
+        sum(((value >> bit) & 1) << ((pos * 8 + bit) * _LANE_BITS) for bit in range(8))
+        for value in range(256)
+    ]
+    for pos in range(8)
+]
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """비교용 텍스트 정규화
+
+    말머리([속보], (종합) 등)와 " - 언론사" 접미사, 구두점/공백을 제거하고
+    영문은 소문자로 바꾼다.
+
+    Args:
+        text: 원본 제목 또는 요약
+
+    Returns:
+        정규화된 텍스트
+    """
+    if not text:
+        return ""
+
+    text = _PREFIX_PATTERN.sub("", text)
+    text = _SUFFIX_PATTERN.sub("", text)
+    if " - " in text:
+        text = text.rsplit(" - ", 1)[0]
+    return _NON_WORD_PATTERN.sub("", text.lower())
+
+
+def shingles(text: str, size: int) -> set[str]:
+    """문자 n-gram 집합 (텍스트가 짧으면 전체를 하나로)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def simhash(features: set[str]) -> int:
+    """64비트 SimHash 계산
+
+    Args:
+        features: 특징(shingle) 집합
+
+    Returns:
+        64비트 지문
+    """
+    acc = 0
+    for feature in features:
+        h = int.from_bytes(blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        acc += (
+            _SPREAD_TABLE[0][h & 0xFF]
+            + _SPREAD_TABLE[1][(h >> 8) & 0xFF]
+            + _SPREAD_TABLE[2][(h >> 16) & 0xFF]
+            + _SPREAD_TABLE[3][(h >> 24) & 0xFF]
+            + _SPREAD_TABLE[4][(h >> 32) & 0xFF]
+            + _SPREAD_TABLE[5][(h >> 40) & 0xFF]
+            + _SPREAD_TABLE[6][(h >> 48) & 0xFF]
+            + _SPREAD_TABLE[7][h >> 56]
+        )
+
+    total = len(features)
+    fingerprint = 0
+    for bit in range(64):
+        if ((acc >> (bit * _LANE_BITS)) & _LANE_MASK) * 2 > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class _BandIndex:
+    """SimHash 밴드 단위 LSH 인덱스
+
+    64비트를 (max_distance + 1)개 밴드로 나누면, 해밍 거리가 max_distance 이하인
+    두 지문은 비둘기집 원리에 의해 적어도 한 밴드가 완전히 같다.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = 64 // bands
+        self._bands = [
+            (i * width, (1 << (64 - i * width if i == bands - 1 else width)) - 1)
+            for i in range(bands)
+        ]
+        self._buckets: dict[tuple[int, int], list[tuple[int, int]]] = defaultdict(list)
+
+    def _keys(self, fingerprint: int):
+        for i, (shift, mask) in enumerate(self._bands):
+            yield i, (fingerprint >> shift) & mask
+
+    def find(self, fingerprint: int) -> Optional[int]:
+        """거리 이내의 기존 지문이 있으면 해당 그룹 번호 반환"""
+        for key in self._keys(fingerprint):
+            for other, group in self._buckets.get(key, ()):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return group
+        return None
+
+    def add(self, fingerprint: int, group: int) -> None:
+        for key in self._keys(fingerprint):
+            self._buckets[key].append((fingerprint, group))
+
+
+class NearDuplicateDetector:
+    """SimHash + LSH 기반 유사 기사 탐지기
+
+    정규화한 제목과 요약 각각의 SimHash 지문을 밴드 인덱스로 비교하여,
+    둘 중 하나라도 해밍 거리 max_distance 이내면 같은 기사로 묶는다.
+    배치 크기에 대해 대략 선형 시간에 동작한다.
+    """
+
+    def __init__(self, max_distance: int = 3, shingle_size: int = 3):
+        """
+        Args:
+            max_distance: 같은 기사로 판단할 최대 해밍 거리 (0-63)
+            shingle_size: 문자 n-gram 크기
+        """
+        self.max_distance = max(0, min(max_distance, 63))
+        self.shingle_size = max(1, shingle_size)
+
+    @classmethod
+    def from_config(cls, config: DedupConfig) -> Optional["NearDuplicateDetector"]:
+        """설정으로부터 탐지기 생성 (비활성화 시 None)"""
+        if not config.enabled:
+            return None
+        return cls(max_distance=config.max_distance, shingle_size=config.shingle_size)
+
+    def fingerprints(self, item: NewsItem) -> tuple[Optional[int], Optional[int]]:
+        """제목/요약 지문 계산 (비교할 내용이 없으면 None)"""
+        title = normalize_text(item.title)[:_MAX_TEXT_LENGTH]
+        summary = normalize_text(item.summary)[:_MAX_TEXT_LENGTH]
+
+        title_hash = simhash(shingles(title, self.shingle_size)) if title else None
+        summary_hash = None
+        if len(summary) >= _MIN_SUMMARY_LENGTH:
+            summary_hash = simhash(shingles(summary, self.shingle_size))
+        return title_hash, summary_hash
+
+    def _assign(self, items: Iterable[NewsItem]) -> Iterator[tuple[NewsItem, int, bool]]:
+        """아이템을 순서대로 그룹에 배정
+
+        Yields:
+            (아이템, 그룹 번호, 새 그룹 여부)
+        """
+        title_index = _BandIndex(self.max_distance)
+        summary_index = _BandIndex(self.max_distance)
+        groups = 0
+
+        for item in items:
+            title_hash, summary_hash = self.fingerprints(item)
+
+            group = None
+            if title_hash is not None:
+                group = title_index.find(title_hash)
+            if group is None and summary_hash is not None:
+                group = summary_index.find(summary_hash)
+
+            is_new = group is None
+            if is_new:
+                group = groups
+                groups += 1
+
+            # 그룹에 속한 기사의 지문도 등록하여 표현이 조금씩 다른 기사를 이어서 묶는다
+            if title_hash is not None:
+                title_index.add(title_hash, group)
+            if summary_hash is not None:
+                summary_index.add(summary_hash, group)
+
+            yield item, group, is_new
+
+    def cluster(self, items: list[NewsItem]) -> list[list[NewsItem]]:
+        """유사 기사 그룹화
+
+        Args:
+            items: 뉴스 아이템 (앞쪽 아이템이 그룹 대표가 됨)
+
+        Returns:
+            그룹 리스트 (첫 등장 순서 유지, 각 그룹의 첫 아이템이 대표)
+        """
+        groups: list[list[NewsItem]] = []
+        for item, group, is_new in self._assign(items):
+            if is_new:
+                groups.append([item])
+            else:
+                groups[group].append(item)
+        return groups
+
+    def iter_unique(
+        self,
+        items: Iterable[NewsItem],
+        dropped: Optional[list[NewsItem]] = None
+    ) -> Iterator[NewsItem]:
+        """그룹 대표만 순서대로 반환 (지연 평가)
+
+        그룹 배정은 앞선 아이템에만 의존하므로, 필요한 개수만큼만 소비해도
+        deduplicate() 결과의 앞부분과 같다.
+
+        Args:
+            items: 뉴스 아이템 (우선순위 순)
+            dropped: 주어지면 유사 기사로 제거된 아이템을 추가할 목록
+
+        Yields:
+            중복이 제거된 뉴스 아이템
+        """
+        for item, _, is_new in self._assign(items):
+            if is_new:
+                yield item
+            elif dropped is not None:
+                dropped.append(item)
+
+    def deduplicate(self, items: list[NewsItem]) -> list[NewsItem]:
+        """유사 기사 제거 (그룹별 대표만 유지)
+
+        Args:
+            items: 뉴스 아이템 (우선순위 순)
+
+        Returns:
+            중복이 제거된 뉴스 아이템
+        """
+        unique = list(self.iter_unique(items))
+        if len(unique) < len(items):
+            logger.debug(f"유사 기사 {len(items) - len(unique)}개 제거")
+        return unique
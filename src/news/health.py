@@ -0,0 +1,215 @@
+"""뉴스 소스 상태 추적 (서킷 브레이커 + 적응형 타임아웃)"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..config import HealthConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SourceHealth:
+    """소스 하나의 최근 응답 시간과 서킷 상태
+
+    - closed: 정상 요청. 연속 실패가 failure_threshold에 도달하면 open
+    - open: cooldown 동안 요청하지 않음. 이후 half_open으로 전환
+    - half_open: 프로브 요청 하나만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, name: str, config: HealthConfig, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            name: 소스 이름
+            config: 상태 추적 설정
+            clock: 현재 시각 함수 (epoch 초)
+        """
+        self.name = name
+        self.config = config
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.latencies: deque[float] = deque(maxlen=config.window)
+        self._probing = False
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (cooldown이 지난 open 서킷은 프로브 하나를 허용)"""
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if self.clock() - self.opened_at < self.config.cooldown_seconds:
+                return False
+            self.state = HALF_OPEN
+            self._probing = False
+            logger.info(f"[health] {self.name}: half-open, 프로브 요청 시도")
+
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def timeout(self, limit: float) -> Optional[float]:
+        """최근 응답 시간 분위수로 계산한 수집 제한 시간
+
+        분위수 × timeout_multiplier를 [min_timeout, limit] 범위로 제한한다.
+
+        Args:
+            limit: 제한 시간 상한 (소스 설정 타임아웃, 초)
+
+        Returns:
+            제한 시간 (초, 표본이 min_samples보다 적으면 None)
+        """
+        latency = self.percentile(self.config.percentile)
+        if latency is None:
+            return None
+
+        adaptive = latency * self.config.timeout_multiplier
+        return min(limit, max(self.config.min_timeout, adaptive))
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 응답 시간 분위수 (표본이 min_samples보다 적으면 None)
+
+        Args:
+            q: 분위수 (0-1)
+        """
+        if len(self.latencies) < self.config.min_samples:
+            return None
+
+        ordered = sorted(self.latencies)
+        index = math.ceil(q * len(ordered)) - 1
+        return ordered[max(0, min(index, len(ordered) - 1))]
+
+    def release(self) -> None:
+        """요청 결과 없이 끝난 프로브 해제 (다음 수집에서 다시 프로브 허용)"""
+        self._probing = False
+
+    def record_success(self, latency: float) -> None:
+        """성공한 요청 기록"""
+        self.latencies.append(latency)
+        self.failures = 0
+        self._probing = False
+        if self.state != CLOSED:
+            self.state = CLOSED
+            logger.info(f"[health] {self.name}: 회복, 서킷 closed ({latency:.2f}초)")
+
+    def record_failure(self, reason: str = "") -> None:
+        """실패한 요청 기록"""
+        self.failures += 1
+        self._probing = False
+
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.failures >= self.config.failure_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = self.clock()
+            logger.warning(
+                f"[health] {self.name}: 서킷 open, {self.config.cooldown_seconds:.0f}초 동안 제외 "
+                f"(연속 실패 {self.failures}회{', ' + reason if reason else ''})"
+            )
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_at": self.opened_at,
+            "latencies": list(self.latencies),
+        }
+
+    def load(self, data: dict) -> None:
+        """저장된 상태 복원 (진행 중이던 프로브는 open으로 되돌림)"""
+        state = data.get("state", CLOSED)
+        self.state = OPEN if state == HALF_OPEN else state
+        self.failures = int(data.get("failures", 0))
+        self.opened_at = float(data.get("opened_at", 0.0))
+        self.latencies.extend(float(v) for v in data.get("latencies", []))
+
+
+class SourceHealthRegistry:
+    """소스별 SourceHealth 모음
+
+    스케줄러 데몬 수명 동안 유지되며, path가 있으면 실행 간에 JSON 파일로 보존한다.
+    """
+
+    def __init__(
+        self,
+        config: HealthConfig,
+        path: Optional[str] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            config: 상태 추적 설정
+            path: 상태 파일 경로 (None이면 메모리에만 유지)
+            clock: 현재 시각 함수 (epoch 초)
+        """
+        self.config = config
+        self.path = Path(path) if path else None
+        self.clock = clock
+        self._sources: dict[str, SourceHealth] = {}
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: HealthConfig) -> Optional["SourceHealthRegistry"]:
+        """설정으로부터 생성 (비활성화 시 None)"""
+        if not config.enabled:
+            return None
+        return cls(config, path=config.path)
+
+    def get(self, name: str) -> SourceHealth:
+        """소스 상태 조회 (없으면 생성)"""
+        health = self._sources.get(name)
+        if health is None:
+            health = self._sources[name] = SourceHealth(name, self.config, clock=self.clock)
+        return health
+
+    def _load(self) -> None:
+        """상태 파일 로드 (손상된 파일은 무시)"""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"소스 상태 파일 로드 실패, 새로 시작합니다: {self.path} ({e})")
+            return
+
+        for name, entry in data.get("sources", {}).items():
+            self.get(name).load(entry)
+
+    def save(self) -> None:
+        """상태를 파일에 기록 (임시 파일 교체 방식)"""
+        if not self.path:
+            return
+
+        data = {"sources": {name: h.to_dict() for name, h in self._sources.items()}}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"소스 상태 파일 저장 실패: {self.path} ({e})")
+
+    def summary(self) -> str:
+        """로그용 상태 요약"""
+        return ", ".join(
+            f"{name}={h.state}" + (f"(실패 {h.failures})" if h.failures else "")
+            for name, h in sorted(self._sources.items())
+        )
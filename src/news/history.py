@@ -0,0 +1,183 @@
+"""전송 이력 저장소"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..config import HistoryConfig
+from .collector import NewsItem
+
+
+logger = logging.getLogger(__name__)
+
+
+# 같은 기사를 가리키는 링크를 구분하지 않도록 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "ocid"}
+
+# SQLite IN 절 변수 개수 제한을 넘지 않기 위한 배치 크기
+_QUERY_BATCH = 500
+
+
+def canonical_link(link: str) -> str:
+    """기사 링크 정규화
+
+    스킴/호스트 소문자화, 프래그먼트 및 추적용 파라미터(utm_* 등) 제거,
+    끝 슬래시 제거를 수행한다.
+
+    Args:
+        link: 원본 링크
+
+    Returns:
+        정규화된 링크
+    """
+    try:
+        parts = urlsplit(link.strip())
+    except ValueError:
+        return link.strip()
+
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        query,
+        ""
+    ))
+
+
+class SeenStore:
+    """SQLite(WAL) 기반 전송 기사 저장소
+
+    정규화된 링크를 기본 키로 전송 시각을 저장하여,
+    이미 전송한 기사를 다음 실행에서 걸러낸다.
+    """
+
+    def __init__(self, path: str, retention_days: float = 7.0):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (":memory:" 가능)
+            retention_days: 이력 보관 기간 (일)
+        """
+        self.path = path
+        self.retention_days = retention_days
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS delivered ("
+            " link TEXT PRIMARY KEY,"
+            " delivered_at INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_delivered_at ON delivered(delivered_at)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: HistoryConfig) -> Optional["SeenStore"]:
+        """설정으로부터 저장소 생성 (비활성화 또는 열기 실패 시 None)"""
+        if not config.enabled:
+            return None
+        try:
+            return cls(config.path, retention_days=config.retention_days)
+        except sqlite3.Error as e:
+            logger.warning(f"전송 이력 저장소를 열 수 없습니다: {config.path} ({e})")
+            return None
+
+    def _seen_links(self, links: list[str]) -> set[str]:
+        """저장소에 있는 링크 집합 조회"""
+        seen: set[str] = set()
+        for i in range(0, len(links), _QUERY_BATCH):
+            batch = links[i:i + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT link FROM delivered WHERE link IN ({placeholders})",
+                batch
+            )
+            seen.update(row[0] for row in rows)
+        return seen
+
+    def filter_unseen(self, items: list[NewsItem]) -> list[NewsItem]:
+        """이미 전송한 기사 제외
+
+        Args:
+            items: 수집된 뉴스 아이템
+
+        Returns:
+            전송 이력이 없는 뉴스 아이템
+        """
+        if not items:
+            return items
+
+        links = [canonical_link(item.link) for item in items]
+        seen = self._seen_links(list(set(links)))
+        if not seen:
+            return items
+
+        return [item for item, link in zip(items, links) if link not in seen]
+
+    def mark_delivered(
+        self,
+        items: Iterable[NewsItem],
+        delivered_at: Optional[float] = None
+    ) -> None:
+        """전송 완료 기록
+
+        Args:
+            items: 전송한 뉴스 아이템
+            delivered_at: 전송 시각 (epoch 초, None이면 현재)
+        """
+        timestamp = int(delivered_at if delivered_at is not None else time.time())
+        rows = [(canonical_link(item.link), timestamp) for item in items if item.link]
+        if not rows:
+            return
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO delivered (link, delivered_at) VALUES (?, ?)",
+                rows
+            )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """보관 기간이 지난 이력 삭제
+
+        Args:
+            now: 기준 시각 (epoch 초, None이면 현재)
+
+        Returns:
+            삭제된 항목 수
+        """
+        cutoff = int((now if now is not None else time.time()) - self.retention_days * 86400)
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM delivered WHERE delivered_at < ?",
+                (cutoff,)
+            )
+        if cursor.rowcount:
+            logger.info(f"전송 이력 {cursor.rowcount}개 정리 (보관 {self.retention_days}일)")
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        self._conn.close()
+
+    def __enter__(self) -> "SeenStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
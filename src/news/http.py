@@ -0,0 +1,112 @@
+"""뉴스 소스용 HTTP 클라이언트 관리"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from typing import Optional, TYPE_CHECKING
+
+import httpx
+
+from ..config import SourceConfig
+
+if TYPE_CHECKING:
+    from .cassette import Cassette
+
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_client(
+    source_config: Optional[SourceConfig] = None,
+    cassette: Optional["Cassette"] = None
+) -> httpx.AsyncClient:
+    """소스 설정으로 keep-alive 연결 풀을 가진 클라이언트 생성
+
+    Args:
+        source_config: 소스 설정 (None이면 기본값)
+        cassette: 요청을 기록/재생할 카세트 (None이면 실제 네트워크만 사용)
+
+    Returns:
+        httpx 비동기 클라이언트
+    """
+    config = source_config or SourceConfig()
+
+    http2 = config.http2
+    if http2 and not _http2_available():
+        logger.warning("h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install h2)")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+    # 카세트 사용 시 전송 계층을 교체 (녹화: 실제 전송을 감싸서 기록, 재생: 네트워크 없음)
+    transport = None
+    if cassette is not None:
+        transport = cassette.transport(httpx.AsyncHTTPTransport(limits=limits, http2=http2))
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(config.timeout),
+        limits=limits,
+        http2=http2,
+        follow_redirects=True,
+        transport=transport,
+    )
+
+
+class HttpClientPool:
+    """소스별 공유 HTTP 클라이언트 풀
+
+    실행 1회 또는 데몬 전체 수명 동안 클라이언트를 유지하여
+    DNS 조회, TCP 연결, TLS 핸드셰이크를 재사용한다.
+    """
+
+    def __init__(
+        self,
+        sources_config: Optional[dict[str, SourceConfig]] = None,
+        cassette: Optional["Cassette"] = None
+    ):
+        """
+        Args:
+            sources_config: 소스별 설정 (news.sources)
+            cassette: 모든 소스 요청을 기록/재생할 카세트
+        """
+        self.sources_config = sources_config or {}
+        self.cassette = cassette
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, source_name: str) -> httpx.AsyncClient:
+        """소스용 클라이언트 반환 (없으면 생성)
+
+        Args:
+            source_name: 소스 이름
+
+        Returns:
+            공유 클라이언트
+        """
+        client = self._clients.get(source_name)
+        if client is None or client.is_closed:
+            client = build_client(self.sources_config.get(source_name), self.cassette)
+            self._clients[source_name] = client
+            logger.debug(f"HTTP 클라이언트 생성: {source_name}")
+        return client
+
+    async def aclose(self) -> None:
+        """모든 클라이언트 종료"""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    async def __aenter__(self) -> "HttpClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
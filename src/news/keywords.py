@@ -0,0 +1,155 @@
+"""다중 키워드 매칭 (Aho-Corasick) 및 카테고리 키워드 필터"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from ..config import CategoryConfig
+
+if TYPE_CHECKING:
+    from .collector import NewsItem
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 오토마톤
+
+    키워드 집합을 한 번 컴파일해 두고, 텍스트를 한 번만 훑어서
+    포함된 모든 키워드를 찾는다 (텍스트 길이 + 일치 수에 비례).
+    영문은 대소문자를 구분하지 않는다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: 키워드 목록 (공백/중복 제거)
+        """
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(
+            k.strip().lower() for k in keywords if k and k.strip()
+        ))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _build(self) -> None:
+        """트라이 구성 후 BFS로 실패 링크와 출력 집합 계산"""
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # 실패 링크 쪽에서 끝나는 키워드도 함께 출력
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def find(self, text: str) -> set[str]:
+        """텍스트에 포함된 키워드 집합
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            일치한 키워드 (소문자)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+
+        return {self.keywords[i] for i in found}
+
+
+@dataclass(frozen=True)
+class KeywordHits:
+    """아이템 하나의 키워드 일치 결과"""
+    keywords: frozenset[str]  # CategoryConfig.keywords 중 일치
+    include: frozenset[str]   # include 중 일치
+    exclude: frozenset[str]   # exclude 중 일치
+
+
+class CategoryMatcher:
+    """카테고리 키워드(keywords / include / exclude) 매처
+
+    세 목록을 하나의 오토마톤으로 컴파일하여 아이템마다 제목과 요약을
+    한 번만 훑고, 목록별로 어떤 키워드가 일치했는지 돌려준다.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str] = (),
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = ()
+    ):
+        """
+        Args:
+            keywords: 랭킹에 사용하는 카테고리 키워드
+            include: 하나 이상 포함해야 통과하는 키워드 (비어있으면 모두 통과)
+            exclude: 하나라도 포함되면 제외하는 키워드
+        """
+        self.keywords = frozenset(k.strip().lower() for k in keywords if k and k.strip())
+        self.include = frozenset(k.strip().lower() for k in include if k and k.strip())
+        self.exclude = frozenset(k.strip().lower() for k in exclude if k and k.strip())
+        self.automaton = KeywordAutomaton(sorted(self.keywords | self.include | self.exclude))
+
+    @property
+    def filters(self) -> bool:
+        """include/exclude 필터가 있는지 여부"""
+        return bool(self.include or self.exclude)
+
+    def match(self, item: NewsItem) -> KeywordHits:
+        """제목과 요약에서 키워드 검색"""
+        found = self.automaton.find(f"{item.title}\n{item.summary or ''}")
+        return KeywordHits(
+            keywords=frozenset(found & self.keywords),
+            include=frozenset(found & self.include),
+            exclude=frozenset(found & self.exclude),
+        )
+
+    def accepts(self, hits: KeywordHits) -> bool:
+        """필터 통과 여부 (exclude 없음 + include가 있으면 하나 이상 일치)"""
+        if hits.exclude:
+            return False
+        return not self.include or bool(hits.include)
+
+
+def category_matcher(config: CategoryConfig) -> Optional[CategoryMatcher]:
+    """카테고리 설정으로 매처 컴파일 (호출하는 쪽에서 카테고리별로 보관하여 재사용)
+
+    Args:
+        config: 카테고리 설정
+
+    Returns:
+        매처 (키워드가 하나도 없으면 None)
+    """
+    if not (config.keywords or config.include or config.exclude):
+        return None
+    return CategoryMatcher(config.keywords, config.include, config.exclude)
@@ -0,0 +1,87 @@
+"""소스별 수집 결과 병합 (소스별 정렬 + k-way 힙 병합)"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from typing import Callable, Iterator, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .collector import NewsItem
+
+
+# 합성 정렬 키 구성 요소 → (소스 우선순위, 아이템, 교차 보도 수) → 작을수록 앞
+RANK_KEYS: dict[str, Callable[[int, NewsItem, int], int]] = {
+    "priority": lambda priority, item, corroboration: priority,         # 낮은 값 우선
+    "recency": lambda priority, item, corroboration: -item.published_ts,  # 최신 우선
+    "corroboration": lambda priority, item, corroboration: -corroboration,  # 여러 소스 보도 우선
+}
+
+DEFAULT_RANK_BY = ("priority", "recency", "corroboration")
+
+
+def _sorted_stream(
+    stream_index: int,
+    priority: int,
+    items: list[NewsItem],
+    getters: list[Callable[[int, NewsItem, int], int]],
+    corroboration: Counter[str]
+) -> list[tuple[tuple[int, ...], int, int, NewsItem]]:
+    """한 소스의 아이템을 (키, 소스 순서, 소스 내 순서, 아이템) 순으로 정렬
+
+    소스 순서와 소스 내 순서가 항목마다 달라 아이템끼리는 비교하지 않으며,
+    키가 같으면 등록/수집 순서를 유지한다.
+    """
+    entries = [
+        (
+            tuple(get(priority, item, corroboration[item.link]) for get in getters),
+            stream_index,
+            position,
+            item,
+        )
+        for position, item in enumerate(items)
+    ]
+    entries.sort()
+    return entries
+
+
+def iter_top(
+    streams: Sequence[tuple[int, list[NewsItem]]],
+    rank_by: Sequence[str] = DEFAULT_RANK_BY
+) -> Iterator[NewsItem]:
+    """소스별 결과를 합성 키 순서로 하나씩 반환
+
+    소스는 페이지/피드 순서로 결과를 주므로 소스마다 한 번 키 순서로 정렬한 뒤,
+    heapq.merge로 k개 소스 스트림을 병합한다. 힙에는 소스별 맨 앞 항목만 있어
+    크기가 소스 수 k로 유지되고, 하나를 꺼낼 때마다 O(log k)이다.
+
+    전체 비용은 소스별 정렬이 좌우하여 최악의 경우 O(n log n)이다. 정렬은 이미
+    정렬된 구간을 그대로 이어 쓰므로(Timsort), 최신순 피드처럼 키 순서로 오는
+    소스는 O(m)에 끝나고 그때는 병합의 O(n log k)가 전체 비용이 된다.
+    같은 링크는 가장 앞선 하나만 반환한다.
+
+    Args:
+        streams: (소스 우선순위, 해당 소스의 아이템 목록) 리스트
+        rank_by: 키 구성 순서 (RANK_KEYS 이름)
+
+    Yields:
+        순위순 뉴스 아이템
+    """
+    getters = [RANK_KEYS[name] for name in rank_by]
+
+    # 링크별로 보도한 소스 수
+    corroboration: Counter[str] = Counter()
+    for _, items in streams:
+        corroboration.update({item.link for item in items})
+
+    merged = heapq.merge(*(
+        _sorted_stream(stream_index, priority, items, getters, corroboration)
+        for stream_index, (priority, items) in enumerate(streams)
+    ))
+
+    seen: set[str] = set()
+    for _, _, _, item in merged:
+        if item.link in seen:
+            continue
+        seen.add(item.link)
+        yield item
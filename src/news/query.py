@@ -0,0 +1,140 @@
+"""키워드 검색 쿼리 계획 모듈"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .collector import NewsItem
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """검색 요청 하나 (키워드 + 페이지 범위)"""
+    keyword: str
+    start: int = 1      # 1부터 시작하는 결과 위치
+    display: int = 10   # 요청 결과 개수
+
+
+class QueryPlanner:
+    """카테고리 키워드 목록을 검색 요청 목록으로 변환
+
+    키워드마다 max_items개까지 결과를 요청하고, page_size를 넘으면
+    start 파라미터로 여러 페이지 요청으로 나눈다.
+    """
+
+    def __init__(self, page_size: Optional[int] = None, max_start: Optional[int] = None):
+        """
+        Args:
+            page_size: 요청 한 번의 최대 결과 수 (None이면 페이지 분할 없음)
+            max_start: start 파라미터 최대값 (API 제한)
+        """
+        self.page_size = page_size
+        self.max_start = max_start
+
+    def plan(self, keywords: list[str], max_items: int) -> list[SearchQuery]:
+        """검색 요청 목록 생성
+
+        Args:
+            keywords: 검색 키워드 목록 (중복/공백 제거)
+            max_items: 키워드별 최대 결과 수
+
+        Returns:
+            검색 요청 목록
+        """
+        unique_keywords = [k.strip() for k in dict.fromkeys(keywords) if k and k.strip()]
+        queries: list[SearchQuery] = []
+
+        for keyword in unique_keywords:
+            if not self.page_size:
+                queries.append(SearchQuery(keyword, 1, max_items))
+                continue
+
+            for page in range(math.ceil(max_items / self.page_size)):
+                start = page * self.page_size + 1
+                if self.max_start is not None and start > self.max_start:
+                    break
+                display = min(self.page_size, max_items - page * self.page_size)
+                queries.append(SearchQuery(keyword, start, display))
+
+        return queries
+
+
+def merge_ranked(
+    results: list[list[NewsItem]],
+    max_items: int,
+    starts: Optional[list[int]] = None
+) -> list[NewsItem]:
+    """여러 검색 결과를 하나의 순위 목록으로 병합
+
+    여러 키워드에서 함께 검색된 기사를 우선하고, 같으면 검색 결과 전체에서의
+    가장 앞선 순위를 기준으로 정렬한다. 페이지로 나눈 요청은 start 위치를 더해
+    뒤 페이지의 결과가 앞 페이지의 상위 결과와 같은 순위가 되지 않게 한다.
+
+    Args:
+        results: 요청별 결과 목록
+        max_items: 최대 개수
+        starts: 요청별 SearchQuery.start (None이면 모두 1)
+
+    Returns:
+        순위순 뉴스 아이템 (링크 기준 중복 제거)
+    """
+    hits: dict[str, int] = {}
+    best_rank: dict[str, int] = {}
+    items: dict[str, NewsItem] = {}
+
+    for index, result in enumerate(results):
+        offset = starts[index] - 1 if starts is not None else 0
+        for rank, item in enumerate(result, start=offset):
+            link = item.link
+            if link not in items:
+                items[link] = item
+                best_rank[link] = rank
+                hits[link] = 0
+            hits[link] += 1
+            best_rank[link] = min(best_rank[link], rank)
+
+    ranked = sorted(items, key=lambda link: (-hits[link], best_rank[link]))
+    return [items[link] for link in ranked[:max_items]]
+
+
+class RateLimiter:
+    """토큰 버킷 방식 요청 속도 제한기
+
+    초당 rate개의 요청을 허용하며, 최대 burst개까지 몰아서 보낼 수 있다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하면 제한 없음)
+            burst: 버킷 크기 (None이면 max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """요청 하나를 보낼 수 있을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
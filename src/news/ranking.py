@@ -0,0 +1,180 @@
+"""브리핑 기사 선정을 위한 점수 계산 모듈"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import time
+from typing import Optional, TYPE_CHECKING
+
+from ..config import NewsConfig
+from .collector import NewsItem, source_name
+from .history import canonical_link
+from .keywords import category_matcher
+
+if TYPE_CHECKING:
+    from .dedup import NearDuplicateDetector
+
+
+class NewsRanker:
+    """최신성, 교차 보도 수, 키워드 일치, 소스 우선순위로 기사 점수 계산
+
+    설정에서 가중치, 카테고리별 키워드, 소스별 우선순위 점수, 감쇠 상수를
+    한 번만 계산해 두고, 카테고리 단위 배치를 특징 열(column)별로 계산한 뒤
+    가중합으로 점수를 낸다.
+    """
+
+    def __init__(self, config: NewsConfig, detector: Optional["NearDuplicateDetector"] = None):
+        """
+        Args:
+            config: 뉴스 설정 (ranking, categories, sources)
+            detector: 교차 보도 판단에 사용할 유사 기사 탐지기 (None이면 링크 기준)
+        """
+        ranking = config.ranking
+        self.weights = (
+            ranking.recency_weight,
+            ranking.corroboration_weight,
+            ranking.keyword_weight,
+            ranking.priority_weight,
+        )
+        # 반감기 h시간 → exp(-age * ln2 / h)
+        self.decay = math.log(2) / (max(ranking.half_life_hours, 0.01) * 3600)
+        self.max_items = {
+            name: cat.max_items for name, cat in config.categories.items() if cat.enabled
+        }
+        # 카테고리 키워드 매처 (keywords 목록이 있는 카테고리만, 생성 시 한 번 컴파일)
+        self.matchers = {
+            name: matcher
+            for name, cat in config.categories.items()
+            if (matcher := category_matcher(cat)) is not None and matcher.keywords
+        }
+        # priority 1 → 1.0, 2 → 0.5, ...
+        self.priority_scores = {
+            name: 1.0 / max(1, src.priority) for name, src in config.sources.items()
+        }
+        self.source_count = max(1, sum(1 for src in config.sources.values() if src.enabled))
+        self.detector = detector
+
+    @classmethod
+    def from_config(
+        cls,
+        config: NewsConfig,
+        detector: Optional["NearDuplicateDetector"] = None
+    ) -> Optional["NewsRanker"]:
+        """설정으로부터 생성 (비활성화 시 None)"""
+        if not config.ranking.enabled:
+            return None
+        return cls(config, detector=detector)
+
+    def corroboration(
+        self,
+        candidates: dict[str, dict[str, list[NewsItem]]]
+    ) -> dict[str, int]:
+        """같은 기사를 수집한 소스 수
+
+        유사 기사 탐지기가 있으면 다른 URL의 같은 기사도 하나로 묶는다.
+
+        Args:
+            candidates: 소스 → 카테고리 → 후보 아이템
+
+        Returns:
+            정규화 링크 → 보도한 소스 수
+        """
+        items = [
+            item
+            for by_category in candidates.values()
+            for news_items in by_category.values()
+            for item in news_items
+        ]
+
+        if self.detector is not None:
+            groups = self.detector.cluster(items)
+        else:
+            by_link: dict[str, list[NewsItem]] = {}
+            for item in items:
+                by_link.setdefault(canonical_link(item.link), []).append(item)
+            groups = list(by_link.values())
+
+        counts: dict[str, int] = {}
+        for group in groups:
+            count = len({source_name(item.source) for item in group})
+            for item in group:
+                counts[canonical_link(item.link)] = count
+        return counts
+
+    def score(
+        self,
+        items: list[NewsItem],
+        category: str,
+        corroboration: Optional[dict[str, int]] = None,
+        now: Optional[float] = None
+    ) -> list[float]:
+        """아이템 배치 점수 계산
+
+        Args:
+            items: 같은 카테고리의 아이템
+            category: 카테고리 이름 (키워드 선택)
+            corroboration: 정규화 링크 → 보도 소스 수 (None이면 모두 1)
+            now: 기준 시각 (epoch 초, None이면 현재)
+
+        Returns:
+            아이템별 점수 (items와 같은 순서)
+        """
+        now = time.time() if now is None else now
+        decay = self.decay
+        matcher = self.matchers.get(category)
+        spread = max(1, self.source_count - 1)
+        counts = corroboration or {}
+
+        # 특징 열 계산 (모두 0-1 범위)
+        # 발행 시각이 없는 아이템(네이버 목록 등)은 0점 대신 배치 내 발행 시각이
+        # 있는 아이템의 중앙값을 주어 최신성에서 유리하지도 불리하지도 않게 한다
+        recency = [
+            math.exp(-max(0.0, now - item.published_ts) * decay) if item.published_ts else None
+            for item in items
+        ]
+        dated = [r for r in recency if r is not None]
+        neutral = statistics.median(dated) if dated else 0.0
+        recency = [neutral if r is None else r for r in recency]
+        corroborated = [
+            min(1.0, (counts.get(canonical_link(item.link), 1) - 1) / spread)
+            for item in items
+        ]
+        if matcher is not None:
+            total = len(matcher.keywords)
+            matched = [len(matcher.match(item).keywords) / total for item in items]
+        else:
+            matched = [0.0] * len(items)
+        priority = [self.priority_scores.get(source_name(item.source), 1.0) for item in items]
+
+        w_recency, w_corroboration, w_keywords, w_priority = self.weights
+        return [
+            w_recency * r + w_corroboration * c + w_keywords * k + w_priority * p
+            for r, c, k, p in zip(recency, corroborated, matched, priority)
+        ]
+
+    def rank(
+        self,
+        news_by_category: dict[str, list[NewsItem]],
+        corroboration: Optional[dict[str, int]] = None,
+        now: Optional[float] = None
+    ) -> dict[str, list[NewsItem]]:
+        """카테고리별 점수순 상위 max_items개 선택
+
+        점수가 같으면 원래 순서(페이지/피드 순서)를 유지한다.
+
+        Args:
+            news_by_category: 카테고리별 후보 아이템
+            corroboration: 정규화 링크 → 보도 소스 수
+            now: 기준 시각 (epoch 초, None이면 현재)
+
+        Returns:
+            카테고리별 선정 아이템
+        """
+        result: dict[str, list[NewsItem]] = {}
+        for category, items in news_by_category.items():
+            scores = self.score(items, category, corroboration, now)
+            order = sorted(range(len(items)), key=lambda i: -scores[i])
+            limit = self.max_items.get(category, len(items))
+            result[category] = [items[i] for i in order[:limit]]
+        return result
@@ -2,8 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from ..collector import NewsItem
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional, TYPE_CHECKING
+
+import httpx
+
+from ..collector import NewsItem, current_fetch_stats
+from ..query import RateLimiter
+
+if TYPE_CHECKING:
+    from ..cache import HttpValidatorCache
+    from ..health import SourceHealth
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _discard(tasks: set[asyncio.Future]) -> None:
+    """사용하지 않는 요청 취소 및 이미 받은 응답 닫기"""
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            response = await task
+        except BaseException:
+            continue
+        await response.aclose()
 
 
 class BaseNewsSource(ABC):
@@ -11,6 +39,325 @@ class BaseNewsSource(ABC):
 
     name: str = "base"
 
+    # 이 분위수의 응답 시간 안에 응답이 없으면 중복 요청(hedge)을 보낸다
+    HEDGE_PERCENTILE = 0.9
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limit: float = 0,
+        hedge_budget: int = 0,
+        max_bytes: int = 2 * 1024 * 1024
+    ):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초, 공유 클라이언트가 없을 때 사용)
+            client: 공유 HTTP 클라이언트 (None이면 요청마다 생성)
+            rate_limit: 초당 최대 요청 수 (0이면 제한 없음)
+            hedge_budget: 이 인스턴스가 보낼 수 있는 중복 요청 수 (0이면 사용 안 함)
+            max_bytes: 응답 본문 최대 바이트 수 (초과분은 잘라냄, 0이면 제한 없음)
+        """
+        self.timeout = timeout
+        self.max_bytes = max(0, max_bytes)
+        self.bytes_received = 0
+        self.hedge_budget = max(0, hedge_budget)
+        self.hedges_sent = 0
+        self.client = client
+        self.cache: Optional["HttpValidatorCache"] = None
+        self.health: Optional["SourceHealth"] = None
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.keywords: dict[str, list[str]] = {}
+
+    def set_keywords(self, keywords: dict[str, list[str]]) -> None:
+        """카테고리별 검색 키워드 주입 (CategoryConfig.keywords)
+
+        Args:
+            keywords: 카테고리 → 키워드 목록
+        """
+        self.keywords = {name: list(words) for name, words in keywords.items() if words}
+
+    def set_cache(self, cache: Optional["HttpValidatorCache"]) -> None:
+        """공유 HTTP 검증자 캐시 주입
+
+        Args:
+            cache: 조건부 요청 캐시 (None이면 사용 안 함)
+        """
+        self.cache = cache
+
+    def set_health(self, health: Optional["SourceHealth"]) -> None:
+        """소스 상태 추적기 주입 (요청 결과 기록 및 적응형 타임아웃)
+
+        Args:
+            health: 소스 상태 (None이면 고정 타임아웃)
+        """
+        self.health = health
+
+    def set_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """공유 HTTP 클라이언트 주입
+
+        Args:
+            client: 수집기가 소유한 공유 클라이언트
+        """
+        self.client = client
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """요청에 사용할 클라이언트
+
+        공유 클라이언트가 주입되어 있으면 그대로 사용하고(종료하지 않음),
+        없으면 단발성 클라이언트를 만들어 사용 후 닫는다.
+        """
+        if self.client is not None and not self.client.is_closed:
+            yield self.client
+            return
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True
+        ) as client:
+            yield client
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """HTTP 요청
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: httpx 요청 인자 (headers, params 등)
+
+        Returns:
+            응답 객체
+        """
+        await self.rate_limiter.acquire()
+        self._apply_timeout(kwargs)
+        started = time.monotonic()
+        async with self._session() as client:
+            try:
+                response = await self._send(client, method, url, kwargs, stream=False)
+            except httpx.TransportError as e:
+                self._record_error(e)
+                raise
+            self._record_response(response, time.monotonic() - started)
+            return response
+
+    @asynccontextmanager
+    async def _stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """본문을 읽지 않은 상태의 스트리밍 응답
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: httpx 요청 인자 (headers, params 등)
+
+        Yields:
+            스트리밍 응답 객체 (블록을 벗어나면 닫힘)
+        """
+        await self.rate_limiter.acquire()
+        self._apply_timeout(kwargs)
+        started = time.monotonic()
+        async with self._session() as client:
+            try:
+                response = await self._send(client, method, url, kwargs, stream=True)
+            except httpx.TransportError as e:
+                self._record_error(e)
+                raise
+            self._record_response(response, time.monotonic() - started)
+
+            try:
+                yield response
+            except httpx.TransportError as e:
+                self._record_error(e)
+                raise
+            finally:
+                await response.aclose()
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        kwargs: dict,
+        stream: bool
+    ) -> httpx.Response:
+        """요청 전송 (조건을 만족하면 hedged 요청)
+
+        GET 요청이 최근 응답 시간의 HEDGE_PERCENTILE 분위수 안에 응답하지 않으면
+        같은 요청을 한 번 더 보내고 먼저 도착한 응답을 사용한다.
+        나머지 요청은 취소하고 응답을 닫는다. 중복 요청 수는 hedge_budget으로 제한한다.
+        """
+        options = dict(kwargs)
+        follow_redirects = options.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+
+        def send() -> asyncio.Future:
+            request = client.build_request(method, url, **options)
+            return asyncio.ensure_future(
+                client.send(request, stream=stream, follow_redirects=follow_redirects)
+            )
+
+        pending = {send()}
+        try:
+            delay = self._hedge_delay(method)
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self.hedges_sent < self.hedge_budget:
+                    self.hedges_sent += 1
+                    logger.debug(
+                        f"{self.name}: {delay:.2f}초 내 응답 없음, 중복 요청 전송 "
+                        f"({self.hedges_sent}/{self.hedge_budget}): {url}"
+                    )
+                    await self.rate_limiter.acquire()
+                    pending.add(send())
+
+            # 먼저 성공한 응답 사용 (모두 실패하면 마지막 오류)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        pending |= done - {task}
+                        return task.result()
+                    error = task.exception()
+            raise error
+
+        finally:
+            await _discard(pending)
+
+    def _hedge_delay(self, method: str) -> Optional[float]:
+        """hedged 요청 대기 시간 (사용하지 않으면 None)"""
+        if (
+            method.upper() != "GET"
+            or self.health is None
+            or self.hedges_sent >= self.hedge_budget
+        ):
+            return None
+        return self.health.percentile(self.HEDGE_PERCENTILE)
+
+    def _apply_timeout(self, kwargs: dict) -> None:
+        """최근 응답 시간 기반 타임아웃 적용 (호출자가 지정한 경우 제외)"""
+        if self.health is None or "timeout" in kwargs:
+            return
+        timeout = self.health.timeout(self.timeout)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+    def _record_response(self, response: httpx.Response, latency: float) -> None:
+        """응답 헤더 수신 결과 기록 (5xx는 실패)"""
+        if self.health is None:
+            return
+        if response.status_code >= 500:
+            self.health.record_failure(f"HTTP {response.status_code}")
+        else:
+            self.health.record_success(latency)
+
+    def _record_error(self, error: Exception) -> None:
+        """연결/타임아웃 오류 기록"""
+        if self.health is not None:
+            self.health.record_failure(type(error).__name__)
+
+    async def _iter_body(self, response: httpx.Response) -> AsyncIterator[bytes]:
+        """스트리밍 응답 본문을 max_bytes까지 청크 단위로 읽기
+
+        제한을 넘으면 경고를 남기고 초과분을 버린 뒤 읽기를 멈춘다.
+        받은 바이트 수는 소스 누적값과 현재 fetch 통계에 기록한다.
+        """
+        received = 0
+        async for chunk in response.aiter_bytes():
+            if self.max_bytes and received + len(chunk) > self.max_bytes:
+                chunk = chunk[:self.max_bytes - received]
+                self._count_bytes(len(chunk), truncated=True)
+                logger.warning(
+                    f"{self.name}: 응답이 크기 제한({self.max_bytes}바이트)을 넘어 "
+                    f"잘라서 사용합니다: {response.url}"
+                )
+                if chunk:
+                    yield chunk
+                return
+
+            received += len(chunk)
+            self._count_bytes(len(chunk))
+            yield chunk
+
+    def _count_bytes(self, size: int, truncated: bool = False) -> None:
+        """받은 본문 바이트 기록"""
+        self.bytes_received += size
+        stats = current_fetch_stats.get()
+        if stats is not None:
+            stats.bytes_received += size
+            stats.truncated += int(truncated)
+
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        """스트리밍 응답 본문을 max_bytes까지 읽기"""
+        body = bytearray()
+        async for chunk in self._iter_body(response):
+            body.extend(chunk)
+        return bytes(body)
+
+    async def _read_text(self, response: httpx.Response) -> str:
+        """스트리밍 응답 본문을 max_bytes까지 텍스트로 읽기"""
+        body = await self._read_body(response)
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
+    async def _fetch_cached(
+        self,
+        url: str,
+        max_items: int,
+        parse: Callable[[httpx.Response], Awaitable[list[NewsItem]]],
+        headers: Optional[dict[str, str]] = None,
+        **kwargs
+    ) -> list[NewsItem]:
+        """조건부 GET 요청 후 파싱
+
+        캐시에 검증자가 있으면 If-None-Match / If-Modified-Since를 보내고,
+        304 응답이면 저장된 NewsItem 목록을 그대로 반환한다.
+        응답은 스트리밍으로 열리므로 parse는 본문을 점진적으로 읽을 수 있다.
+
+        Args:
+            url: 요청 URL
+            max_items: 최대 수집 개수
+            parse: 스트리밍 응답을 NewsItem 리스트로 변환하는 코루틴 함수
+            headers: 요청 헤더
+            **kwargs: httpx 요청 인자
+
+        Returns:
+            뉴스 아이템 리스트
+        """
+        request_headers = dict(headers or {})
+        if self.cache is not None:
+            request_headers.update(self.cache.conditional_headers(url, max_items))
+
+        async with self._stream("GET", url, headers=request_headers, **kwargs) as response:
+            if response.status_code == 304 and self.cache is not None:
+                cached = self.cache.cached_items(url, max_items)
+                if cached is not None:
+                    logger.debug(f"{self.name}: 변경 없음 (304), 캐시 사용: {url}")
+                    return cached
+
+            response.raise_for_status()
+            items = await parse(response)
+
+        if self.cache is not None:
+            self.cache.store(url, response.headers, items, max_items)
+
+        return items
+
+    async def stream_news(self, category: str, max_items: int) -> AsyncIterator[NewsItem]:
+        """뉴스를 파싱되는 대로 하나씩 반환
+
+        기본 구현은 fetch_news 결과 리스트를 순서대로 내보내는 어댑터이며,
+        점진적으로 파싱할 수 있는 소스는 재정의하여 아이템을 먼저 내보낼 수 있다.
+        소비자가 중간에 멈추면(aclose) 남은 작업은 수행하지 않는다.
+
+        Args:
+            category: 뉴스 카테고리
+            max_items: 최대 수집 개수
+
+        Yields:
+            뉴스 아이템
+        """
+        for item in await self.fetch_news(category=category, max_items=max_items):
+            yield item
+
     @abstractmethod
     async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
         """뉴스 수집
@@ -2,22 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import html
 import logging
-from datetime import datetime
-from typing import Optional
-from urllib.parse import quote
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import quote, urlsplit
 
 import httpx
 import feedparser
-from bs4 import BeautifulSoup
 
 from .base import BaseNewsSource
 from ..collector import NewsItem
+from ..query import QueryPlanner, merge_ranked
+from ..timestamps import to_utc
+from ...profiling import stage
+
+if TYPE_CHECKING:
+    from ..cache import UrlResolutionCache
 
 
 logger = logging.getLogger(__name__)
 
 
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+
+def _strip_html(text: str, limit: int = 200) -> str:
+    """HTML 태그 제거 및 엔티티 복원"""
+    return html.unescape(_TAG_PATTERN.sub("", text)).strip()[:limit]
+
+
+def _parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    """RFC 822 날짜를 aware UTC datetime으로 변환"""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+    return to_utc(parsed)
+
+
 class GoogleNewsSource(BaseNewsSource):
     """구글 뉴스 RSS 기반 수집기"""
 
@@ -38,12 +67,49 @@ class GoogleNewsSource(BaseNewsSource):
         "culture": {"type": "search", "query": "문화 연예 뉴스"},
     }
 
-    def __init__(self, timeout: int = 10):
-        self.timeout = timeout
+    # 리다이렉트 링크 호스트
+    REDIRECT_HOST = "news.google.com"
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        resolve_links: bool = False,
+        resolve_concurrency: int = 8,
+        url_cache: Optional["UrlResolutionCache"] = None,
+        rate_limit: float = 0,
+        hedge_budget: int = 0,
+        max_bytes: int = 2 * 1024 * 1024
+    ):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초)
+            client: 공유 HTTP 클라이언트
+            resolve_links: 수집한 링크를 실제 기사 URL로 변환할지 여부
+            resolve_concurrency: 링크 변환 동시 요청 수
+            url_cache: 변환 결과를 실행 간에 재사용할 캐시
+            rate_limit: 초당 최대 요청 수 (0이면 제한 없음)
+            hedge_budget: 실행당 최대 중복(hedged) 요청 수 (0이면 사용 안 함)
+            max_bytes: 응답 본문 최대 바이트 수 (0이면 제한 없음)
+        """
+        super().__init__(
+            timeout=timeout,
+            client=client,
+            rate_limit=rate_limit,
+            hedge_budget=hedge_budget,
+            max_bytes=max_bytes
+        )
+        self.planner = QueryPlanner()
+        self.resolve_links = resolve_links
+        self.resolve_concurrency = max(1, resolve_concurrency)
+        self.url_cache = url_cache
 
     async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
         """구글 뉴스 RSS에서 뉴스 수집
 
+        카테고리 키워드(CategoryConfig.keywords)가 있으면 키워드별 검색 RSS를
+        동시에 요청하여 하나의 순위 목록으로 병합하고, 없으면 기본 토픽/검색어를 사용한다.
+
         Args:
             category: 뉴스 카테고리
             max_items: 최대 수집 개수
@@ -51,35 +117,45 @@ class GoogleNewsSource(BaseNewsSource):
         Returns:
             뉴스 아이템 리스트
         """
+        keywords = self.keywords.get(category)
         config = self.CATEGORY_CONFIG.get(category)
-        if not config:
-            logger.warning(f"지원하지 않는 카테고리: {category}")
-            return []
 
         # URL 생성
-        if config["type"] == "topic":
-            url = self.TOPIC_RSS_URL.format(topic=config["topic"])
+        if keywords:
+            urls = [
+                self.SEARCH_RSS_URL.format(query=quote(query.keyword))
+                for query in self.planner.plan(keywords, max_items)
+            ]
+        elif not config:
+            logger.warning(f"지원하지 않는 카테고리: {category}")
+            return []
+        elif config["type"] == "topic":
+            urls = [self.TOPIC_RSS_URL.format(topic=config["topic"])]
         else:
-            url = self.SEARCH_RSS_URL.format(query=quote(config["query"]))
+            urls = [self.SEARCH_RSS_URL.format(query=quote(config["query"]))]
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0"}
-                )
-                response.raise_for_status()
+        results = await asyncio.gather(*(
+            self._fetch_feed(url, category, max_items) for url in urls
+        ))
+        news_items = results[0] if len(results) == 1 else merge_ranked(results, max_items)
 
-            feed = feedparser.parse(response.text)
-            news_items = []
+        if self.resolve_links and news_items:
+            resolved = await self.resolve_google_urls([item.link for item in news_items])
+            for item in news_items:
+                item.link = resolved.get(item.link, item.link)
 
-            for entry in feed.entries[:max_items]:
-                item = self._parse_entry(entry, category)
-                if item:
-                    news_items.append(item)
+        logger.debug(f"구글 {category}: {len(news_items)}개 수집")
+        return news_items
 
-            logger.debug(f"구글 {category}: {len(news_items)}개 수집")
-            return news_items
+    async def _fetch_feed(self, url: str, category: str, max_items: int) -> list[NewsItem]:
+        """RSS 피드 하나 수집 (실패 시 빈 리스트)"""
+        try:
+            return await self._fetch_cached(
+                url,
+                max_items,
+                lambda response: self._parse_stream(response, category, max_items),
+                headers={"User-Agent": "Mozilla/5.0"}
+            )
 
         except httpx.HTTPError as e:
             logger.error(f"구글 뉴스 요청 실패: {e}")
@@ -88,6 +164,90 @@ class GoogleNewsSource(BaseNewsSource):
             logger.error(f"구글 뉴스 파싱 실패: {e}")
             return []
 
+    async def _parse_stream(
+        self,
+        response: httpx.Response,
+        category: str,
+        max_items: int
+    ) -> list[NewsItem]:
+        """스트리밍 RSS 파싱 (고속 경로)
+
+        응답 바이트를 받는 대로 XMLPullParser에 넣고 <item>이 끝날 때마다
+        필요한 필드만 추출한다. max_items개를 채우면 파싱을 멈추고,
+        XML이 깨져 있으면 받은 본문 전체를 feedparser로 다시 파싱한다.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        received = bytearray()
+        chunks = self._iter_body(response)
+        news_items: list[NewsItem] = []
+        label = f"parse {self.name}/{category}"
+
+        try:
+            async for chunk in chunks:
+                received.extend(chunk)
+
+                # 받은 조각마다의 동기 파싱 구간만 측정 (수신 대기 제외)
+                with stage(label):
+                    parser.feed(chunk)
+
+                    for _, elem in parser.read_events():
+                        if elem.tag != "item":
+                            continue
+
+                        item = self._parse_element(elem, category)
+                        elem.clear()
+                        if item:
+                            news_items.append(item)
+                            if len(news_items) >= max_items:
+                                break
+
+                if len(news_items) >= max_items:
+                    break
+
+            else:
+                parser.close()
+
+        except ET.ParseError as e:
+            logger.debug(f"구글 RSS 고속 파싱 실패, feedparser로 재시도: {e}")
+            async for chunk in chunks:
+                received.extend(chunk)
+            with stage(label):
+                return self._parse_feed(bytes(received), category, max_items)
+
+        # 남은 본문은 파싱하지 않고 비워서 keep-alive 연결을 재사용한다
+        async for _ in chunks:
+            pass
+
+        return news_items
+
+    def _parse_element(self, elem: ET.Element, category: str) -> Optional[NewsItem]:
+        """RSS <item> 요소를 NewsItem으로 변환"""
+        title = (elem.findtext("title") or "").strip()
+        link = (elem.findtext("link") or "").strip()
+        if not title or not link:
+            return None
+
+        return self._make_item(
+            title=title,
+            link=link,
+            summary=_strip_html(elem.findtext("description") or ""),
+            published_at=_parse_pub_date(elem.findtext("pubDate")),
+            category=category,
+            outlet=(elem.findtext("source") or "").strip() or None
+        )
+
+    def _parse_feed(self, content: str | bytes, category: str, max_items: int) -> list[NewsItem]:
+        """RSS 본문을 feedparser로 파싱하여 NewsItem 리스트로 변환"""
+        feed = feedparser.parse(content)
+        news_items = []
+
+        for entry in feed.entries[:max_items]:
+            item = self._parse_entry(entry, category)
+            if item:
+                news_items.append(item)
+
+        return news_items
+
     def _parse_entry(self, entry: dict, category: str) -> Optional[NewsItem]:
         """RSS 엔트리를 NewsItem으로 변환"""
         try:
@@ -99,50 +259,128 @@ class GoogleNewsSource(BaseNewsSource):
             # 요약 추출
             summary = ""
             if "summary" in entry:
-                soup = BeautifulSoup(entry.summary, "html.parser")
-                summary = soup.get_text().strip()[:200]
+                summary = _strip_html(entry.summary)
 
             # 발행 시간 파싱
             published_at = None
             if "published_parsed" in entry and entry.published_parsed:
                 try:
-                    published_at = datetime(*entry.published_parsed[:6])
+                    # feedparser의 published_parsed는 UTC 기준
+                    published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
                 except Exception:
                     pass
 
-            # 출처 추출 (제목에서 " - 출처" 형식으로 포함됨)
-            source_name = self.name
-            if " - " in title:
-                parts = title.rsplit(" - ", 1)
-                if len(parts) == 2:
-                    title = parts[0].strip()
-                    source_name = f"google/{parts[1].strip()}"
-
-            return NewsItem(
-                title=title,
-                link=link,
-                category=category,
-                source=source_name,
-                summary=summary,
-                published_at=published_at
-            )
+            return self._make_item(title, link, summary, published_at, category)
 
         except Exception as e:
             logger.debug(f"엔트리 파싱 실패: {e}")
             return None
 
+    def _make_item(
+        self,
+        title: str,
+        link: str,
+        summary: str,
+        published_at: Optional[datetime],
+        category: str,
+        outlet: Optional[str] = None
+    ) -> NewsItem:
+        """제목의 " - 출처" 접미사를 분리하여 NewsItem 생성"""
+        # 출처 추출 (제목에서 " - 출처" 형식으로 포함됨)
+        source_name = f"google/{outlet}" if outlet else self.name
+        if " - " in title:
+            parts = title.rsplit(" - ", 1)
+            if len(parts) == 2:
+                title = parts[0].strip()
+                source_name = f"google/{outlet or parts[1].strip()}"
+
+        return NewsItem(
+            title=title,
+            link=link,
+            category=category,
+            source=source_name,
+            summary=summary,
+            published_at=published_at
+        )
+
     async def resolve_google_url(self, google_url: str) -> Optional[str]:
         """구글 뉴스 리다이렉트 URL에서 실제 URL 추출
 
         Note: 구글 뉴스는 리다이렉트 URL을 사용하므로
               실제 기사 URL을 얻으려면 추가 처리 필요
         """
+        resolved = await self._resolve(google_url)
+        return resolved or google_url
+
+    async def _resolve(self, google_url: str) -> Optional[str]:
+        """리다이렉트를 따라가 최종 URL 반환
+
+        오류 응답이거나 구글 뉴스(동의 페이지 등)를 벗어나지 못한 경우는
+        실패로 보고 None을 반환한다.
+        """
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
+            response = await self._request(
+                "HEAD",
+                google_url,
                 follow_redirects=True
-            ) as client:
-                response = await client.head(google_url)
-                return str(response.url)
-        except Exception:
-            return google_url
+            )
+        except Exception as e:
+            logger.debug(f"링크 변환 실패: {google_url} ({e})")
+            return None
+
+        if not response.is_success or response.url.host == self.REDIRECT_HOST:
+            logger.debug(
+                f"링크 변환 실패: {google_url} (HTTP {response.status_code}, {response.url})"
+            )
+            return None
+        return str(response.url)
+
+    async def resolve_google_urls(self, google_urls: list[str]) -> dict[str, str]:
+        """여러 리다이렉트 URL을 동시에 변환
+
+        캐시에 있는 링크는 요청하지 않고, 나머지는 resolve_concurrency개씩
+        동시에 변환한다. 성공한 결과만 캐시에 저장한다.
+
+        Args:
+            google_urls: 구글 뉴스 링크 목록
+
+        Returns:
+            원본 URL → 실제 URL 딕셔너리 (변환 실패한 링크는 제외)
+        """
+        result: dict[str, str] = {}
+        pending: list[str] = []
+        hits = 0
+
+        for url in dict.fromkeys(google_urls):
+            if urlsplit(url).hostname != self.REDIRECT_HOST:
+                continue
+            cached = self.url_cache.get(url) if self.url_cache is not None else None
+            if cached:
+                result[url] = cached
+                hits += 1
+            else:
+                pending.append(url)
+
+        if not pending:
+            return result
+
+        semaphore = asyncio.Semaphore(self.resolve_concurrency)
+
+        async def resolve(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self._resolve(url)
+
+        resolved = await asyncio.gather(*(resolve(url) for url in pending))
+
+        for url, final_url in zip(pending, resolved):
+            if not final_url:
+                continue
+            result[url] = final_url
+            if self.url_cache is not None:
+                self.url_cache.set(url, final_url)
+
+        logger.debug(
+            f"구글 링크 변환: 캐시 {hits}개, "
+            f"요청 {len(pending)}개, 성공 {sum(1 for r in resolved if r)}개"
+        )
+        return result
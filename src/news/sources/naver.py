@@ -2,21 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
 import logging
+import math
 from datetime import datetime
 from typing import Optional
 from urllib.parse import quote
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import BaseNewsSource
 from ..collector import NewsItem
+from ..query import QueryPlanner, SearchQuery, merge_ranked
+from ..timestamps import to_utc
+from ...profiling import stage
 
 
 logger = logging.getLogger(__name__)
 
 
+# 지원하는 HTML 파서 백엔드 (BeautifulSoup tree builder 이름)
+PARSER_BACKENDS = ("lxml", "html.parser")
+
+
+def resolve_parser(name: str = "auto") -> str:
+    """HTML 파서 백엔드 결정
+
+    "auto"이면 설치된 경우 C 기반 lxml을, 아니면 내장 html.parser를 사용한다.
+
+    Args:
+        name: auto, lxml, html.parser
+
+    Returns:
+        BeautifulSoup features 이름
+    """
+    lxml_available = importlib.util.find_spec("lxml") is not None
+
+    if name == "auto":
+        return "lxml" if lxml_available else "html.parser"
+
+    if name not in PARSER_BACKENDS:
+        logger.warning(f"지원하지 않는 파서 '{name}', html.parser 사용")
+        return "html.parser"
+
+    if name == "lxml" and not lxml_available:
+        logger.warning("lxml 패키지가 없어 html.parser를 사용합니다. (pip install lxml)")
+        return "html.parser"
+
+    return name
+
+
 class NaverNewsSource(BaseNewsSource):
     """네이버 뉴스 웹 스크래핑 기반 수집기"""
 
@@ -32,7 +70,16 @@ class NaverNewsSource(BaseNewsSource):
         "tech": "105",       # IT/과학
     }
 
-    LIST_URL = "https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1={sid}"
+    LIST_URL = "https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1={sid}&page={page}"
+
+    # 목록 한 페이지당 기사 수 (헤드라인 10 + 일반 10)
+    PAGE_SIZE = 20
+
+    # 기사 목록 영역 (헤드라인 + 일반 목록)
+    LIST_SELECTOR = "ul.type06_headline li, ul.type06 li"
+    LIST_STRAINER = SoupStrainer("ul", class_=["type06_headline", "type06"])
+    REGION_START = 'class="type06'
+    REGION_END = 'class="paging"'
 
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -40,12 +87,42 @@ class NaverNewsSource(BaseNewsSource):
         "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
     }
 
-    def __init__(self, timeout: int = 10):
-        self.timeout = timeout
+    def __init__(
+        self,
+        timeout: float = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        parser: str = "auto",
+        max_pages: int = 3,
+        rate_limit: float = 0,
+        hedge_budget: int = 0,
+        max_bytes: int = 2 * 1024 * 1024
+    ):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초)
+            client: 공유 HTTP 클라이언트
+            parser: HTML 파서 백엔드 (auto, lxml, html.parser)
+            max_pages: 카테고리당 최대 목록 페이지 수
+            rate_limit: 초당 최대 요청 수 (0이면 제한 없음)
+            hedge_budget: 실행당 최대 중복(hedged) 요청 수 (0이면 사용 안 함)
+            max_bytes: 응답 본문 최대 바이트 수 (0이면 제한 없음)
+        """
+        super().__init__(
+            timeout=timeout,
+            client=client,
+            rate_limit=rate_limit,
+            hedge_budget=hedge_budget,
+            max_bytes=max_bytes
+        )
+        self.parser = resolve_parser(parser)
+        self.max_pages = max(1, max_pages)
 
     async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
         """네이버 뉴스 목록 페이지에서 뉴스 수집
 
+        max_items를 채우는 데 필요한 만큼의 페이지를 동시에 요청하고,
+        개수를 채우거나 이미 본 기사만 있는 페이지가 나오면 중단한다.
+
         Args:
             category: 뉴스 카테고리
             max_items: 최대 수집 개수
@@ -58,30 +135,56 @@ class NaverNewsSource(BaseNewsSource):
             logger.warning(f"지원하지 않는 카테고리: {category}")
             return []
 
-        url = self.LIST_URL.format(sid=sid)
+        news_items: list[NewsItem] = []
+        seen_links: set[str] = set()
+        page = 1
+
+        while page <= self.max_pages and len(news_items) < max_items:
+            # 남은 개수를 채우는 데 필요한 페이지를 한 번에 요청
+            remaining = max_items - len(news_items)
+            batch = min(self.max_pages - page + 1, math.ceil(remaining / self.PAGE_SIZE))
+            pages = await asyncio.gather(*(
+                self._fetch_page(sid, p, category, max_items)
+                for p in range(page, page + batch)
+            ))
+            page += batch
+
+            exhausted = False
+            for page_items in pages:
+                new_items = [item for item in page_items if item.link not in seen_links]
+                if not new_items:
+                    # 마지막 페이지를 넘기면 네이버는 마지막 페이지를 반복해서 보여준다
+                    exhausted = True
+                    break
+
+                for item in new_items:
+                    seen_links.add(item.link)
+                news_items.extend(new_items)
+
+            if exhausted:
+                break
+
+        logger.debug(f"네이버 {category}: {len(news_items[:max_items])}개 수집 ({page - 1}페이지)")
+        return news_items[:max_items]
+
+    async def _fetch_page(
+        self,
+        sid: str,
+        page: int,
+        category: str,
+        max_items: int
+    ) -> list[NewsItem]:
+        """목록 페이지 하나 수집 (실패 시 빈 리스트)"""
+        url = self.LIST_URL.format(sid=sid, page=page)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers=self.DEFAULT_HEADERS
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            news_items = []
-
-            # 뉴스 목록에서 기사 추출
-            articles = soup.select("ul.type06_headline li, ul.type06 li")
-
-            for article in articles[:max_items]:
-                item = self._parse_article(article, category)
-                if item:
-                    news_items.append(item)
-
-            logger.debug(f"네이버 {category}: {len(news_items)}개 수집")
-            return news_items
+            return await self._fetch_cached(
+                url,
+                max_items,
+                lambda response: self._parse_response(response, category, max_items),
+                headers=self.DEFAULT_HEADERS,
+                follow_redirects=True
+            )
 
         except httpx.HTTPError as e:
             logger.error(f"네이버 뉴스 요청 실패: {e}")
@@ -90,6 +193,60 @@ class NaverNewsSource(BaseNewsSource):
             logger.error(f"네이버 뉴스 파싱 실패: {e}")
             return []
 
+    async def _parse_response(
+        self,
+        response: httpx.Response,
+        category: str,
+        max_items: int
+    ) -> list[NewsItem]:
+        """목록 페이지 응답을 NewsItem 리스트로 변환"""
+        html = await self._read_text(response)
+        with stage(f"parse {self.name}/{category}"):
+            return self._parse_list(html, category, max_items)
+
+    @classmethod
+    def _extract_region(cls, html: str) -> str:
+        """목록 페이지에서 기사 목록 영역만 잘라내기
+
+        첫 기사 목록(<ul class="type06...">)부터 페이지 이동 영역 직전까지만 남겨
+        파서가 헤더/사이드바 등 나머지 페이지를 토큰화하지 않도록 한다.
+        영역을 찾지 못하면 원문 전체를 반환한다.
+        """
+        marker = html.find(cls.REGION_START)
+        if marker < 0:
+            return html
+
+        start = html.rfind("<ul", 0, marker)
+        if start < 0:
+            return html
+
+        end = html.find(cls.REGION_END, marker)
+        if end >= 0:
+            end = html.rfind("<", marker, end)
+        return html[start:end] if end > start else html[start:]
+
+    def _parse_list(self, html: str, category: str, max_items: int) -> list[NewsItem]:
+        """목록 페이지 HTML을 NewsItem 리스트로 변환
+
+        기사 목록 영역만 SoupStrainer로 파싱하고, max_items개를 채우면 중단한다.
+        """
+        soup = BeautifulSoup(
+            self._extract_region(html),
+            self.parser,
+            parse_only=self.LIST_STRAINER
+        )
+        news_items = []
+
+        # 뉴스 목록에서 기사 추출
+        for article in soup.select(self.LIST_SELECTOR):
+            item = self._parse_article(article, category)
+            if item:
+                news_items.append(item)
+                if len(news_items) >= max_items:
+                    break
+
+        return news_items
+
     def _parse_article(self, article, category: str) -> Optional[NewsItem]:
         """HTML 기사 요소를 NewsItem으로 변환"""
         try:
@@ -144,14 +301,47 @@ class NaverSearchNewsSource(BaseNewsSource):
         "tech": "IT 기술 과학",
     }
 
-    def __init__(self, client_id: str, client_secret: str, timeout: int = 10):
+    # 검색 API 제한: display 최대 100, start 최대 1000
+    PAGE_SIZE = 100
+    MAX_START = 1000
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        timeout: float = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limit: float = 10,
+        hedge_budget: int = 0,
+        max_bytes: int = 2 * 1024 * 1024
+    ):
+        """
+        Args:
+            client_id: 네이버 API Client ID
+            client_secret: 네이버 API Client Secret
+            timeout: 요청 타임아웃 (초)
+            client: 공유 HTTP 클라이언트
+            rate_limit: 초당 최대 API 호출 수
+            hedge_budget: 실행당 최대 중복(hedged) 요청 수 (0이면 사용 안 함)
+            max_bytes: 응답 본문 최대 바이트 수 (0이면 제한 없음)
+        """
+        super().__init__(
+            timeout=timeout,
+            client=client,
+            rate_limit=rate_limit,
+            hedge_budget=hedge_budget,
+            max_bytes=max_bytes
+        )
         self.client_id = client_id
         self.client_secret = client_secret
-        self.timeout = timeout
+        self.planner = QueryPlanner(page_size=self.PAGE_SIZE, max_start=self.MAX_START)
 
     async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
         """네이버 검색 API로 뉴스 수집
 
+        카테고리 키워드(CategoryConfig.keywords)가 있으면 키워드별 검색을 동시에
+        요청하고(필요 시 start 페이지 분할), 결과를 하나의 순위 목록으로 병합한다.
+
         Args:
             category: 뉴스 카테고리
             max_items: 최대 수집 개수
@@ -159,46 +349,57 @@ class NaverSearchNewsSource(BaseNewsSource):
         Returns:
             뉴스 아이템 리스트
         """
-        query = self.CATEGORY_KEYWORDS.get(category, category)
+        keywords = self.keywords.get(category) or [self.CATEGORY_KEYWORDS.get(category, category)]
+        queries = self.planner.plan(keywords, max_items)
+
+        results = await asyncio.gather(*(
+            self._search(query, category) for query in queries
+        ))
+
+        if len(results) == 1:
+            return results[0][:max_items]
+        return merge_ranked(results, max_items, starts=[query.start for query in queries])
 
+    async def _search(self, query: SearchQuery, category: str) -> list[NewsItem]:
+        """검색 API 요청 하나 수행 (실패 시 빈 리스트)"""
         headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret,
         }
 
         params = {
-            "query": query,
-            "display": max_items,
+            "query": query.keyword,
+            "display": query.display,
+            "start": query.start,
             "sort": "date",  # 최신순
         }
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
+            async with self._stream(
+                "GET",
+                self.SEARCH_URL,
+                headers=headers,
+                params=params,
                 follow_redirects=True
-            ) as client:
-                response = await client.get(
-                    self.SEARCH_URL,
-                    headers=headers,
-                    params=params
-                )
+            ) as response:
                 response.raise_for_status()
+                data = json.loads(await self._read_body(response))
 
-            data = response.json()
             news_items = []
 
-            for item in data.get("items", []):
-                news_item = self._parse_item(item, category)
-                if news_item:
-                    news_items.append(news_item)
+            with stage(f"parse {self.name}/{category}"):
+                for item in data.get("items", []):
+                    news_item = self._parse_item(item, category)
+                    if news_item:
+                        news_items.append(news_item)
 
             return news_items
 
         except httpx.HTTPError as e:
-            logger.error(f"네이버 검색 API 요청 실패: {e}")
+            logger.error(f"네이버 검색 API 요청 실패 ({query.keyword}): {e}")
             return []
         except Exception as e:
-            logger.error(f"네이버 검색 결과 파싱 실패: {e}")
+            logger.error(f"네이버 검색 결과 파싱 실패 ({query.keyword}): {e}")
             return []
 
     def _parse_item(self, item: dict, category: str) -> Optional[NewsItem]:
@@ -216,7 +417,7 @@ class NaverSearchNewsSource(BaseNewsSource):
             if pub_date:
                 try:
                     from email.utils import parsedate_to_datetime
-                    published_at = parsedate_to_datetime(pub_date)
+                    published_at = to_utc(parsedate_to_datetime(pub_date))
                 except Exception:
                     pass
 
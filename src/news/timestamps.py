@@ -0,0 +1,40 @@
+"""발행 시각 정규화 유틸리티
+
+소스마다 naive(UTC 기준) / aware(KST 등) datetime이 섞여 들어오므로
+NewsItem 생성 시점에 모두 aware UTC datetime과 정수 epoch로 맞춘다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """aware UTC datetime으로 변환 (naive는 UTC로 간주)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """datetime을 UTC epoch 초로 변환 (naive는 UTC로 간주)
+
+    Args:
+        value: 발행 시각
+
+    Returns:
+        epoch 초 (None이면 None)
+    """
+    if value is None:
+        return None
+    return int(to_utc(value).timestamp())
+
+
+def from_epoch(value: Optional[int]) -> Optional[datetime]:
+    """UTC epoch 초를 aware datetime(UTC)으로 변환"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
@@ -0,0 +1,183 @@
+"""실행 단계별 시간 측정 (--profile)
+
+stage(name)으로 감싼 구간의 벽시계 시간과 CPU 시간을 단계 이름별로 누적한다.
+프로파일러가 활성화되지 않았으면 stage()는 미리 만들어 둔 빈 컨텍스트를
+돌려주므로 전역 변수 확인 한 번 외의 비용이 없다.
+
+비동기 단계(수집, 전송)는 다른 작업과 동시에 실행되므로, 그 CPU 시간에는
+같은 구간에 실행된 다른 작업의 CPU 시간도 포함된다.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import ContextManager, Iterator, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+_NULL = nullcontext()
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class StageTiming:
+    calls: int = 0
+    wall: float = 0.0  # 초
+    cpu: float = 0.0   # 초
+
+
+def stage(name: str) -> ContextManager:
+    """단계 구간 측정 (프로파일러 비활성화 시 아무것도 하지 않음)
+
+    Args:
+        name: 단계 이름 (예: "fetch naver/society", "format google")
+    """
+    if _active is None:
+        return _NULL
+    return _active.measure(name)
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 기록 (flamegraph용 collapsed 형식)"""
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        """
+        Args:
+            interval: 샘플링 간격 (초)
+            thread_id: 대상 스레드 (None이면 생성한 스레드)
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def write(self, path: str) -> None:
+        """collapsed 스택 파일 저장 (flamegraph.pl, speedscope 등에서 사용)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """단계별 시간 측정기
+
+    activate() 구간 동안 stage() 측정이 켜지고, 선택적으로
+    cProfile(pstats 덤프)과 스택 샘플러(collapsed 스택)를 함께 실행한다.
+    """
+
+    def __init__(
+        self,
+        pstats_path: Optional[str] = None,
+        collapsed_path: Optional[str] = None,
+        sample_interval: float = 0.005
+    ):
+        """
+        Args:
+            pstats_path: cProfile 결과(pstats) 저장 경로
+            collapsed_path: collapsed 스택 저장 경로
+            sample_interval: 스택 샘플링 간격 (초)
+        """
+        self.pstats_path = pstats_path
+        self.collapsed_path = collapsed_path
+        self.sample_interval = sample_interval
+        self.stages: dict[str, StageTiming] = {}
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """단계 구간 측정"""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.get(name)
+            if timing is None:
+                timing = self.stages[name] = StageTiming()
+            timing.calls += 1
+            timing.wall += time.perf_counter() - wall_start
+            timing.cpu += time.process_time() - cpu_start
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """측정 구간 (전체 실행 시간, cProfile, 스택 샘플링 포함)"""
+        global _active
+
+        profile = cProfile.Profile() if self.pstats_path else None
+        sampler = StackSampler(self.sample_interval) if self.collapsed_path else None
+
+        previous, _active = _active, self
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if sampler is not None:
+            sampler.start()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield self
+        finally:
+            if profile is not None:
+                profile.disable()
+            if sampler is not None:
+                sampler.stop()
+            self.wall = time.perf_counter() - wall_start
+            self.cpu = time.process_time() - cpu_start
+            _active = previous
+
+            if profile is not None:
+                profile.dump_stats(self.pstats_path)
+                logger.info(f"pstats 저장: {self.pstats_path}")
+            if sampler is not None:
+                sampler.write(self.collapsed_path)
+                logger.info(f"collapsed 스택 저장: {self.collapsed_path}")
+
+    def report(self) -> str:
+        """단계별 시간 표 (벽시계 시간 내림차순)"""
+        width = max([len("단계"), *(len(name) for name in self.stages)])
+        lines = [
+            f"{'단계':<{width}} {'호출':>6} {'wall(ms)':>10} {'cpu(ms)':>10} {'wall%':>6}",
+            "-" * (width + 36),
+        ]
+        for name, timing in sorted(self.stages.items(), key=lambda kv: -kv[1].wall):
+            share = timing.wall / self.wall * 100 if self.wall > 0 else 0.0
+            lines.append(
+                f"{name:<{width}} {timing.calls:>6} {timing.wall * 1000:>10.1f} "
+                f"{timing.cpu * 1000:>10.1f} {share:>5.1f}%"
+            )
+        lines.append("-" * (width + 36))
+        lines.append(
+            f"{'전체':<{width}} {'':>6} {self.wall * 1000:>10.1f} {self.cpu * 1000:>10.1f} {100.0:>5.1f}%"
+        )
+        return "\n".join(lines)
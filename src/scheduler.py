@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import signal
+import time
 from datetime import datetime
 from typing import Callable, Awaitable, Optional
 from zoneinfo import ZoneInfo
@@ -11,6 +12,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from .config import ScheduleConfig
+from .metrics import JOB_DURATION, JOB_RUNS
 
 
 logger = logging.getLogger(__name__)
@@ -47,14 +49,21 @@ class NewsScheduler:
         logger.info(f"스케줄 작업 시작: {datetime.now()}")
         logger.info("=" * 50)
 
+        started = time.perf_counter()
+        result = "error"
         try:
             success = await self._job_func()
             if success:
+                result = "success"
                 logger.info("스케줄 작업 완료")
             else:
+                result = "failure"
                 logger.error("스케줄 작업 실패")
         except Exception as e:
             logger.exception(f"스케줄 작업 중 예외 발생: {e}")
+        finally:
+            JOB_DURATION.observe(time.perf_counter() - started)
+            JOB_RUNS.inc(result=result)
 
     def start(self) -> None:
         """스케줄러 시작"""
@@ -1,13 +1,17 @@
 """텔레그램 메시지 전송 모듈"""
 
+import asyncio
 import logging
+import time
+from datetime import timedelta
 from typing import Optional
 
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import TelegramError
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError, TimedOut
 
 from ..config import TelegramConfig
+from ..metrics import TELEGRAM_SEND_DURATION, TELEGRAM_THROTTLED
 
 
 logger = logging.getLogger(__name__)
@@ -22,7 +26,42 @@ class TelegramSender:
             config: 텔레그램 설정
         """
         self.config = config
-        self.bot = Bot(token=config.bot_token)
+        if config.base_url:
+            # 로컬 대역 서버 등 다른 Bot API 서버 사용 (토큰은 /bot 뒤에 붙는다)
+            self.bot = Bot(token=config.bot_token, base_url=f"{config.base_url.rstrip('/')}/bot")
+        else:
+            self.bot = Bot(token=config.bot_token)
+        self.throttled = 0  # 받은 429(RetryAfter) 응답 수
+
+    @staticmethod
+    def _parse_mode(parse_mode: str) -> Optional[str]:
+        """파싱 모드 매핑 (markdown, html)"""
+        mode_map = {
+            "markdown": ParseMode.MARKDOWN_V2,
+            "html": ParseMode.HTML,
+        }
+        return mode_map.get(parse_mode.lower())
+
+    async def _deliver(self, chat_id: str, text: str, parse_mode: Optional[str] = None) -> None:
+        """sendMessage 요청 1회 (요청 시간과 429 응답을 지표에 기록)
+
+        Raises:
+            TelegramError: 전송 실패
+        """
+        started = time.perf_counter()
+        try:
+            await self.bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=True
+            )
+        except RetryAfter:
+            self.throttled += 1
+            TELEGRAM_THROTTLED.inc()
+            raise
+        finally:
+            TELEGRAM_SEND_DURATION.observe(time.perf_counter() - started)
 
     async def send_message(
         self,
@@ -46,20 +85,10 @@ class TelegramSender:
             logger.error("Chat ID가 설정되지 않았습니다.")
             return False
 
-        # 파싱 모드 매핑
-        mode_map = {
-            "markdown": ParseMode.MARKDOWN_V2,
-            "html": ParseMode.HTML,
-        }
-        mode = mode_map.get(parse_mode.lower())
+        mode = self._parse_mode(parse_mode)
 
         try:
-            await self.bot.send_message(
-                chat_id=target_chat_id,
-                text=text,
-                parse_mode=mode,
-                disable_web_page_preview=True
-            )
+            await self._deliver(target_chat_id, text, mode)
             logger.info(f"메시지 전송 완료 (chat_id: {target_chat_id})")
             return True
 
@@ -88,11 +117,7 @@ class TelegramSender:
             return False
 
         try:
-            await self.bot.send_message(
-                chat_id=target_chat_id,
-                text=text,
-                disable_web_page_preview=True
-            )
+            await self._deliver(target_chat_id, text)
             logger.info(f"메시지 전송 완료 (chat_id: {target_chat_id})")
             return True
 
@@ -109,6 +134,9 @@ class TelegramSender:
     ) -> bool:
         """재시도 로직이 포함된 메시지 전송
 
+        속도 제한(429), 시간 초과, 네트워크 오류만 재시도하고 잘못된 요청 등
+        다시 보내도 같은 결과가 나올 오류는 바로 실패로 처리한다.
+
         Args:
             text: 전송할 메시지
             max_retries: 최대 재시도 횟수
@@ -118,22 +146,41 @@ class TelegramSender:
         Returns:
             전송 성공 여부
         """
-        for attempt in range(max_retries):
-            try:
-                if parse_mode:
-                    success = await self.send_message(text, chat_id, parse_mode)
-                else:
-                    success = await self.send_message_plain(text, chat_id)
+        target_chat_id = chat_id or self.config.chat_id
+        if not target_chat_id:
+            logger.error("Chat ID가 설정되지 않았습니다.")
+            return False
 
-                if success:
-                    return True
+        mode = self._parse_mode(parse_mode) if parse_mode else None
 
-            except Exception as e:
+        for attempt in range(max_retries):
+            try:
+                await self._deliver(target_chat_id, text, mode)
+                logger.info(f"메시지 전송 완료 (chat_id: {target_chat_id})")
+                return True
+
+            except RetryAfter as e:
+                # 429: 서버가 알려준 시간만큼 기다린 뒤 재시도
+                delay = e.retry_after
+                if isinstance(delay, timedelta):
+                    delay = delay.total_seconds()
+                logger.warning(f"전송 시도 {attempt + 1}/{max_retries} 속도 제한: {delay}초 후 재시도")
+
+            except BadRequest as e:
+                # BadRequest는 NetworkError의 하위 클래스이므로 먼저 걸러낸다
+                logger.error(f"메시지 전송 실패 (재시도하지 않음): {e}")
+                return False
+
+            except (TimedOut, NetworkError) as e:
                 logger.warning(f"전송 시도 {attempt + 1}/{max_retries} 실패: {e}")
+                delay = 2 ** attempt  # 지수 백오프
+
+            except TelegramError as e:
+                logger.error(f"메시지 전송 실패 (재시도하지 않음): {e}")
+                return False
 
-                if attempt < max_retries - 1:
-                    import asyncio
-                    await asyncio.sleep(2 ** attempt)  # 지수 백오프
+            if attempt < max_retries - 1:
+                await asyncio.sleep(delay)
 
         logger.error(f"최대 재시도 횟수({max_retries})를 초과했습니다.")
         return False
@@ -0,0 +1,240 @@
+"""로컬 Telegram Bot API 대역 서버 (부하/재시도 테스트용)
+
+getMe와 sendMessage만 구현하며, 응답 지연, 채팅별 전송 속도 제한(429 retry_after),
+무작위 429/오류 응답을 설정할 수 있다. telegram.base_url을 이 서버 주소로
+지정하면 TelegramSender가 실제 api.telegram.org 대신 이 서버로 요청한다.
+
+실행 예시:
+  python -m src.telegram.stub --port 8081 --latency 0.05 --throttle-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import web
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StubBehavior:
+    latency: float = 0.0          # 모든 응답 지연 (초)
+    jitter: float = 0.0           # 지연에 더하는 0~jitter 무작위 값 (초)
+    per_chat_limit: int = 0       # 채팅별 초당 sendMessage 허용 수 (0이면 제한 없음)
+    throttle_rate: float = 0.0    # 무작위 429 응답 비율 (0-1)
+    retry_after: int = 1          # 429 응답의 retry_after (초)
+    error_rate: float = 0.0       # 무작위 오류 응답 비율 (0-1)
+    error_code: int = 500         # 오류 응답 상태 코드
+    seed: Optional[int] = None    # 무작위 주입 재현용 시드
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    messages: int = 0             # 성공한 sendMessage 수
+    throttled: int = 0            # 429 응답 수
+    errors: int = 0               # 주입한 오류 응답 수
+    by_chat: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class TelegramStubServer:
+    """Telegram Bot API 대역 서버"""
+
+    def __init__(
+        self,
+        behavior: Optional[StubBehavior] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        clock=time.monotonic
+    ):
+        """
+        Args:
+            behavior: 지연/제한/오류 주입 설정
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            clock: 전송 속도 제한에 사용할 시계
+        """
+        self.behavior = behavior or StubBehavior()
+        self.host = host
+        self.port = port
+        self.clock = clock
+        self.stats = StubStats()
+        self._random = random.Random(self.behavior.seed)
+        self._sent: dict[str, deque[float]] = defaultdict(deque)
+        self._message_id = 0
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.router.add_route("*", "/bot{token}/getMe", self._get_me)
+        self.app.router.add_route("*", "/bot{token}/sendMessage", self._send_message)
+
+    @property
+    def base_url(self) -> str:
+        """telegram.base_url에 지정할 주소"""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """서버 시작 (port가 0이면 할당된 포트로 갱신)"""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Telegram 대역 서버 시작: {self.base_url}")
+
+    async def stop(self) -> None:
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "TelegramStubServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _params(self, request: web.Request) -> dict:
+        """쿼리, 폼, JSON 본문의 파라미터"""
+        params = dict(request.query)
+        if request.can_read_body:
+            if request.content_type == "application/json":
+                params.update(await request.json())
+            else:
+                params.update(await request.post())
+        return params
+
+    async def _delay(self) -> None:
+        delay = self.behavior.latency + self._random.uniform(0, self.behavior.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _throttle(self, chat_id: str) -> Optional[int]:
+        """429 응답이 필요하면 retry_after (초), 아니면 None"""
+        behavior = self.behavior
+        if behavior.throttle_rate and self._random.random() < behavior.throttle_rate:
+            return max(1, behavior.retry_after)
+
+        if behavior.per_chat_limit:
+            now = self.clock()
+            sent = self._sent[chat_id]
+            while sent and now - sent[0] >= 1.0:
+                sent.popleft()
+            if len(sent) >= behavior.per_chat_limit:
+                return max(1, math.ceil(1.0 - (now - sent[0])))
+            sent.append(now)
+
+        return None
+
+    @staticmethod
+    def _error(status: int, description: str, retry_after: Optional[int] = None) -> web.Response:
+        payload = {"ok": False, "error_code": status, "description": description}
+        if retry_after is not None:
+            payload["parameters"] = {"retry_after": retry_after}
+        return web.json_response(payload, status=status)
+
+    async def _get_me(self, request: web.Request) -> web.Response:
+        self.stats.requests += 1
+        await self._delay()
+        return web.json_response({
+            "ok": True,
+            "result": {
+                "id": 1,
+                "is_bot": True,
+                "first_name": "Logos News Stub",
+                "username": "logos_news_stub_bot",
+            },
+        })
+
+    async def _send_message(self, request: web.Request) -> web.Response:
+        self.stats.requests += 1
+        params = await self._params(request)
+        await self._delay()
+
+        chat_id = str(params.get("chat_id", ""))
+        text = params.get("text")
+        if not chat_id or not text:
+            return self._error(400, "Bad Request: chat_id and text are required")
+
+        if self._random.random() < self.behavior.error_rate:
+            self.stats.errors += 1
+            return self._error(self.behavior.error_code, "Injected error")
+
+        retry_after = self._throttle(chat_id)
+        if retry_after is not None:
+            self.stats.throttled += 1
+            return self._error(429, f"Too Many Requests: retry after {retry_after}", retry_after)
+
+        self.stats.messages += 1
+        self.stats.by_chat[chat_id] += 1
+        self._message_id += 1
+        return web.json_response({
+            "ok": True,
+            "result": {
+                "message_id": self._message_id,
+                "date": int(time.time()),
+                "chat": {"id": int(chat_id) if chat_id.lstrip("-").isdigit() else 0, "type": "private"},
+                "text": text,
+            },
+        })
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.telegram.stub",
+        description="로컬 Telegram Bot API 대역 서버",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--per-chat-limit", type=int, default=0, help="채팅별 초당 전송 허용 수")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="무작위 429 응답 비율")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 retry_after (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="무작위 오류 응답 비율")
+    parser.add_argument("--error-code", type=int, default=500, help="오류 응답 상태 코드")
+    parser.add_argument("--seed", type=int, default=None, help="무작위 주입 시드")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    server = TelegramStubServer(
+        StubBehavior(
+            latency=args.latency,
+            jitter=args.jitter,
+            per_chat_limit=args.per_chat_limit,
+            throttle_rate=args.throttle_rate,
+            retry_after=args.retry_after,
+            error_rate=args.error_rate,
+            error_code=args.error_code,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+
+    async def serve():
+        async with server:
+            try:
+                await asyncio.Event().wait()
+            finally:
+                logger.info(f"통계: {server.stats}")
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
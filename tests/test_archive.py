@@ -0,0 +1,121 @@
+"""뉴스 보관소 테스트"""
+
+from datetime import datetime, timezone
+
+from src.config import ArchiveConfig
+from src.news.archive import NewsArchive, _ENTRY
+from src.news.collector import NewsItem
+
+
+DAY = 86400
+BASE = int(datetime(2024, 5, 6, tzinfo=timezone.utc).timestamp())
+
+
+def make_item(i: int, category="economy", source="naver:언론사", ts=BASE) -> NewsItem:
+    return NewsItem(
+        title=f"뉴스 {i}",
+        link=f"https://a.com/{category}/{i}",
+        category=category,
+        source=source,
+        summary=f"요약 {i}",
+        published_at=datetime.fromtimestamp(ts, tz=timezone.utc) if ts else None,
+    )
+
+
+class TestNewsArchive:
+    """NewsArchive 테스트"""
+
+    def test_append_and_query_all(self, tmp_path):
+        """추가한 아이템을 저장 순서대로 조회"""
+        archive = NewsArchive(str(tmp_path))
+        items = [make_item(i) for i in range(3)]
+
+        assert archive.append(items) == 3
+        assert len(archive) == 3
+
+        result = archive.query()
+        assert [r.link for r in result] == [i.link for i in items]
+        assert result[0].published_at == items[0].published_at
+        assert result[0].summary == "요약 0"
+
+    def test_query_by_date_category_source(self, tmp_path):
+        """날짜 범위, 카테고리, 소스 조건으로 조회"""
+        archive = NewsArchive(str(tmp_path))
+        archive.append([
+            make_item(1, ts=BASE - 10 * DAY),
+            make_item(2, ts=BASE - 2 * DAY),
+            make_item(3, category="it", ts=BASE - DAY),
+        ])
+        archive.append([
+            make_item(4, source="google/연합뉴스", ts=BASE - DAY),
+        ])
+
+        last_week = archive.query(since=BASE - 7 * DAY, until=BASE, category="economy")
+        assert [r.title for r in last_week] == ["뉴스 2", "뉴스 4"]
+
+        naver = archive.query(source="naver")
+        assert [r.title for r in naver] == ["뉴스 1", "뉴스 2", "뉴스 3"]
+        assert [r.title for r in archive.query(source="google")] == ["뉴스 4"]
+
+        assert archive.query(category="sports") == []
+        assert archive.query(source="daum") == []
+
+    def test_missing_publish_time_uses_collected_at(self, tmp_path):
+        """발행 시각이 없으면 수집 시각으로 인덱싱"""
+        archive = NewsArchive(str(tmp_path))
+        archive.append([make_item(1, ts=None)], collected_at=BASE)
+
+        assert len(archive.query(since=BASE, until=BASE + 1)) == 1
+        assert archive.query(until=BASE) == []
+
+    def test_segment_rotation(self, tmp_path):
+        """세그먼트가 크기 제한을 넘으면 새 파일에 기록"""
+        archive = NewsArchive(str(tmp_path), segment_bytes=1)
+        for i in range(3):
+            archive.append([make_item(i)])
+
+        assert len(list(tmp_path.glob("segment-*.log"))) == 3
+        assert [r.title for r in archive.query()] == ["뉴스 0", "뉴스 1", "뉴스 2"]
+
+    def test_reopen_continues(self, tmp_path):
+        """다시 열어도 이름 목록과 세그먼트를 이어서 사용"""
+        NewsArchive(str(tmp_path)).append([make_item(1)])
+
+        archive = NewsArchive(str(tmp_path))
+        archive.append([make_item(2, category="it")])
+
+        assert [r.title for r in archive.query(category="economy")] == ["뉴스 1"]
+        assert [r.title for r in archive.query(category="it")] == ["뉴스 2"]
+        assert len(list(tmp_path.glob("segment-*.log"))) == 1
+
+    def test_partial_index_entry_repaired(self, tmp_path):
+        """중단된 기록으로 남은 불완전한 인덱스 항목은 열 때 제거"""
+        NewsArchive(str(tmp_path)).append([make_item(1)])
+        with open(tmp_path / "index.bin", "ab") as f:
+            f.write(b"\x00" * 5)
+
+        archive = NewsArchive(str(tmp_path))
+
+        assert (tmp_path / "index.bin").stat().st_size == _ENTRY.size
+        assert len(archive.query()) == 1
+
+    def test_empty_append(self, tmp_path):
+        """빈 목록은 기록하지 않음"""
+        archive = NewsArchive(str(tmp_path))
+
+        assert archive.append([]) == 0
+        assert archive.query() == []
+        assert list(tmp_path.glob("segment-*.log")) == []
+
+    def test_from_config_disabled(self, tmp_path):
+        """비활성화 시 None"""
+        config = ArchiveConfig(enabled=False, path=str(tmp_path))
+
+        assert NewsArchive.from_config(config) is None
+
+    def test_from_config_corrupt_names(self, tmp_path):
+        """index.json이 손상되었으면 보관소를 열지 않음"""
+        NewsArchive(str(tmp_path)).append([make_item(1)])
+        (tmp_path / "index.json").write_text("{", encoding="utf-8")
+
+        assert NewsArchive.from_config(ArchiveConfig(path=str(tmp_path))) is None
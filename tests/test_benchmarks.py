@@ -0,0 +1,71 @@
+"""벤치마크 실행기 테스트"""
+
+import pytest
+
+from benchmarks import runner
+from benchmarks.__main__ import main
+from benchmarks.cases import all_benchmarks
+
+
+def make_result(**medians) -> dict:
+    return {
+        "version": runner.RESULT_VERSION,
+        "results": {name: {"median": value} for name, value in medians.items()},
+    }
+
+
+class TestCompare:
+    """기준 결과 비교 테스트"""
+
+    def test_flags_regression_and_improvement(self):
+        """임계값을 넘는 증가/감소 표시"""
+        rows = runner.compare(
+            make_result(a=1.0, b=1.0, c=1.0),
+            make_result(a=1.05, b=1.5, c=0.5, d=1.0),
+            threshold=0.1,
+        )
+
+        assert {row["name"]: row["status"] for row in rows} == {
+            "a": "ok",
+            "b": "regression",
+            "c": "improvement",
+            "d": "new",
+        }
+        assert rows[1]["change"] == pytest.approx(0.5)
+
+    def test_cli_exit_code(self, tmp_path):
+        """성능 저하가 있으면 종료 코드 1"""
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        runner.save(make_result(a=1.0), str(baseline))
+        runner.save(make_result(a=2.0), str(current))
+
+        assert main(["compare", str(baseline), str(current)]) == 1
+        assert main(["compare", str(baseline), str(current), "--threshold", "1.5"]) == 0
+
+    def test_rejects_unknown_version(self, tmp_path):
+        """형식 버전이 다르면 거부"""
+        path = tmp_path / "old.json"
+        path.write_text('{"version": 0, "results": {}}')
+
+        with pytest.raises(ValueError):
+            runner.load(str(path))
+
+
+class TestRun:
+    """벤치마크 실행 테스트"""
+
+    def test_measure(self):
+        """호출당 시간 통계"""
+        stats = runner.measure(lambda: sum(range(100)), rounds=3, min_time=0.001)
+
+        assert stats["rounds"] == 3
+        assert stats["loops"] >= 1
+        assert 0 < stats["min"] <= stats["median"]
+
+    def test_cases_run(self):
+        """모든 벤치마크 준비 및 1회 실행 (10k 수집 제외)"""
+        for benchmark in all_benchmarks():
+            if benchmark.name.startswith("collector"):
+                continue
+            benchmark.setup()()
@@ -0,0 +1,250 @@
+"""HTTP 카세트 기록/재생 테스트"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from src.config import (
+    ArchiveConfig,
+    CategoryConfig,
+    Config,
+    HealthConfig,
+    HistoryConfig,
+    NewsConfig,
+    SourceConfig,
+    TelegramConfig,
+)
+from src.main import run_news_briefing
+from src.news.cassette import Cassette
+from src.news.health import SourceHealthRegistry
+from src.news.http import HttpClientPool
+from src.news.sources import NaverNewsSource, NaverSearchNewsSource, GoogleNewsSource
+from src.telegram.stub import TelegramStubServer
+from tests.test_news import google_rss, naver_list_page
+
+
+SEARCH_BODY = {
+    "items": [
+        {
+            "title": "<b>검색</b> 기사",
+            "originallink": "https://a.com/search/1",
+            "link": "https://n.news.naver.com/search/1",
+            "description": "검색 요약",
+            "pubDate": "Mon, 06 May 2024 09:00:00 +0900",
+        }
+    ]
+}
+
+
+def live_handler(request: httpx.Request) -> httpx.Response:
+    """실제 서버 대신 응답하는 핸들러 (구글 응답은 gzip 인코딩)"""
+    host = request.url.host
+    if host == "news.google.com":
+        return httpx.Response(
+            200,
+            content=gzip.compress(google_rss(3).encode()),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/rss+xml"},
+        )
+    if host == "openapi.naver.com":
+        return httpx.Response(200, json=SEARCH_BODY)
+    return httpx.Response(200, text=naver_list_page(5))
+
+
+def make_sources(pool: HttpClientPool) -> list:
+    sources = [
+        NaverNewsSource(parser="html.parser", max_pages=1),
+        NaverSearchNewsSource("id", "secret"),
+        GoogleNewsSource(),
+    ]
+    for source in sources:
+        source.set_client(pool.get(source.name))
+    return sources
+
+
+async def collect(sources: list) -> dict:
+    return {
+        source.name: [item.link for item in await source.fetch_news("economy", 5)]
+        for source in sources
+    }
+
+
+class TestCassette:
+    """Cassette 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        """기록한 응답을 재생하면 같은 수집 결과"""
+        path = tmp_path / "run.json.gz"
+
+        recorder = Cassette(str(path), mode="record")
+        # 실제 네트워크 대신 MockTransport를 감싸서 기록
+        pool = HttpClientPool()
+        for name in ("naver", "naver_search", "google"):
+            pool._clients[name] = httpx.AsyncClient(
+                transport=recorder.transport(httpx.MockTransport(live_handler))
+            )
+        recorded = await collect(make_sources(pool))
+        await pool.aclose()
+        recorder.save()
+
+        assert len(recorder.exchanges) == 3
+        assert all(links for links in recorded.values())
+
+        replay_pool = HttpClientPool({"naver": SourceConfig()}, cassette=Cassette(str(path)))
+        replayed = await collect(make_sources(replay_pool))
+        await replay_pool.aclose()
+
+        assert replayed == recorded
+
+    @pytest.mark.asyncio
+    async def test_raw_body_and_redacted_headers(self, tmp_path):
+        """압축된 원본 본문을 그대로 보관하고 API 키 헤더는 기록하지 않음"""
+        path = tmp_path / "run.json.gz"
+        cassette = Cassette(str(path), mode="record")
+        async with httpx.AsyncClient(
+            transport=cassette.transport(httpx.MockTransport(live_handler))
+        ) as client:
+            response = await client.get(
+                "https://news.google.com/rss",
+                headers={"X-Naver-Client-Secret": "secret"},
+            )
+        cassette.save()
+
+        assert response.text == google_rss(3)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        exchange = payload["exchanges"][0]
+        assert ["content-encoding", "gzip"] in exchange["headers"]
+        assert "secret" not in json.dumps(exchange["request_headers"])
+
+    @pytest.mark.asyncio
+    async def test_replay_order_and_repeat(self, tmp_path):
+        """같은 요청은 기록 순서대로, 소진 후에는 마지막 응답 반복"""
+        path = tmp_path / "run.json.gz"
+        counter = iter(range(10))
+        recorder = Cassette(str(path), mode="record")
+        async with httpx.AsyncClient(transport=recorder.transport(
+            httpx.MockTransport(lambda request: httpx.Response(200, text=str(next(counter))))
+        )) as client:
+            for _ in range(2):
+                await client.get("https://a.com/")
+        recorder.save()
+
+        replay = Cassette(str(path))
+        async with httpx.AsyncClient(transport=replay.transport()) as client:
+            bodies = [(await client.get("https://a.com/")).text for _ in range(3)]
+
+        assert bodies == ["0", "1", "1"]
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request(self, tmp_path):
+        """기록되지 않은 요청은 연결 오류"""
+        path = tmp_path / "run.json.gz"
+        Cassette(str(path), mode="record").save()
+
+        async with httpx.AsyncClient(transport=Cassette(str(path)).transport()) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://a.com/missing")
+
+    def test_invalid_mode(self, tmp_path):
+        """지원하지 않는 모드"""
+        with pytest.raises(ValueError):
+            Cassette(str(tmp_path / "x.json.gz"), mode="rewind")
+
+    @pytest.mark.asyncio
+    async def test_briefing_replay_is_repeatable(self, tmp_path, caplog):
+        """카세트 재생 실행은 전송 이력/보관소를 쓰지 않아 반복 재생해도 같은 결과"""
+        path = tmp_path / "run.json.gz"
+        recorder = Cassette(str(path), mode="record")
+        async with httpx.AsyncClient(
+            transport=recorder.transport(httpx.MockTransport(live_handler))
+        ) as client:
+            source = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+            assert await source.fetch_news("society", 6)
+        recorder.save()
+
+        async with TelegramStubServer() as server:
+            config = Config(
+                telegram=TelegramConfig(bot_token="123:test", chat_id="42", base_url=server.base_url),
+                news=NewsConfig(
+                    categories={"society": CategoryConfig(max_items=3)},
+                    sources={"naver": SourceConfig(parser="html.parser", max_pages=1)},
+                    history=HistoryConfig(path=str(tmp_path / "history.db")),
+                    archive=ArchiveConfig(path=str(tmp_path / "archive")),
+                    health=HealthConfig(enabled=False),
+                ),
+            )
+            with caplog.at_level("INFO", logger="src.main"):
+                for _ in range(2):
+                    assert await run_news_briefing(config=config, cassette=Cassette(str(path)))
+
+        totals = [r.getMessage() for r in caplog.records if r.getMessage().startswith("총 ")]
+        assert totals == ["총 3개 뉴스 수집 완료"] * 2
+        assert server.stats.messages == 2
+        assert not (tmp_path / "history.db").exists()
+        assert not (tmp_path / "archive").exists()
+
+    @pytest.mark.asyncio
+    async def test_briefing_sends_one_message_per_source(self, tmp_path):
+        """모든 소스를 동시에 수집해도 소스별 메시지로 전송"""
+        path = tmp_path / "run.json.gz"
+        recorder = Cassette(str(path), mode="record")
+        async with httpx.AsyncClient(
+            transport=recorder.transport(httpx.MockTransport(live_handler))
+        ) as client:
+            naver = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+            google = GoogleNewsSource(client=client)
+            assert await naver.fetch_news("society", 6)
+            assert await google.fetch_news("society", 6)
+        recorder.save()
+
+        async with TelegramStubServer() as server:
+            config = Config(
+                telegram=TelegramConfig(bot_token="123:test", chat_id="42", base_url=server.base_url),
+                news=NewsConfig(
+                    categories={"society": CategoryConfig(max_items=3)},
+                    sources={
+                        "naver": SourceConfig(parser="html.parser", max_pages=1),
+                        "google": SourceConfig(priority=2),
+                    },
+                    health=HealthConfig(enabled=False),
+                ),
+            )
+            assert await run_news_briefing(config=config, cassette=Cassette(str(path)))
+
+        assert server.stats.messages == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_ignores_saved_source_health(self, tmp_path, caplog):
+        """저장된 서킷 상태로 소스를 건너뛰지 않고, 재생 결과로 상태 파일을 바꾸지 않음"""
+        path = tmp_path / "run.json.gz"
+        recorder = Cassette(str(path), mode="record")
+        async with httpx.AsyncClient(
+            transport=recorder.transport(httpx.MockTransport(live_handler))
+        ) as client:
+            source = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+            assert await source.fetch_news("society", 6)
+        recorder.save()
+
+        health_config = HealthConfig(path=str(tmp_path / "health.json"), failure_threshold=1)
+        live = SourceHealthRegistry.from_config(health_config)
+        live.get("naver").record_failure("live")
+        live.save()
+        saved = (tmp_path / "health.json").read_text(encoding="utf-8")
+
+        async with TelegramStubServer() as server:
+            config = Config(
+                telegram=TelegramConfig(bot_token="123:test", chat_id="42", base_url=server.base_url),
+                news=NewsConfig(
+                    categories={"society": CategoryConfig(max_items=3)},
+                    sources={"naver": SourceConfig(parser="html.parser", max_pages=1)},
+                    health=health_config,
+                ),
+            )
+            with caplog.at_level("INFO", logger="src.main"):
+                assert await run_news_briefing(config=config, cassette=Cassette(str(path)))
+
+        assert "총 3개 뉴스 수집 완료" in caplog.messages
+        assert (tmp_path / "health.json").read_text(encoding="utf-8") == saved
@@ -0,0 +1,131 @@
+"""압축 뉴스 아이템 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.news.collector import NewsItem
+from src.news.compact import (
+    CompactNewsItem,
+    dumps,
+    loads,
+    to_epoch,
+)
+
+
+KST = timezone(timedelta(hours=9))
+
+
+def make_item(i: int, published_at=None) -> NewsItem:
+    return NewsItem(
+        title=f"뉴스 {i}",
+        link=f"https://a.com/{i}",
+        category="society",
+        source="naver:언론사",
+        summary=f"요약 {i}",
+        published_at=published_at,
+    )
+
+
+class TestToEpoch:
+    """to_epoch 테스트"""
+
+    def test_naive_is_utc(self):
+        """naive datetime은 UTC로 간주"""
+        assert to_epoch(datetime(2024, 5, 6, 0, 0)) == 1714953600
+
+    def test_aware_converted_to_utc(self):
+        """aware datetime은 UTC 기준으로 변환"""
+        assert to_epoch(datetime(2024, 5, 6, 9, 0, tzinfo=KST)) == 1714953600
+
+    def test_none(self):
+        assert to_epoch(None) is None
+
+
+class TestCompactNewsItem:
+    """CompactNewsItem 테스트"""
+
+    def test_has_no_instance_dict(self):
+        """__slots__ 사용 (인스턴스 __dict__ 없음)"""
+        item = CompactNewsItem.from_item(make_item(1))
+
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.extra = 1
+
+    def test_interns_category_and_source(self):
+        """category/source 문자열 공유"""
+        a = CompactNewsItem("a", "l1", "".join(["soc", "iety"]), "".join(["nav", "er"]))
+        b = CompactNewsItem("b", "l2", "".join(["socie", "ty"]), "".join(["na", "ver"]))
+
+        assert a.category is b.category
+        assert a.source is b.source
+
+    def test_news_item_is_slotted_and_interned(self):
+        """NewsItem도 __slots__ 사용 및 intern"""
+        a = NewsItem("a", "l1", "".join(["soc", "iety"]), "naver")
+        b = NewsItem("b", "l2", "".join(["socie", "ty"]), "naver")
+
+        assert not hasattr(a, "__dict__")
+        assert a.category is b.category
+
+    def test_round_trip_with_news_item(self):
+        """NewsItem ↔ CompactNewsItem 변환"""
+        item = make_item(1, datetime(2024, 5, 6, 9, 0, tzinfo=KST))
+
+        compact = CompactNewsItem.from_item(item)
+        restored = compact.to_item()
+
+        assert compact.published_ts == 1714953600
+        assert restored == item
+        assert restored.summary == item.summary
+        assert restored.published_at == item.published_at
+
+    def test_empty_summary_preserved(self):
+        """빈 요약도 None으로 바꾸지 않고 그대로 보존"""
+        item = NewsItem("a", "l1", "society", "naver", summary="")
+
+        compact = CompactNewsItem.from_item(item)
+
+        assert compact.summary == ""
+        assert compact.to_item().summary == ""
+        assert loads(dumps([item]))[0].summary == ""
+
+    def test_equality_is_symmetric(self):
+        """NewsItem과는 양쪽 방향 모두 같지 않음"""
+        item = NewsItem("a", "l1", "society", "naver")
+        compact = CompactNewsItem.from_item(item)
+
+        assert compact == CompactNewsItem.from_item(item)
+        assert (compact == item) == (item == compact)
+        assert compact != item
+
+
+class TestSerialization:
+    """dumps / loads 테스트"""
+
+    def test_round_trip(self):
+        """직렬화 후 복원"""
+        items = [make_item(i, datetime(2024, 5, 6, i % 24)) for i in range(100)]
+        items.append(make_item(100))
+
+        restored = loads(dumps(items))
+
+        assert [r.link for r in restored] == [i.link for i in items]
+        assert restored[5].published_ts == to_epoch(items[5].published_at)
+        assert restored[-1].published_ts is None
+        assert restored[0].category is restored[1].category
+
+    def test_smaller_than_dict_json(self):
+        """키 이름을 반복하는 to_dict JSON보다 작음"""
+        import json
+
+        items = [make_item(i, datetime(2024, 5, 6)) for i in range(100)]
+        as_dicts = json.dumps([i.to_dict() for i in items], ensure_ascii=False).encode()
+
+        assert len(dumps(items)) < len(as_dicts)
+
+    def test_rejects_unknown_version(self):
+        """지원하지 않는 형식은 ValueError"""
+        with pytest.raises(ValueError):
+            loads(b'{"v": 99, "rows": []}')
@@ -0,0 +1,99 @@
+"""유사 기사 탐지 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.dedup import NearDuplicateDetector, normalize_text
+from src.config import NewsConfig, CategoryConfig, DedupConfig
+from tests.test_news import StubSource
+
+
+def make_item(title: str, link: str, summary: str = None) -> NewsItem:
+    return NewsItem(title=title, link=link, category="economy", source="test", summary=summary)
+
+
+class TestNormalizeText:
+    """normalize_text 테스트"""
+
+    def test_strips_prefix_and_punctuation(self):
+        """말머리와 구두점 제거"""
+        assert normalize_text("[속보] 한은, 기준금리 3.5% 동결") == "한은기준금리35동결"
+        assert normalize_text("(종합) 한은 기준금리 3.5% 동결…") == "한은기준금리35동결"
+
+    def test_strips_outlet_suffix(self):
+        """' - 언론사' 접미사 제거"""
+        assert normalize_text("한은 기준금리 동결 - 연합뉴스") == "한은기준금리동결"
+
+
+class TestNearDuplicateDetector:
+    """NearDuplicateDetector 테스트"""
+
+    def test_groups_same_story_from_different_outlets(self):
+        """다른 언론사/URL의 같은 기사 묶기"""
+        items = [
+            make_item("[속보] 한은, 기준금리 3.5% 동결", "https://a.com/1"),
+            make_item("한은 기준금리 3.5% 동결 - 한국경제", "https://b.com/2"),
+            make_item("【단독】 한은 기준금리 3.5% 동결", "https://c.com/3"),
+            make_item("서울 아파트값 3주 연속 상승", "https://a.com/4"),
+        ]
+
+        groups = NearDuplicateDetector().cluster(items)
+
+        assert [len(g) for g in groups] == [3, 1]
+        assert groups[0][0].link == "https://a.com/1"
+
+    def test_matches_by_summary(self):
+        """제목이 달라도 요약이 같으면 같은 기사"""
+        summary = "한국은행 금융통화위원회가 기준금리를 연 3.5%로 동결했다고 밝혔다"
+        items = [
+            make_item("금리 동결 결정", "https://a.com/1", summary),
+            make_item("한은, 다시 숨고르기", "https://b.com/2", summary + "."),
+        ]
+
+        assert len(NearDuplicateDetector().deduplicate(items)) == 1
+
+    def test_keeps_distinct_stories(self):
+        """서로 다른 기사는 유지"""
+        items = [
+            make_item(f"{topic} 관련 정부 발표", f"https://a.com/{i}")
+            for i, topic in enumerate(["반도체 수출", "전세 사기", "폭염 특보", "의대 정원"])
+        ]
+
+        assert len(NearDuplicateDetector().deduplicate(items)) == 4
+
+    def test_disabled_config(self):
+        """비활성화 시 탐지기 없음"""
+        assert NearDuplicateDetector.from_config(DedupConfig(enabled=False)) is None
+
+
+class TestCollectorWithDedup:
+    """유사 기사 제거를 사용하는 수집기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_all_keeps_distinct_stories(self):
+        """소스 간 같은 기사는 하나만 남기고 max_items 채우기"""
+        def make_source(name, items):
+            source = StubSource(name)
+            source.fetch_news = AsyncMock(return_value=items)
+            return source
+
+        naver = make_source("naver", [
+            make_item("[속보] 코스피 2600선 회복", "https://naver.com/1"),
+            make_item("환율 1300원대 하락 마감", "https://naver.com/2"),
+        ])
+        google = make_source("google", [
+            make_item("코스피 2600선 회복", "https://news.google.com/x"),
+            make_item("국제유가 급등에 항공주 약세", "https://news.google.com/y"),
+        ])
+
+        config = NewsConfig(categories={"economy": CategoryConfig(max_items=3)})
+        collector = NewsCollector(config)
+        collector.register_source(naver)
+        collector.register_source(google)
+
+        result = await collector.collect_all()
+
+        titles = [normalize_text(item.title) for item in result["economy"]]
+        assert len(titles) == 3
+        assert len(set(titles)) == 3
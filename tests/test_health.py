@@ -0,0 +1,243 @@
+"""소스 상태 추적(서킷 브레이커 / 적응형 타임아웃 / hedged 요청) 테스트"""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.health import SourceHealthRegistry, CLOSED, OPEN, HALF_OPEN
+from src.news.sources.google import GoogleNewsSource
+from src.config import NewsConfig, CategoryConfig, HealthConfig
+from tests.test_news import StubSource
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    config = HealthConfig(failure_threshold=2, cooldown_seconds=60, min_samples=3)
+    return SourceHealthRegistry(config, clock=clock)
+
+
+class TestSourceHealth:
+    """SourceHealth 테스트"""
+
+    def test_opens_after_consecutive_failures(self, registry):
+        """연속 실패 시 서킷 open"""
+        health = registry.get("naver")
+
+        health.record_failure()
+        assert health.state == CLOSED and health.allow()
+
+        health.record_failure()
+        assert health.state == OPEN
+        assert not health.allow()
+
+    def test_success_resets_failure_count(self, registry):
+        """성공하면 연속 실패 횟수 초기화"""
+        health = registry.get("naver")
+
+        health.record_failure()
+        health.record_success(0.1)
+        health.record_failure()
+
+        assert health.state == CLOSED
+
+    def test_half_open_allows_single_probe(self, registry, clock):
+        """cooldown 이후 프로브 하나만 허용하고 성공 시 회복"""
+        health = registry.get("naver")
+        health.record_failure()
+        health.record_failure()
+
+        clock.now += 61
+        assert health.allow()
+        assert health.state == HALF_OPEN
+        assert not health.allow()
+
+        health.record_success(0.2)
+        assert health.state == CLOSED
+        assert health.allow()
+
+    def test_failed_probe_reopens(self, registry, clock):
+        """프로브 실패 시 다시 open"""
+        health = registry.get("naver")
+        health.record_failure()
+        health.record_failure()
+
+        clock.now += 61
+        assert health.allow()
+        health.record_failure()
+
+        assert health.state == OPEN
+        assert not health.allow()
+
+    def test_adaptive_timeout_from_percentile(self, registry):
+        """표본이 충분하면 분위수 × 배수를 [min_timeout, limit]로 제한"""
+        health = registry.get("naver")
+
+        health.record_success(1.0)
+        assert health.timeout(10.0) is None
+
+        health.record_success(1.0)
+        health.record_success(1.5)
+        assert health.timeout(10.0) == pytest.approx(4.5)
+        assert health.timeout(3.0) == 3.0
+
+        fast = registry.get("google")
+        for _ in range(3):
+            fast.record_success(0.01)
+        assert fast.timeout(10.0) == registry.config.min_timeout
+
+    def test_state_survives_save_and_load(self, registry, clock, tmp_path):
+        """파일 저장 후 다시 로드해도 상태 유지"""
+        path = str(tmp_path / "health.json")
+        saved = SourceHealthRegistry(registry.config, path=path, clock=clock)
+        health = saved.get("naver")
+        health.record_success(0.5)
+        health.record_failure()
+        health.record_failure()
+        saved.save()
+
+        loaded = SourceHealthRegistry(registry.config, path=path, clock=clock)
+
+        assert loaded.get("naver").state == OPEN
+        assert list(loaded.get("naver").latencies) == [0.5]
+        assert not loaded.get("naver").allow()
+
+
+class TestCollectorCircuit:
+    """수집기 서킷 브레이커 연동 테스트"""
+
+    @pytest.fixture
+    def config(self):
+        return NewsConfig(categories={"society": CategoryConfig(enabled=True, max_items=3)})
+
+    @pytest.mark.asyncio
+    async def test_skips_open_source(self, config, registry):
+        """서킷이 열린 소스는 요청하지 않음"""
+        source = StubSource("naver")
+        source.fetch_news = AsyncMock(return_value=[])
+        registry.get("naver").record_failure()
+        registry.get("naver").record_failure()
+
+        collector = NewsCollector(config, health=registry)
+        collector.register_source(source)
+        result = await collector.collect_all()
+
+        assert result["society"] == []
+        source.fetch_news.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_source_requests_feed_health(self, config, registry):
+        """소스의 HTTP 요청 결과가 상태에 기록되고 서킷이 열림"""
+        def handler(request):
+            raise httpx.ConnectError("down", request=request)
+
+        source = GoogleNewsSource()
+        source.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        collector = NewsCollector(config, health=registry)
+        collector.register_source(source)
+
+        await collector.collect_all()
+        await collector.collect_all()
+        health = registry.get("google")
+        assert health.state == OPEN
+
+        await collector.collect_all()
+        assert health.failures == 2  # open 상태에서는 요청하지 않음
+
+        await source.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout_passed_to_requests(self, config, registry):
+        """표본이 쌓이면 요청에 적응형 타임아웃 적용"""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return httpx.Response(200, text="<rss><channel></channel></rss>")
+
+        source = GoogleNewsSource(timeout=10)
+        source.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        health = registry.get("google")
+        for _ in range(3):
+            health.record_success(0.01)
+
+        collector = NewsCollector(config, health=registry)
+        collector.register_source(source)
+        await collector.collect_all()
+
+        assert timeouts == [registry.config.min_timeout]
+
+        await source.client.aclose()
+
+
+class TestHedgedRequests:
+    """hedged 요청 테스트"""
+
+    RSS = "<rss><channel><item><title>뉴스</title><link>https://a.com/1</link></item></channel></rss>"
+
+    def make_source(self, registry, hedge_budget, delays):
+        calls = []
+
+        async def handler(request):
+            delay = delays[min(len(calls), len(delays) - 1)]
+            calls.append(delay)
+            await asyncio.sleep(delay)
+            return httpx.Response(200, text=self.RSS)
+
+        source = GoogleNewsSource(hedge_budget=hedge_budget)
+        source.set_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        health = registry.get("google")
+        for _ in range(3):
+            health.record_success(0.01)
+        source.set_health(health)
+        return source, calls
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged(self, registry):
+        """p90 안에 응답이 없으면 중복 요청의 응답 사용"""
+        source, calls = self.make_source(registry, hedge_budget=1, delays=[5, 0])
+
+        items = await asyncio.wait_for(source.fetch_news("society", 5), timeout=2)
+
+        assert [item.link for item in items] == ["https://a.com/1"]
+        assert calls == [5, 0]
+        assert source.hedges_sent == 1
+        await source.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self, registry):
+        """예산을 다 쓰면 중복 요청을 보내지 않음"""
+        source, calls = self.make_source(registry, hedge_budget=1, delays=[0.05])
+
+        await source.fetch_news("society", 5)
+        await source.fetch_news("society", 5)
+
+        assert source.hedges_sent == 1
+        assert len(calls) == 3
+        await source.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, registry):
+        """hedge_budget=0이면 중복 요청 없음"""
+        source, calls = self.make_source(registry, hedge_budget=0, delays=[0.05])
+
+        await source.fetch_news("society", 5)
+
+        assert calls == [0.05]
+        await source.client.aclose()
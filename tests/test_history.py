@@ -0,0 +1,167 @@
+"""전송 이력 저장소 테스트"""
+
+import pytest
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.history import SeenStore, canonical_link
+from src.config import NewsConfig, CategoryConfig, DedupConfig, HistoryConfig
+
+
+def make_item(link: str, title: str = "뉴스") -> NewsItem:
+    return NewsItem(title=title, link=link, category="society", source="naver")
+
+
+class TestCanonicalLink:
+    """canonical_link 테스트"""
+
+    def test_strips_tracking_params_and_fragment(self):
+        """추적 파라미터와 프래그먼트 제거"""
+        link = "HTTPS://News.Example.com/article/1/?utm_source=tg&id=3#top"
+
+        assert canonical_link(link) == "https://news.example.com/article/1?id=3"
+
+    def test_keeps_article_params(self):
+        """기사 식별 파라미터 유지"""
+        link = "https://n.news.naver.com/mnews/article/001/0001?sid=102"
+
+        assert canonical_link(link) == link
+
+
+class TestSeenStore:
+    """SeenStore 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        with SeenStore(str(tmp_path / "history.db"), retention_days=7) as store:
+            yield store
+
+    def test_uses_wal_mode(self, store):
+        """WAL 저널 모드 사용"""
+        mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_filters_delivered_items(self, store):
+        """전송한 기사 제외"""
+        store.mark_delivered([make_item("https://a.com/1?utm_medium=x")])
+
+        result = store.filter_unseen([
+            make_item("https://a.com/1"),
+            make_item("https://a.com/2"),
+        ])
+
+        assert [item.link for item in result] == ["https://a.com/2"]
+
+    def test_prune_removes_old_entries(self, store):
+        """보관 기간이 지난 이력 삭제"""
+        now = 1_700_000_000
+        store.mark_delivered([make_item("https://a.com/old")], delivered_at=now - 8 * 86400)
+        store.mark_delivered([make_item("https://a.com/new")], delivered_at=now - 86400)
+
+        assert store.prune(now=now) == 1
+        assert len(store.filter_unseen([make_item("https://a.com/old")])) == 1
+        assert store.filter_unseen([make_item("https://a.com/new")]) == []
+
+    def test_disabled_config(self):
+        """비활성화 시 저장소 없음"""
+        assert SeenStore.from_config(HistoryConfig(enabled=False)) is None
+
+
+class TestCollectorWithHistory:
+    """전송 이력을 사용하는 수집기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_by_source_skips_delivered(self, tmp_path):
+        """이미 전송한 기사는 수집 결과에서 제외"""
+        from unittest.mock import AsyncMock
+
+        from tests.test_news import StubSource
+
+        source = StubSource("mock")
+        titles = ["금리 동결", "폭우 피해 확산", "신차 출시", "전력 수요 급증"]
+        source.fetch_news = AsyncMock(return_value=[
+            make_item(f"https://a.com/{i}", title) for i, title in enumerate(titles)
+        ])
+
+        config = NewsConfig(categories={"society": CategoryConfig(max_items=2)})
+
+        with SeenStore(str(tmp_path / "history.db")) as store:
+            store.mark_delivered([make_item("https://a.com/0")])
+            collector = NewsCollector(config, seen_store=store)
+
+            result = await collector.collect_by_source(source)
+
+        assert [item.link for item in result["society"]] == [
+            "https://a.com/1",
+            "https://a.com/2",
+        ]
+        source.fetch_news.assert_awaited_with(category="society", max_items=4)
+
+    @pytest.mark.asyncio
+    async def test_history_lookups_are_batched(self, tmp_path):
+        """전송 이력은 아이템마다가 아니라 남은 수만큼 모은 묶음 단위로 조회"""
+        from unittest.mock import AsyncMock, patch
+
+        from tests.test_news import StubSource
+
+        source = StubSource("mock")
+        source.fetch_news = AsyncMock(return_value=[
+            make_item(f"https://a.com/{i}", f"기사 {i}") for i in range(10)
+        ])
+        config = NewsConfig(
+            categories={"society": CategoryConfig(max_items=2)},
+            dedup=DedupConfig(enabled=False),
+        )
+
+        with SeenStore(str(tmp_path / "history.db")) as store:
+            store.mark_delivered([make_item("https://a.com/1")])
+            collector = NewsCollector(config, seen_store=store)
+            with patch.object(store, "filter_unseen", wraps=store.filter_unseen) as spy:
+                result = await collector.collect_by_source(source, limit=False)
+
+        # 첫 묶음 4개 중 1개 제외 → 남은 1개만 다시 조회
+        assert [item.link for item in result["society"]] == [
+            "https://a.com/0", "https://a.com/2", "https://a.com/3", "https://a.com/4",
+        ]
+        assert [len(call.args[0]) for call in spy.call_args_list] == [4, 1]
+
+
+class TestBriefingWithHistory:
+    """뉴스 브리핑 실행의 전송 이력 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_prune_failure_cleans_up(self, tmp_path, monkeypatch):
+        """이력 정리가 실패해도 예외를 내지 않고 저장소와 HTTP 풀을 닫음"""
+        import sqlite3
+
+        from src.config import Config, HealthConfig, HttpCacheConfig, UrlCacheConfig, ArchiveConfig
+        from src.main import run_news_briefing
+        from src.news.http import HttpClientPool
+
+        def prune(self, now=None):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        closed = []
+        original_aclose = HttpClientPool.aclose
+        original_close = SeenStore.close
+
+        async def aclose(self):
+            closed.append("pool")
+            await original_aclose(self)
+
+        def close(self):
+            closed.append("history")
+            original_close(self)
+
+        monkeypatch.setattr(SeenStore, "prune", prune)
+        monkeypatch.setattr(SeenStore, "close", close)
+        monkeypatch.setattr(HttpClientPool, "aclose", aclose)
+        config = Config(news=NewsConfig(
+            history=HistoryConfig(path=str(tmp_path / "history.db")),
+            http_cache=HttpCacheConfig(path=str(tmp_path / "http_cache.json")),
+            url_cache=UrlCacheConfig(path=str(tmp_path / "url_cache.json")),
+            archive=ArchiveConfig(enabled=False),
+            health=HealthConfig(enabled=False),
+        ))
+
+        assert await run_news_briefing(config=config) is False
+        assert sorted(closed) == ["history", "pool"]
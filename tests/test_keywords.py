@@ -0,0 +1,117 @@
+"""키워드 매칭 / 필터 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.keywords import KeywordAutomaton, CategoryMatcher, category_matcher
+from src.config import NewsConfig, CategoryConfig, load_config
+from tests.test_news import StubSource
+
+
+def make_item(title: str, summary: str = "", link: str = None) -> NewsItem:
+    return NewsItem(
+        title=title,
+        link=link or f"https://a.com/{title}",
+        category="society",
+        source="naver",
+        summary=summary,
+    )
+
+
+class TestKeywordAutomaton:
+    """KeywordAutomaton 테스트"""
+
+    def test_finds_all_keywords_in_one_pass(self):
+        """겹치거나 포함 관계인 키워드도 모두 검색"""
+        automaton = KeywordAutomaton(["he", "she", "his", "hers", "금리", "기준금리"])
+
+        assert automaton.find("ushers") == {"she", "he", "hers"}
+        assert automaton.find("한은 기준금리 동결") == {"금리", "기준금리"}
+        assert automaton.find("관련 없음") == set()
+
+    def test_case_insensitive(self):
+        """영문 대소문자 무시"""
+        automaton = KeywordAutomaton(["AI", "Chip"])
+
+        assert automaton.find("ai 반도체 CHIP 수출") == {"ai", "chip"}
+
+    def test_matches_naive_search(self):
+        """단순 in 검색과 같은 결과"""
+        keywords = ["부동산", "동산", "산업", "업", "전세", "세금", "금리", "리"]
+        text = "부동산 전세 세금 금리 산업 동향 리포트"
+        automaton = KeywordAutomaton(keywords)
+
+        assert automaton.find(text) == {k for k in keywords if k in text}
+
+
+class TestCategoryMatcher:
+    """CategoryMatcher 테스트"""
+
+    def test_reports_hits_per_list(self):
+        """목록별 일치 키워드 보고"""
+        matcher = CategoryMatcher(keywords=["금리"], include=["한은"], exclude=["광고"])
+
+        hits = matcher.match(make_item("한은 금리 동결", "광고 아님"))
+
+        assert hits.keywords == {"금리"}
+        assert hits.include == {"한은"}
+        assert hits.exclude == {"광고"}
+        assert not matcher.accepts(hits)
+
+    def test_include_required_when_present(self):
+        """include가 있으면 하나 이상 일치해야 통과"""
+        matcher = CategoryMatcher(include=["부동산", "전세"])
+
+        assert matcher.accepts(matcher.match(make_item("전세 사기 대책")))
+        assert not matcher.accepts(matcher.match(make_item("주식 시장 동향")))
+
+    def test_config_stays_plain_data(self, tmp_path):
+        """설정 로드는 키워드 목록만 읽고 매처는 수집기가 카테고리별로 한 번 컴파일"""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "news:\n"
+            "  categories:\n"
+            "    society:\n"
+            "      exclude: [\"포토\"]\n"
+            "    economy:\n"
+            "      keywords: [\"금리\"]\n",
+            encoding="utf-8"
+        )
+
+        config = load_config(str(path))
+        collector = NewsCollector(config.news)
+
+        assert config.news.categories["society"].exclude == ["포토"]
+        assert not hasattr(config.news.categories["society"], "matcher")
+        # 랭킹용 keywords만 있는 카테고리는 수집 필터가 없음
+        assert set(collector.matchers) == {"society"}
+        assert isinstance(collector.matchers["society"], CategoryMatcher)
+
+    def test_no_keywords_no_matcher(self):
+        """키워드가 없으면 매처 없음"""
+        assert category_matcher(CategoryConfig()) is None
+
+
+class TestCollectorFilter:
+    """수집기 키워드 필터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_applies_include_exclude(self):
+        """include/exclude로 걸러진 기사 제외"""
+        config = NewsConfig(categories={
+            "society": CategoryConfig(enabled=True, max_items=5,
+                                      include=["정책"], exclude=["포토"]),
+        })
+        source = StubSource("mock")
+        source.fetch_news = AsyncMock(return_value=[
+            make_item("부동산 정책 발표"),
+            make_item("[포토] 정책 현장"),
+            make_item("연예 소식"),
+        ])
+        collector = NewsCollector(config)
+        collector.register_source(source)
+
+        result = await collector.collect_all()
+
+        assert [item.title for item in result["society"]] == ["부동산 정책 발표"]
@@ -0,0 +1,124 @@
+"""힙 기반 top-k 병합 테스트"""
+
+from datetime import datetime
+from itertools import islice
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.merge import iter_top
+from src.config import Config, NewsConfig, CategoryConfig, SourceConfig, validate_config
+from tests.test_news import StubSource
+
+
+def make_item(link: str, source: str, hour: int = 0) -> NewsItem:
+    return NewsItem(
+        title=link,
+        link=f"https://a.com/{link}",
+        category="society",
+        source=source,
+        published_at=datetime(2024, 5, 6, hour),
+    )
+
+
+class TestIterTop:
+    """iter_top 테스트"""
+
+    def test_priority_then_recency(self):
+        """소스 우선순위가 먼저, 같은 우선순위는 최신순"""
+        naver = [make_item("n1", "naver", 1), make_item("n2", "naver", 5)]
+        google = [make_item("g1", "google", 9)]
+
+        ranked = list(iter_top([(1, naver), (2, google)], ["priority", "recency"]))
+
+        assert [item.title for item in ranked] == ["n2", "n1", "g1"]
+
+    def test_recency_first(self):
+        """rank_by 순서 변경"""
+        naver = [make_item("n1", "naver", 1)]
+        google = [make_item("g1", "google", 9)]
+
+        ranked = list(iter_top([(1, naver), (2, google)], ["recency", "priority"]))
+
+        assert [item.title for item in ranked] == ["g1", "n1"]
+
+    def test_corroboration_and_link_dedup(self):
+        """여러 소스가 보도한 기사 우선, 같은 링크는 한 번만"""
+        naver = [make_item("solo", "naver", 9), make_item("both", "naver", 1)]
+        google = [make_item("both", "google", 1)]
+
+        ranked = list(iter_top([(1, naver), (1, google)], ["corroboration", "recency"]))
+
+        assert [item.title for item in ranked] == ["both", "solo"]
+        assert ranked[0].source == "naver"  # 동률이면 먼저 등록된 소스
+
+    def test_lazy_top_k(self):
+        """여러 소스를 병합해 필요한 만큼만 꺼내도 전체 정렬 결과의 앞부분과 같음"""
+        streams = [
+            (1, [make_item(f"{name}{i}", name, (i * 7 + offset) % 24) for i in range(20)])
+            for name, offset in (("naver", 0), ("google", 5), ("daum", 11))
+        ]
+
+        top = list(islice(iter_top(streams, ["recency"]), 5))
+        expected = sorted(
+            (item for _, items in streams for item in items),
+            key=lambda item: -item.published_ts
+        )[:5]
+
+        assert [item.published_ts for item in top] == [item.published_ts for item in expected]
+
+    def test_undated_naver_items_with_default_rank_by(self):
+        """기본 rank_by는 우선순위가 먼저라 발행 시각 없는(ts 0) 네이버 목록 기사도 구글보다 앞"""
+        naver = [
+            NewsItem(title="목록", link="https://a.com/list", category="society", source="naver:언론사"),
+            make_item("search", "naver", 3),
+        ]
+        google = [make_item("g1", "google/언론사", 9), make_item("g2", "google/언론사", 8)]
+        streams = [(1, naver), (2, google)]
+
+        ranked = list(iter_top(streams))
+        recency_first = list(iter_top(streams, ["recency", "priority"]))
+
+        # 같은 소스 안에서는 발행 시각 없는 기사가 맨 뒤
+        assert [item.title for item in ranked] == ["search", "목록", "g1", "g2"]
+        # 최신순이 먼저면 발행 시각 없는 기사는 모든 소스의 마지막
+        assert [item.title for item in recency_first] == ["g1", "g2", "search", "목록"]
+
+
+class TestCollectorRanking:
+    """수집기 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collect_all_honors_source_priority(self):
+        """SourceConfig.priority가 낮은 소스 우선"""
+        config = NewsConfig(
+            categories={"society": CategoryConfig(enabled=True, max_items=2)},
+            sources={
+                "naver": SourceConfig(enabled=True, priority=2),
+                "google": SourceConfig(enabled=True, priority=1),
+            },
+        )
+        collector = NewsCollector(config)
+        for name, hour in (("naver", 9), ("google", 1)):
+            source = StubSource(name)
+            source.fetch_news = AsyncMock(return_value=[
+                make_item(f"{name}{i}", name, hour) for i in range(3)
+            ])
+            collector.register_source(source)
+
+        result = await collector.collect_all()
+
+        assert [item.source for item in result["society"]] == ["google", "google"]
+
+    def test_invalid_rank_by_reported(self):
+        """알 수 없는 정렬 키는 설정 오류"""
+        config = Config()
+        config.telegram.bot_token = "token"
+        config.telegram.chat_id = "1"
+        config.news.categories = {"society": CategoryConfig()}
+        config.news.rank_by = ["priority", "popularity"]
+
+        errors = validate_config(config)
+
+        assert any("popularity" in error for error in errors)
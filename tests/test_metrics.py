@@ -0,0 +1,187 @@
+"""Prometheus 지표 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from src import metrics
+from src.config import CategoryConfig, DedupConfig, MetricsConfig, NewsConfig, ScheduleConfig, SourceConfig
+from src.metrics import Counter, Gauge, Histogram, MetricsRegistry, MetricsServer
+from src.news.collector import NewsCollector, NewsItem
+from src.news.sources import NaverNewsSource
+from src.scheduler import NewsScheduler
+from tests.test_news import StubSource, naver_list_page
+
+
+class TestExposition:
+    """텍스트 노출 형식 테스트"""
+
+    def test_counter_and_gauge(self):
+        """레이블별 값과 HELP/TYPE 줄"""
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("items_total", "아이템 수", ("source",)))
+        gauge = registry.register(Gauge("next_run", "다음 실행"))
+        counter.inc(3, source="naver")
+        counter.inc(source='go"ogle')
+        gauge.set_function(lambda: 1714953600.0)
+
+        text = registry.render()
+
+        assert "# TYPE items_total counter" in text
+        assert 'items_total{source="naver"} 3' in text
+        assert 'items_total{source="go\\"ogle"} 1' in text
+        assert "next_run 1714953600" in text
+
+    def test_gauge_function_none_omitted(self):
+        """함수가 None을 반환하면 값 생략"""
+        gauge = Gauge("next_run", "다음 실행")
+        gauge.set_function(lambda: None)
+
+        assert gauge.render().splitlines()[-1] == "# TYPE next_run gauge"
+
+    def test_histogram_buckets_are_cumulative(self):
+        """구간 개수는 누적, 경계값은 해당 구간에 포함"""
+        histogram = Histogram("latency_seconds", "지연", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        lines = histogram.render().splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 3.65" in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_label_mismatch(self):
+        """정의와 다른 레이블은 거부"""
+        with pytest.raises(ValueError):
+            Counter("x_total", "x", ("source",)).inc(category="society")
+
+
+class TestInstrumentation:
+    """수집기/스케줄러 지표 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_collector_records_fetch(self):
+        """수집 시간, 아이템 수, 바이트 수 기록"""
+        page = naver_list_page(5)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=page)
+        ))
+        source = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+        collector = NewsCollector(
+            NewsConfig(categories={"society": CategoryConfig(enabled=True, max_items=3)})
+        )
+        collector.register_source(source)
+
+        fetched = metrics.ITEMS_FETCHED.value(source="naver")
+        downloaded = metrics.BYTES_DOWNLOADED.value(source="naver")
+        observed = metrics.FETCH_DURATION.count(source="naver")
+
+        await collector.collect_by_source(source)
+        await client.aclose()
+
+        assert metrics.ITEMS_FETCHED.value(source="naver") == fetched + 5
+        assert metrics.BYTES_DOWNLOADED.value(source="naver") == downloaded + len(page.encode("utf-8"))
+        assert metrics.FETCH_DURATION.count(source="naver") == observed + 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_duration_excludes_semaphore_wait(self, monkeypatch):
+        """세마포어 대기 시간은 수집 시간에 포함하지 않음"""
+        observed = []
+
+        class Recorder:
+            def observe(self, value, **labels):
+                observed.append(value)
+
+        monkeypatch.setattr("src.news.collector.FETCH_DURATION", Recorder())
+
+        async def slow_fetch(category=None, max_items=10):
+            await asyncio.sleep(0.1)
+            return []
+
+        source = StubSource("naver")
+        source.fetch_news = slow_fetch
+        collector = NewsCollector(NewsConfig(
+            categories={
+                "society": CategoryConfig(enabled=True),
+                "economy": CategoryConfig(enabled=True),
+            },
+            sources={"naver": SourceConfig(max_concurrency=1)},
+        ))
+        collector.register_source(source)
+
+        await collector.collect_all()
+
+        # 두 요청이 차례로 실행되어도 각각 자기 수집 시간만 기록
+        assert len(observed) == 2
+        assert max(observed) < 0.18
+
+    @pytest.mark.asyncio
+    async def test_merge_records_deduplicated(self):
+        """소스를 합쳐 병합할 때도 유사 기사 제거 수를 소스별로 기록"""
+        def item(source, link):
+            return NewsItem(
+                title="한은 기준금리 동결 결정", link=link,
+                category="economy", source=source,
+            )
+
+        naver = StubSource("naver")
+        naver.fetch_news = AsyncMock(return_value=[item("naver:연합뉴스", "https://a.com/1")])
+        google = StubSource("google")
+        google.fetch_news = AsyncMock(return_value=[item("google/연합뉴스", "https://b.com/1")])
+        collector = NewsCollector(NewsConfig(
+            categories={"economy": CategoryConfig(enabled=True)},
+            sources={"naver": SourceConfig(priority=1), "google": SourceConfig(priority=2)},
+            dedup=DedupConfig(enabled=True),
+        ))
+        collector.register_source(naver)
+        collector.register_source(google)
+        deduplicated = metrics.ITEMS_DEDUPLICATED.value(source="google")
+
+        result = await collector.collect_all()
+
+        assert [news.source for news in result["economy"]] == ["naver:연합뉴스"]
+        assert metrics.ITEMS_DEDUPLICATED.value(source="google") == deduplicated + 1
+
+    @pytest.mark.asyncio
+    async def test_scheduler_job_records_duration(self):
+        """작업 실행 시간과 결과 기록"""
+        scheduler = NewsScheduler(ScheduleConfig())
+
+        async def job():
+            return False
+
+        scheduler.set_job(job)
+        runs = metrics.JOB_RUNS.value(result="failure")
+        observed = metrics.JOB_DURATION.count()
+
+        await scheduler._run_job()
+
+        assert metrics.JOB_RUNS.value(result="failure") == runs + 1
+        assert metrics.JOB_DURATION.count() == observed + 1
+
+
+class TestMetricsServer:
+    """MetricsServer 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_serves_registry(self):
+        """/metrics에서 텍스트 형식 지표 제공"""
+        registry = MetricsRegistry()
+        registry.register(Counter("up_total", "테스트")).inc()
+        server = MetricsServer(MetricsConfig(enabled=True, port=0), registry=registry)
+
+        await server.start()
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"http://127.0.0.1:{server.port}/metrics")
+        finally:
+            await server.stop()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "up_total 1" in response.text
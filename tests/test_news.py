@@ -1,15 +1,29 @@
 """뉴스 모듈 테스트"""
 
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, patch, MagicMock
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
 
 from src.news.collector import NewsItem, NewsCollector
 from src.news.formatter import NewsFormatter
-from src.news.sources import NaverNewsSource, GoogleNewsSource
+from src.news.http import HttpClientPool
+from src.news.sources import NaverNewsSource, GoogleNewsSource, BaseNewsSource
 from src.config import NewsConfig, CategoryConfig, SourceConfig
 
 
+class StubSource(BaseNewsSource):
+    """네트워크 없이 fetch_news를 테스트에서 바꿔 끼우는 소스"""
+
+    def __init__(self, name: str = "mock"):
+        super().__init__()
+        self.name = name
+
+    async def fetch_news(self, category: str, max_items: int) -> list[NewsItem]:
+        return []
+
+
 class TestNewsItem:
     """NewsItem 테스트"""
 
@@ -55,6 +69,47 @@ class TestNewsItem:
         unique = list(set(items))
         assert len(unique) == 2
 
+    def test_published_at_normalized_to_utc(self):
+        """naive/aware 발행 시각을 UTC로 정규화하고 epoch 정렬 키 계산"""
+        from datetime import timedelta
+
+        naive = NewsItem("a", "https://a.com/1", "society", "google",
+                         published_at=datetime(2024, 5, 6, 0, 0))
+        aware = NewsItem("b", "https://a.com/2", "society", "naver",
+                         published_at=datetime(2024, 5, 6, 9, 0, tzinfo=timezone(timedelta(hours=9))))
+        missing = NewsItem("c", "https://a.com/3", "society", "naver")
+
+        assert naive.published_at == aware.published_at
+        assert naive.published_at.tzinfo == timezone.utc
+        assert naive.published_ts == aware.published_ts == 1714953600
+        assert missing.published_ts == 0
+
+    @pytest.mark.asyncio
+    async def test_collect_all_sorts_mixed_timestamps(self):
+        """naive/aware가 섞인 소스 결과를 오류 없이 최신순 정렬"""
+        from datetime import timedelta
+
+        kst = timezone(timedelta(hours=9))
+        google = StubSource("google")
+        google.fetch_news = AsyncMock(return_value=[
+            NewsItem("구글", "https://g.com/1", "society", "google",
+                     published_at=datetime(2024, 5, 6, 1, 0)),
+        ])
+        naver = StubSource("naver")
+        naver.fetch_news = AsyncMock(return_value=[
+            NewsItem("네이버", "https://n.com/1", "society", "naver",
+                     published_at=datetime(2024, 5, 6, 9, 30, tzinfo=kst)),
+            NewsItem("시각 없음", "https://n.com/2", "society", "naver"),
+        ])
+        config = NewsConfig(categories={"society": CategoryConfig(enabled=True, max_items=3)})
+        collector = NewsCollector(config)
+        collector.register_source(google)
+        collector.register_source(naver)
+
+        result = await collector.collect_all()
+
+        assert [item.title for item in result["society"]] == ["구글", "네이버", "시각 없음"]
+
 
 class TestNewsFormatter:
     """NewsFormatter 테스트"""
@@ -129,8 +184,7 @@ class TestNewsCollector:
 
     @pytest.fixture
     def mock_source(self):
-        source = MagicMock()
-        source.name = "mock"
+        source = StubSource("mock")
         source.fetch_news = AsyncMock(return_value=[
             NewsItem(
                 title="Mock 뉴스 1",
@@ -174,6 +228,150 @@ class TestNewsCollector:
 
         assert len(result["society"]) == 3  # max_items=3
 
+    @pytest.mark.asyncio
+    async def test_collect_all_runs_fetches_concurrently(self, config):
+        """(소스, 카테고리) 요청 동시 실행 및 소스별 동시 요청 제한"""
+        import asyncio
+
+        config.sources["slow"] = SourceConfig(enabled=True, max_concurrency=1)
+        in_flight = {"fast": 0, "slow": 0}
+        peak = {"fast": 0, "slow": 0}
+
+        def make_source(name):
+            async def fetch_news(category, max_items):
+                in_flight[name] += 1
+                peak[name] = max(peak[name], in_flight[name])
+                await asyncio.sleep(0.01)
+                in_flight[name] -= 1
+                return [NewsItem(title=f"{name} {category}",
+                                 link=f"https://{name}.com/{category}",
+                                 category=category, source=name)]
+
+            source = StubSource(name)
+            source.fetch_news = fetch_news
+            return source
+
+        collector = NewsCollector(config)
+        collector.register_source(make_source("fast"))
+        collector.register_source(make_source("slow"))
+
+        result = await collector.collect_all()
+
+        assert peak["fast"] == 2
+        assert peak["slow"] == 1
+        assert len(result["society"]) == 2
+        assert len(result["economy"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_all_keeps_partial_results(self, config, mock_source):
+        """일부 소스 실패 시에도 나머지 결과 병합"""
+        failing = StubSource("failing")
+        failing.fetch_news = AsyncMock(side_effect=RuntimeError("boom"))
+
+        collector = NewsCollector(config)
+        collector.register_source(failing)
+        collector.register_source(mock_source)
+
+        result = await collector.collect_all()
+
+        assert len(result["society"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_all_consumes_stream_news(self, config):
+        """stream_news 제공 소스는 스트림으로 읽고 max_items에서 중단"""
+        produced = []
+
+        class StreamingSource:
+            name = "stream"
+
+            async def stream_news(self, category, max_items):
+                for i in range(100):
+                    produced.append(i)
+                    yield NewsItem(title=f"스트림 {category} {i}",
+                                   link=f"https://stream.com/{category}/{i}",
+                                   category=category, source="stream")
+
+        collector = NewsCollector(config)
+        collector.register_source(StreamingSource())
+
+        result = await collector.collect_all()
+
+        assert len(result["society"]) == 3
+        # 카테고리별 max_items * 2 개만 소비하고 생성기를 닫음
+        assert len(produced) == 12
+
+    @pytest.mark.asyncio
+    async def test_early_stop_cancels_slow_sources(self, config):
+        """early_stop이면 카테고리 목표 달성 후 느린 소스를 기다리지 않음"""
+        import asyncio
+
+        config.early_stop = True
+        cancelled = []
+
+        class FastSource:
+            name = "fast"
+
+            async def stream_news(self, category, max_items):
+                for i in range(max_items):
+                    yield NewsItem(title=f"빠른 {category} {i}",
+                                   link=f"https://fast.com/{category}/{i}",
+                                   category=category, source="fast")
+
+        class SlowSource:
+            name = "slow"
+
+            async def stream_news(self, category, max_items):
+                try:
+                    await asyncio.sleep(10)
+                    yield NewsItem(title="느린", link="https://slow.com/",
+                                   category=category, source="slow")
+                except asyncio.CancelledError:
+                    cancelled.append(category)
+                    raise
+
+        collector = NewsCollector(config)
+        collector.register_source(FastSource())
+        collector.register_source(SlowSource())
+
+        result = await asyncio.wait_for(collector.collect_all(), timeout=2)
+
+        assert len(result["society"]) == 3
+        assert all(item.source == "fast" for item in result["economy"])
+        assert sorted(cancelled) == ["economy", "society"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_closes_source_streams(self, config):
+        """collect_all 태스크가 취소되면 진행 중인 소스 스트림도 취소"""
+        import asyncio
+
+        started = asyncio.Event()
+        cancelled = []
+
+        class HangingSource:
+            name = "hanging"
+
+            async def stream_news(self, category, max_items):
+                try:
+                    started.set()
+                    await asyncio.sleep(10)
+                    yield NewsItem(title="늦음", link="https://late.com/",
+                                   category=category, source="hanging")
+                except asyncio.CancelledError:
+                    cancelled.append(category)
+                    raise
+
+        collector = NewsCollector(config)
+        collector.register_source(HangingSource())
+
+        task = asyncio.ensure_future(collector.collect_all())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == ["economy", "society"]
+
 
 class TestNaverNewsSource:
     """NaverNewsSource 테스트"""
@@ -194,6 +392,308 @@ class TestNaverNewsSource:
         assert result == []
 
 
+def naver_list_page(count: int, start: int = 0) -> str:
+    """네이버 뉴스 목록 페이지 형태의 HTML 생성"""
+    def article(i):
+        link = f"https://n.news.naver.com/mnews/article/001/{i:010d}"
+        return (
+            f'<li><dl><dt class="photo"><a href="{link}"><img src="x.jpg"></a></dt>'
+            f'<dt><a href="{link}">기사 제목 {i}</a></dt>'
+            f'<dd><span class="lede">기사 요약 {i}</span>'
+            f'<span class="writing">언론사{i}</span></dd></dl></li>'
+        )
+
+    half = start + count // 2
+    return (
+        "<html><head><title>목록</title></head><body>"
+        '<div id="header"><ul class="gnb"><li><a href="/">홈</a></li></ul></div>'
+        '<div class="list_body newsflash_body">'
+        '<ul class="type06_headline">' + "".join(article(i) for i in range(start, half)) + "</ul>"
+        '<ul class="type06">' + "".join(article(i) for i in range(half, start + count)) + "</ul>"
+        '</div><div class="paging"><a href="?page=2">2</a></div>'
+        '<div id="footer"><ul><li>푸터</li></ul></div>'
+        "</body></html>"
+    )
+
+
+class TestNaverListParsing:
+    """NaverNewsSource 목록 파싱 테스트"""
+
+    @pytest.mark.parametrize("parser", ["html.parser", "auto"])
+    def test_parse_list(self, parser):
+        """목록 영역 파싱 및 max_items에서 중단"""
+        source = NaverNewsSource(parser=parser)
+
+        items = source._parse_list(naver_list_page(20), "society", 12)
+
+        assert len(items) == 12
+        assert items[0].title == "기사 제목 0"
+        assert items[0].source == "naver:언론사0"
+        assert items[11].link.endswith("0000000011")
+
+    def test_extract_region(self):
+        """헤더/푸터를 제외한 목록 영역만 추출"""
+        region = NaverNewsSource._extract_region(naver_list_page(4))
+
+        assert region.startswith('<ul class="type06_headline">')
+        assert "footer" not in region
+        assert "gnb" not in region
+
+    @staticmethod
+    def make_paged_source(last_page: int, max_pages: int):
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            # 마지막 페이지 이후로는 마지막 페이지를 반복
+            page = min(page, last_page)
+            return httpx.Response(200, text=naver_list_page(20, start=(page - 1) * 20))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return NaverNewsSource(client=client, parser="html.parser", max_pages=max_pages), requested
+
+    @pytest.mark.asyncio
+    async def test_fetches_pages_to_fill_quota(self):
+        """개수를 채울 만큼의 페이지를 동시에 요청"""
+        source, requested = self.make_paged_source(last_page=10, max_pages=5)
+
+        items = await source.fetch_news("society", 50)
+
+        assert sorted(requested) == [1, 2, 3]
+        assert len(items) == 50
+        assert len({item.link for item in items}) == 50
+
+    @pytest.mark.asyncio
+    async def test_stops_on_repeated_page(self):
+        """이미 본 기사만 있는 페이지에서 중단"""
+        source, requested = self.make_paged_source(last_page=2, max_pages=10)
+
+        items = await source.fetch_news("society", 100)
+
+        assert len(items) == 40
+        assert max(requested) == 5
+
+    @pytest.mark.asyncio
+    async def test_single_page_when_quota_small(self):
+        """첫 페이지로 충분하면 한 페이지만 요청"""
+        source, requested = self.make_paged_source(last_page=10, max_pages=5)
+
+        items = await source.fetch_news("society", 10)
+
+        assert requested == [1]
+        assert len(items) == 10
+
+    def test_unknown_parser_falls_back(self):
+        """알 수 없는 파서는 html.parser로 대체"""
+        assert NaverNewsSource(parser="unknown").parser == "html.parser"
+
+    @pytest.mark.asyncio
+    async def test_truncates_oversized_body(self, caplog):
+        """max_bytes를 넘는 본문은 잘라서 파싱하고 경고"""
+        page = naver_list_page(20)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=page)
+        ))
+        limit = len(page.encode("utf-8")) // 2
+        source = NaverNewsSource(client=client, parser="html.parser", max_pages=1, max_bytes=limit)
+
+        items = await source.fetch_news("society", 20)
+
+        assert 0 < len(items) < 20
+        assert source.bytes_received == limit
+        assert "크기 제한" in caplog.text
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_collector_records_bytes_per_fetch(self, caplog):
+        """수집기가 (소스, 카테고리)별 받은 바이트 수를 기록"""
+        import logging
+
+        page = naver_list_page(5)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=page)
+        ))
+        source = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+        config = NewsConfig(categories={"society": CategoryConfig(enabled=True, max_items=3)})
+        collector = NewsCollector(config)
+        collector.register_source(source)
+
+        with caplog.at_level(logging.INFO):
+            await collector.collect_all()
+
+        size_kb = len(page.encode("utf-8")) / 1024
+        assert f"naver/society: 5개 수집 ({size_kb:.1f}KB)" in caplog.text
+        await client.aclose()
+
+
+def google_rss(count: int) -> str:
+    """구글 뉴스 RSS 형태의 XML 생성"""
+    items = "".join(
+        f"<item><title>구글 기사 {i} - 언론사{i}</title>"
+        f"<link>https://news.google.com/rss/articles/{i}</link>"
+        f"<pubDate>Mon, 06 May 2024 0{i % 10}:00:00 GMT</pubDate>"
+        f"<description>&lt;a href=\"https://a.com/{i}\"&gt;구글 기사 {i}&lt;/a&gt;&amp;nbsp;"
+        f"&lt;font color=\"#6f6f6f\"&gt;언론사{i}&lt;/font&gt;</description>"
+        f"<source url=\"https://a.com\">언론사{i}</source></item>"
+        for i in range(count)
+    )
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>"
+        "<rss version='2.0'><channel><title>Google News</title>"
+        f"{items}</channel></rss>"
+    )
+
+
+class TestGoogleFeedParsing:
+    """GoogleNewsSource RSS 파싱 테스트"""
+
+    @staticmethod
+    def make_source(body: bytes, chunk_size: int = 64) -> GoogleNewsSource:
+        class ChunkedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for i in range(0, len(body), chunk_size):
+                    yield body[i:i + chunk_size]
+
+        def handler(request):
+            return httpx.Response(200, stream=ChunkedStream())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return GoogleNewsSource(client=client)
+
+    @pytest.mark.asyncio
+    async def test_stream_fast_path(self):
+        """스트리밍 파싱으로 필요한 필드만 추출"""
+        source = self.make_source(google_rss(3).encode())
+
+        items = await source.fetch_news("economy", 5)
+
+        assert [item.title for item in items] == ["구글 기사 0", "구글 기사 1", "구글 기사 2"]
+        assert items[1].source == "google/언론사1"
+        assert items[1].summary == "구글 기사 1\xa0언론사1"
+        assert items[1].published_at == datetime(2024, 5, 6, 1, 0, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_feedparser(self):
+        """고속 경로와 feedparser 경로의 결과 동일"""
+        body = google_rss(10)
+        source = self.make_source(body.encode())
+
+        fast = await source.fetch_news("world", 10)
+        slow = source._parse_feed(body, "world", 10)
+
+        assert [i.to_dict() for i in fast] == [i.to_dict() for i in slow]
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_after_max_items(self):
+        """max_items를 채우면 파싱 중단"""
+        source = self.make_source(google_rss(100).encode())
+
+        with patch.object(source, "_parse_element", wraps=source._parse_element) as parse:
+            items = await source.fetch_news("economy", 2)
+
+        assert len(items) == 2
+        assert parse.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_feed_falls_back(self):
+        """깨진 XML은 feedparser로 파싱"""
+        body = google_rss(3).replace("</channel>", "<br></channel>").encode()
+        source = self.make_source(body)
+
+        items = await source.fetch_news("economy", 5)
+
+        assert len(items) == 3
+        assert items[0].title == "구글 기사 0"
+
+
+class TestGoogleUrlResolver:
+    """구글 리다이렉트 링크 일괄 변환 테스트"""
+
+    @staticmethod
+    def make_source(cache=None, concurrency=2):
+        import asyncio
+
+        state = {"requests": 0, "in_flight": 0, "peak": 0}
+
+        async def handler(request):
+            if request.url.host == "news.google.com":
+                state["requests"] += 1
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                article_id = request.url.path.rsplit("/", 1)[-1]
+                return httpx.Response(302, headers={"Location": f"https://press.com/{article_id}"})
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        source = GoogleNewsSource(
+            client=client,
+            resolve_concurrency=concurrency,
+            url_cache=cache
+        )
+        return source, state
+
+    @pytest.mark.asyncio
+    async def test_resolves_concurrently_with_limit(self):
+        """세마포어 한도 내에서 동시 변환"""
+        source, state = self.make_source(concurrency=2)
+        urls = [f"https://news.google.com/rss/articles/{i}" for i in range(6)]
+
+        result = await source.resolve_google_urls(urls + urls[:2])
+
+        assert result[urls[3]] == "https://press.com/3"
+        assert state["requests"] == 6
+        assert state["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_runs(self, tmp_path):
+        """변환 결과를 캐시에 저장하여 다음 실행에서 재사용"""
+        from src.news.cache import UrlResolutionCache
+
+        path = str(tmp_path / "url_cache.json")
+        urls = [f"https://news.google.com/rss/articles/{i}" for i in range(3)]
+
+        cache = UrlResolutionCache(path, ttl_seconds=3600, max_entries=100)
+        source, _ = self.make_source(cache)
+        await source.resolve_google_urls(urls)
+        cache.save()
+
+        source, state = self.make_source(UrlResolutionCache(path, ttl_seconds=3600, max_entries=100))
+        result = await source.resolve_google_urls(urls + ["https://press.com/direct"])
+
+        assert state["requests"] == 0
+        assert result == {url: f"https://press.com/{i}" for i, url in enumerate(urls)}
+
+    @pytest.mark.asyncio
+    async def test_failed_resolution_not_cached(self):
+        """오류 응답이나 구글 뉴스에 머문 링크는 변환 실패로 보고 캐시하지 않음"""
+        from src.news.cache import UrlResolutionCache
+
+        def handler(request):
+            if request.url.host == "news.google.com":
+                article_id = request.url.path.rsplit("/", 1)[-1]
+                if article_id == "consent":
+                    return httpx.Response(200)
+                return httpx.Response(302, headers={"Location": f"https://press.com/{article_id}"})
+            if request.url.path == "/gone":
+                return httpx.Response(404)
+            return httpx.Response(200)
+
+        cache = UrlResolutionCache(None, ttl_seconds=3600, max_entries=100)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        source = GoogleNewsSource(client=client, url_cache=cache)
+        urls = [f"https://news.google.com/rss/articles/{i}" for i in ("ok", "gone", "consent")]
+
+        result = await source.resolve_google_urls(urls)
+        await client.aclose()
+
+        assert result == {urls[0]: "https://press.com/ok"}
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[2]) is None
+
+
 class TestGoogleNewsSource:
     """GoogleNewsSource 테스트"""
 
@@ -211,3 +711,134 @@ class TestGoogleNewsSource:
         result = await source.fetch_news("unknown_category", 5)
 
         assert result == []
+
+
+class TestHttpClientPool:
+    """HttpClientPool 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_source(self):
+        """소스별 클라이언트 재사용"""
+        pool = HttpClientPool({"naver": SourceConfig(max_connections=3)})
+
+        client = pool.get("naver")
+        assert pool.get("naver") is client
+        assert pool.get("google") is not client
+
+        await pool.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_source_uses_injected_client(self):
+        """주입된 공유 클라이언트로 요청"""
+        rss = (
+            "<?xml version='1.0' encoding='UTF-8'?><rss><channel>"
+            "<item><title>기사 제목 - 한국일보</title><link>https://news.google.com/a</link>"
+            "<description>&lt;b&gt;요약&lt;/b&gt;</description></item>"
+            "</channel></rss>"
+        )
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text=rss)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        source = GoogleNewsSource(client=client)
+
+        items = await source.fetch_news("economy", 5)
+        await source.fetch_news("world", 5)
+
+        assert len(requests) == 2
+        assert items[0].title == "기사 제목"
+        assert items[0].source == "google/한국일보"
+        assert not client.is_closed
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_collector_injects_pool_client(self):
+        """수집기가 등록된 소스에 풀 클라이언트 주입"""
+        pool = HttpClientPool()
+        collector = NewsCollector(NewsConfig(), http_pool=pool)
+        source = NaverNewsSource()
+
+        collector.register_source(source)
+
+        assert source.client is pool.get("naver")
+        await pool.aclose()
+
+
+class TestHttpValidatorCache:
+    """HttpValidatorCache 테스트"""
+
+    RSS = (
+        "<?xml version='1.0' encoding='UTF-8'?><rss><channel>"
+        "<item><title>캐시 기사 - 매일경제</title><link>https://news.google.com/c</link></item>"
+        "</channel></rss>"
+    )
+
+    @pytest.mark.asyncio
+    async def test_reuses_items_on_not_modified(self, tmp_path):
+        """304 응답 시 저장된 목록 재사용"""
+        from src.news.cache import HttpValidatorCache
+
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=self.RSS, headers={"ETag": '"v1"'})
+
+        path = tmp_path / "http_cache.json"
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        source = GoogleNewsSource(client=client)
+        source.set_cache(HttpValidatorCache(str(path), ttl_seconds=3600, max_entries=10))
+
+        first = await source.fetch_news("economy", 5)
+        source.cache.save()
+
+        # 디스크에서 다시 로드한 캐시로 재요청
+        source.set_cache(HttpValidatorCache(str(path), ttl_seconds=3600, max_entries=10))
+        second = await source.fetch_news("economy", 5)
+
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert [i.title for i in second] == [i.title for i in first] == ["캐시 기사"]
+        await client.aclose()
+
+    def test_entry_without_rows_is_miss(self):
+        """행 목록(rows)이 없는 항목은 캐시 미스로 취급"""
+        from src.news.cache import HttpValidatorCache
+
+        cache = HttpValidatorCache(None, ttl_seconds=3600, max_entries=10)
+        cache.set("https://a.com/rss", {
+            "etag": '"v1"',
+            "last_modified": None,
+            "max_items": 5,
+            "items": [{"title": "기사", "link": "https://a.com/1",
+                       "category": "economy", "source": "google"}],
+        })
+
+        assert cache.conditional_headers("https://a.com/rss", 5) == {}
+        assert cache.cached_items("https://a.com/rss", 5) is None
+
+    def test_ttl_and_size_eviction(self, monkeypatch):
+        """TTL 만료 및 크기 제한 제거"""
+        from src.news import cache as cache_module
+        from src.news.cache import PersistentLRUCache
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+        cache = PersistentLRUCache(None, ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1   # a를 최근 사용으로 갱신
+        cache.set("c", 3)            # 가장 오래된 b 제거
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        now[0] += 61
+        assert cache.get("c") is None
@@ -0,0 +1,89 @@
+"""단계별 시간 측정 테스트"""
+
+import pstats
+import time
+
+import httpx
+import pytest
+
+from src import profiling
+from src.config import CategoryConfig, NewsConfig
+from src.news.collector import NewsCollector
+from src.news.sources import NaverNewsSource
+from src.profiling import Profiler, stage
+from tests.test_news import naver_list_page
+
+
+class TestStage:
+    """stage() 테스트"""
+
+    def test_disabled_is_shared_noop(self):
+        """프로파일러가 없으면 같은 빈 컨텍스트 반환"""
+        assert stage("a") is stage("b")
+        with stage("a"):
+            pass
+
+    def test_accumulates_by_name(self):
+        """같은 이름의 구간은 호출 수와 시간을 누적"""
+        profiler = Profiler()
+        with profiler.activate():
+            for _ in range(3):
+                with stage("sleep"):
+                    time.sleep(0.001)
+            with stage("busy"):
+                sum(range(10000))
+
+        assert profiling._active is None
+        assert profiler.stages["sleep"].calls == 3
+        assert profiler.stages["sleep"].wall >= 0.003
+        assert profiler.stages["busy"].calls == 1
+        assert profiler.wall >= profiler.stages["sleep"].wall
+
+        report = profiler.report()
+        assert "sleep" in report
+        assert "busy" in report
+
+    def test_writes_pstats_and_collapsed(self, tmp_path):
+        """cProfile 덤프와 collapsed 스택 파일 저장"""
+        pstats_path = tmp_path / "run.prof"
+        collapsed_path = tmp_path / "run.collapsed"
+        profiler = Profiler(
+            pstats_path=str(pstats_path),
+            collapsed_path=str(collapsed_path),
+            sample_interval=0.001,
+        )
+
+        with profiler.activate():
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+
+        assert pstats.Stats(str(pstats_path)).total_calls > 0
+        lines = collapsed_path.read_text(encoding="utf-8").splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+
+class TestCollectorStages:
+    """수집기 단계 측정 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_parse_dedup_stages(self):
+        """(소스, 카테고리)별 수집, 파싱, 중복 제거 구간 기록"""
+        page = naver_list_page(5)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=page)
+        ))
+        source = NaverNewsSource(client=client, parser="html.parser", max_pages=1)
+        collector = NewsCollector(
+            NewsConfig(categories={"society": CategoryConfig(enabled=True, max_items=3)})
+        )
+        collector.register_source(source)
+
+        profiler = Profiler()
+        with profiler.activate():
+            await collector.collect_all()
+        await client.aclose()
+
+        assert {"fetch naver/society", "parse naver/society", "dedup society"} <= set(profiler.stages)
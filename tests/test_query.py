@@ -0,0 +1,147 @@
+"""키워드 쿼리 계획 테스트"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.news.collector import NewsItem, NewsCollector
+from src.news.query import QueryPlanner, RateLimiter, SearchQuery, merge_ranked
+from src.news.sources import NaverSearchNewsSource, GoogleNewsSource
+from src.config import NewsConfig, CategoryConfig
+
+
+def make_item(link: str) -> NewsItem:
+    return NewsItem(title=link, link=link, category="economy", source="test")
+
+
+class TestQueryPlanner:
+    """QueryPlanner 테스트"""
+
+    def test_one_query_per_keyword(self):
+        """키워드별 요청 하나 (중복/공백 키워드 제거)"""
+        queries = QueryPlanner(page_size=100).plan(["금리", "환율", "금리", " "], 10)
+
+        assert queries == [SearchQuery("금리", 1, 10), SearchQuery("환율", 1, 10)]
+
+    def test_paginates_with_start(self):
+        """page_size를 넘으면 start로 페이지 분할"""
+        queries = QueryPlanner(page_size=100, max_start=1000).plan(["반도체"], 250)
+
+        assert [(q.start, q.display) for q in queries] == [(1, 100), (101, 100), (201, 50)]
+
+    def test_respects_max_start(self):
+        """API start 제한을 넘는 페이지는 요청하지 않음"""
+        queries = QueryPlanner(page_size=100, max_start=101).plan(["반도체"], 500)
+
+        assert [q.start for q in queries] == [1, 101]
+
+
+class TestMergeRanked:
+    """merge_ranked 테스트"""
+
+    def test_prefers_items_found_by_many_queries(self):
+        """여러 키워드에서 검색된 기사를 우선"""
+        results = [
+            [make_item("a"), make_item("b"), make_item("c")],
+            [make_item("d"), make_item("c")],
+        ]
+
+        merged = merge_ranked(results, 3)
+
+        assert [item.link for item in merged] == ["c", "a", "d"]
+
+    def test_later_pages_rank_after_first_page(self):
+        """페이지로 나눈 결과는 start 위치 기준 순위 사용"""
+        queries = QueryPlanner(page_size=2).plan(["반도체", "환율"], 4)
+        pages = {
+            ("반도체", 1): ["a1", "a2"],
+            ("반도체", 3): ["a3", "a4"],
+            ("환율", 1): ["b1", "b2"],
+            ("환율", 3): ["b3", "b4"],
+        }
+        results = [[make_item(link) for link in pages[(q.keyword, q.start)]] for q in queries]
+
+        merged = merge_ranked(results, 4, starts=[q.start for q in queries])
+
+        assert [item.link for item in merged] == ["a1", "b1", "a2", "b2"]
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_throttles_requests(self):
+        """초당 요청 수 제한"""
+        limiter = RateLimiter(rate=50, burst=1)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_unlimited(self):
+        """rate가 0이면 대기 없음"""
+        limiter = RateLimiter(rate=0)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(100)))
+
+        assert time.monotonic() - started < 0.05
+
+
+class TestKeywordFanOut:
+    """카테고리 키워드 기반 검색 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_naver_search_fans_out_keywords(self):
+        """네이버 검색 API에 키워드별 요청 후 병합"""
+        requests = []
+
+        def handler(request):
+            requests.append(dict(request.url.params))
+            keyword = request.url.params["query"]
+            items = [
+                {"title": f"<b>{keyword}</b> 기사 {i}", "originallink": f"https://a.com/{keyword}/{i}",
+                 "description": "요약", "pubDate": "Mon, 06 May 2024 09:00:00 +0900"}
+                for i in range(3)
+            ]
+            items.append({"title": "공통 기사", "originallink": "https://a.com/common",
+                          "description": "", "pubDate": ""})
+            return httpx.Response(200, json={"items": items})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        source = NaverSearchNewsSource("id", "secret", client=client, rate_limit=0)
+        source.set_keywords({"economy": ["금리", "환율"]})
+
+        items = await source.fetch_news("economy", 5)
+
+        assert sorted(r["query"] for r in requests) == ["금리", "환율"]
+        assert all(r["start"] == "1" and r["display"] == "5" for r in requests)
+        assert items[0].link == "https://a.com/common"
+        assert len(items) == 5
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_collector_passes_category_keywords(self):
+        """수집기가 CategoryConfig.keywords를 구글 검색으로 전달"""
+        queries = []
+
+        def handler(request):
+            queries.append(request.url.params["q"])
+            return httpx.Response(200, text="<rss><channel></channel></rss>")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        config = NewsConfig(categories={
+            "economy": CategoryConfig(keywords=["금리", "부동산"]),
+            "society": CategoryConfig(),
+        })
+        collector = NewsCollector(config)
+        collector.register_source(GoogleNewsSource(client=client))
+
+        await collector.collect_all()
+
+        assert sorted(queries) == ["금리", "부동산", "사회 뉴스"]
+        await client.aclose()
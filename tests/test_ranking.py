@@ -0,0 +1,146 @@
+"""기사 선정 점수 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.news.collector import NewsItem
+from src.news.dedup import NearDuplicateDetector
+from src.news.ranking import NewsRanker
+from src.config import NewsConfig, CategoryConfig, SourceConfig, RankingConfig
+
+
+NOW = datetime(2024, 5, 6, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def make_item(link: str, source: str = "naver", hour: int = None, title: str = None) -> NewsItem:
+    return NewsItem(
+        title=title or f"기사 {link}",
+        link=f"https://a.com/{link}",
+        category="society",
+        source=source,
+        published_at=datetime(2024, 5, 6, hour, tzinfo=timezone.utc) if hour is not None else None,
+    )
+
+
+@pytest.fixture
+def config():
+    return NewsConfig(
+        categories={"society": CategoryConfig(enabled=True, max_items=2, keywords=["금리"])},
+        sources={
+            "naver": SourceConfig(enabled=True, priority=1),
+            "google": SourceConfig(enabled=True, priority=2),
+        },
+        ranking=RankingConfig(half_life_hours=6),
+    )
+
+
+class TestNewsRanker:
+    """NewsRanker 테스트"""
+
+    def test_recency_decay(self, config):
+        """최신 기사가 높은 점수, 반감기마다 절반"""
+        ranker = NewsRanker(config)
+        items = [make_item("old", hour=0), make_item("new", hour=12), make_item("mid", hour=6)]
+
+        scores = ranker.score(items, "society", now=NOW)
+
+        recency = [s - 0.3 for s in scores]  # priority 1 → 0.3
+        assert recency[1] == pytest.approx(1.0)
+        assert recency[2] == pytest.approx(0.5)
+        assert recency[0] == pytest.approx(0.25)
+
+    def test_undated_items_get_neutral_recency(self, config):
+        """발행 시각이 없는 소스도 발행 시각이 있는 소스와 함께 경쟁"""
+        ranker = NewsRanker(config)
+        items = [
+            make_item("g-new", source="google/연합뉴스", hour=12),
+            make_item("g-mid", source="google/한겨레", hour=6),
+            make_item("g-old", source="google/조선일보", hour=0),
+            make_item("naver", source="naver:연합뉴스"),
+        ]
+
+        scores = ranker.score(items, "society", now=NOW)
+        ranked = ranker.rank({"society": items}, now=NOW)
+
+        # 발행 시각 없음 → 배치 중앙값(0.5) + 우선순위 1
+        assert scores[3] == pytest.approx(0.5 + 0.3)
+        assert [item.link for item in ranked["society"]] == [
+            "https://a.com/g-new", "https://a.com/naver"
+        ]
+
+    def test_keyword_and_priority(self, config):
+        """키워드 일치와 소스 우선순위 반영"""
+        ranker = NewsRanker(config)
+        items = [
+            make_item("plain", source="google"),
+            make_item("priority", source="naver"),
+            make_item("keyword", source="google", title="기준금리 동결"),
+        ]
+
+        ranked = ranker.rank({"society": items}, now=NOW)
+
+        assert [item.link for item in ranked["society"]] == [
+            "https://a.com/keyword", "https://a.com/priority"
+        ]
+
+    def test_corroboration_across_sources(self, config):
+        """여러 소스가 보도한 기사 우선"""
+        ranker = NewsRanker(config)
+        candidates = {
+            "naver": {"society": [make_item("solo", hour=12), make_item("shared", hour=6)]},
+            "google": {"society": [make_item("shared", source="google/연합뉴스", hour=6)]},
+        }
+
+        counts = ranker.corroboration(candidates)
+        ranked = ranker.rank(candidates["naver"], counts, now=NOW)
+
+        assert counts["https://a.com/shared"] == 2
+        assert ranked["society"][0].link == "https://a.com/shared"
+
+    def test_outlet_suffix_uses_source_priority(self, config):
+        """"naver:언론사", "google/언론사" 아이템은 수집 소스의 우선순위 사용"""
+        ranker = NewsRanker(config)
+        items = [
+            make_item("n", source="naver:연합뉴스"),
+            make_item("g", source="google/연합뉴스"),
+            make_item("g2", source="google"),
+        ]
+
+        scores = ranker.score(items, "society", now=NOW)
+
+        # priority_weight 0.3 x (1 → 1.0, 2 → 0.5)
+        assert scores == pytest.approx([0.3, 0.15, 0.15])
+
+    def test_same_source_outlets_are_not_corroboration(self, config):
+        """같은 소스의 다른 언론사는 교차 보도로 세지 않음"""
+        ranker = NewsRanker(config)
+        candidates = {
+            "google": {"society": [
+                make_item("shared", source="google/연합뉴스"),
+                make_item("shared", source="google/뉴시스"),
+            ]},
+        }
+
+        counts = ranker.corroboration(candidates)
+
+        assert counts["https://a.com/shared"] == 1
+
+    def test_corroboration_groups_near_duplicates(self, config):
+        """유사 기사 탐지기가 있으면 다른 URL의 같은 기사도 교차 보도로 계산"""
+        ranker = NewsRanker(config, detector=NearDuplicateDetector())
+        candidates = {
+            "naver": {"society": [make_item("n1", title="한국은행 기준금리 3.5% 동결 결정")]},
+            "google": {"society": [make_item("g1", source="google",
+                                             title="[속보] 한국은행 기준금리 3.5% 동결 결정")]},
+        }
+
+        counts = ranker.corroboration(candidates)
+
+        assert counts["https://a.com/n1"] == counts["https://a.com/g1"] == 2
+
+    def test_disabled(self, config):
+        """비활성화 시 None"""
+        config.ranking.enabled = False
+
+        assert NewsRanker.from_config(config) is None
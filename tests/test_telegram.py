@@ -0,0 +1,96 @@
+"""텔레그램 전송 및 로컬 대역 서버 테스트"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config import TelegramConfig
+from src.telegram import TelegramSender
+from src.telegram.stub import StubBehavior, TelegramStubServer
+
+
+def make_sender(server: TelegramStubServer) -> TelegramSender:
+    return TelegramSender(TelegramConfig(
+        bot_token="123:test",
+        chat_id="42",
+        base_url=server.base_url,
+    ))
+
+
+class TestTelegramStub:
+    """TelegramStubServer를 대상으로 한 TelegramSender 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_me_and_send(self):
+        """base_url로 대역 서버에 연결하여 전송"""
+        async with TelegramStubServer() as server:
+            sender = make_sender(server)
+
+            assert await sender.test_connection()
+            assert await sender.send_with_retry("안녕하세요")
+
+        assert server.stats.messages == 1
+        assert server.stats.by_chat["42"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self):
+        """429 응답의 retry_after만큼 기다린 뒤 재시도"""
+        behavior = StubBehavior(per_chat_limit=1)
+        # 시계를 멈춰 두어 두 번째 메시지부터는 항상 1초 안의 재전송
+        async with TelegramStubServer(behavior, clock=lambda: 0.0) as server:
+            sender = make_sender(server)
+            assert await sender.send_with_retry("첫 메시지")
+
+            with patch("src.telegram.sender.asyncio.sleep", new=AsyncMock()) as sleep:
+                result = await sender.send_with_retry("두 번째 메시지", max_retries=2)
+
+        assert result is False
+        assert server.stats.throttled == 2
+        assert sender.throttled == 2
+        sleep.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_use_backoff(self):
+        """주입된 오류는 지수 백오프로 재시도"""
+        behavior = StubBehavior(error_rate=1.0, error_code=500)
+        async with TelegramStubServer(behavior) as server:
+            sender = make_sender(server)
+            with patch("src.telegram.sender.asyncio.sleep", new=AsyncMock()) as sleep:
+                assert not await sender.send_with_retry("메시지", max_retries=3)
+
+        assert server.stats.errors == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_bad_request_fails_fast(self):
+        """재시도해도 같은 결과인 오류(400)는 바로 실패"""
+        behavior = StubBehavior(error_rate=1.0, error_code=400)
+        async with TelegramStubServer(behavior) as server:
+            sender = make_sender(server)
+            with patch("src.telegram.sender.asyncio.sleep", new=AsyncMock()) as sleep:
+                assert not await sender.send_with_retry("메시지", max_retries=3)
+
+        assert server.stats.errors == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_random_throttle_retry_after_at_least_one(self):
+        """retry_after=0으로 설정해도 429 응답은 최소 1초를 알림"""
+        behavior = StubBehavior(throttle_rate=1.0, retry_after=0)
+        async with TelegramStubServer(behavior) as server:
+            sender = make_sender(server)
+            with patch("src.telegram.sender.asyncio.sleep", new=AsyncMock()) as sleep:
+                assert not await sender.send_with_retry("메시지", max_retries=2)
+
+        assert server.stats.throttled == 2
+        sleep.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_missing_chat_id(self):
+        """chat_id가 없으면 요청하지 않음"""
+        async with TelegramStubServer() as server:
+            sender = TelegramSender(TelegramConfig(bot_token="123:test", base_url=server.base_url))
+
+            assert not await sender.send_with_retry("메시지")
+
+        assert server.stats.requests == 0